@@ -0,0 +1,125 @@
+import argparse
+import tracemalloc
+from typing import Any, Callable, List
+
+from models.diagnosis import Diagnosis
+from models.diagnosisFrame import DiagnosisFrame
+from models.patient import Patient
+from models.patientFrame import PatientFrame
+
+labels: List[str] = ["No dehydration", "Some dehydration", "Severe dehydration"]
+
+
+class DictPatient:
+    """
+    Patient as it was stored before __slots__, with a per-instance __dict__, for comparison.
+    """
+
+    def __init__(self, name: str, age: int, gender: str, height: int, weight: int, patientID: int) -> None:
+        self.patientID = patientID
+        self.name = name
+        self.age = age
+        self.gender = gender
+        self.height = height
+        self.weight = weight
+
+
+class DictDiagnosis:
+    """
+    Diagnosis as it was stored before __slots__, with a per-instance __dict__ and a label string per row, for comparison.
+    """
+
+    def __init__(self, diagnosis: str, patientID: int, diagnosisID: int) -> None:
+        self.diagnosisID = diagnosisID
+        self.patientID = patientID
+        self.diagnosis = diagnosis
+
+
+def patientRow(i: int) -> tuple[Any, ...]:
+    """
+    Synthetic patient row i, as read from the patient table.
+    """
+    return (i, f"Patient {i}", 20 + i % 60, "MF"[i % 2], 55 + i % 20, 100 + i % 150)
+
+def diagnosisRow(i: int) -> tuple[Any, ...]:
+    """
+    Synthetic diagnosis row i, as read from the diagnosis table. The label is a new string per row, as a database driver decodes it.
+    """
+    return (i, i // 2, "".join(labels[i % 3]))
+
+def patientOf(patientClass: Callable[..., Any], row: tuple[Any, ...]) -> Any:
+    """
+    Build a patient object from a patient row.
+
+    Parameters:
+        patientClass (```Callable```[..., ```Any```]): Patient or DictPatient.
+        row (```tuple```[```Any```, ...]): patient_id, name, age, gender, height, weight.
+
+    Returns:
+        (```Any```): New patient object.
+    """
+    patientID, name, age, gender, height, weight = row
+    return patientClass(name=name, age=age, gender=gender, height=height, weight=weight, patientID=patientID)
+
+def diagnosisOf(diagnosisClass: Callable[..., Any], row: tuple[Any, ...]) -> Any:
+    """
+    Build a diagnosis object from a diagnosis row.
+
+    Parameters:
+        diagnosisClass (```Callable```[..., ```Any```]): Diagnosis or DictDiagnosis.
+        row (```tuple```[```Any```, ...]): diagnosis_id, patient_id, diagnosis.
+
+    Returns:
+        (```Any```): New diagnosis object.
+    """
+    diagnosisID, patientID, label = row
+    return diagnosisClass(diagnosis=label, patientID=patientID, diagnosisID=diagnosisID)
+
+def measure(build: Callable[[], Any]) -> int:
+    """
+    Measure memory allocated and still held by what build() returns.
+
+    Parameters:
+        build (```Callable```[[], ```Any```]): Function building the collection.
+
+    Returns:
+        (```int```): Bytes held.
+    """
+    tracemalloc.start()
+    held: Any = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return current
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Compare memory of patient/diagnosis objects with and without __slots__ and of the columnar frames.")
+    parser.add_argument("--rows", type=int, default=100000, help="Rows per collection. Default is 100000.")
+    args: argparse.Namespace = parser.parse_args()
+    rows: int = args.rows
+
+    def patientFrame() -> PatientFrame:
+        frame: PatientFrame = PatientFrame()
+        for i in range(rows):
+            frame.appendRow(patientRow(i))
+        return frame
+
+    def diagnosisFrame() -> DiagnosisFrame:
+        frame: DiagnosisFrame = DiagnosisFrame()
+        for i in range(rows):
+            frame.appendRow(diagnosisRow(i))
+        return frame
+
+    results: List[tuple[str, int]] = [
+        ("Patient with __dict__", measure(lambda: [patientOf(DictPatient, patientRow(i)) for i in range(rows)])),
+        ("Patient with __slots__", measure(lambda: [patientOf(Patient, patientRow(i)) for i in range(rows)])),
+        ("PatientFrame", measure(patientFrame)),
+        ("Diagnosis with __dict__", measure(lambda: [diagnosisOf(DictDiagnosis, diagnosisRow(i)) for i in range(rows)])),
+        ("Diagnosis with __slots__", measure(lambda: [diagnosisOf(Diagnosis, diagnosisRow(i)) for i in range(rows)])),
+        ("DiagnosisFrame", measure(diagnosisFrame)),
+    ]
+    for name, size in results:
+        print(f"{name:<26} {size / rows:8.1f} bytes/row  {size / 2 ** 20:8.2f} MiB")
+
+if __name__ == "__main__":
+    main()
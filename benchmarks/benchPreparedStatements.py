@@ -0,0 +1,77 @@
+import argparse
+import time
+from typing import Callable, List
+
+from dao.diagnosisDAO import DiagnosisDAO
+from dao.patientDAO import PatientDAO
+from dao.statementRegistry import statements
+from models.diagnosis import Diagnosis, DiagnosisLevel
+from models.patient import Patient
+from utils import connectionUtil
+
+def timeCalls(call: Callable[[], object], calls: int) -> List[float]:
+    """
+    Time calls to a function one after another.
+
+    Parameters:
+        call (```Callable```[[], ```object```]): Function to call.
+        calls (```int```): Number of calls.
+
+    Returns:
+        (```List```[```float```]): Sorted latency of every call, in seconds.
+    """
+    latencies: List[float] = []
+    for _ in range(calls):
+        start: float = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies
+
+def report(label: str, latencies: List[float]) -> None:
+    """
+    Print mean, p50 and p99 latency of a run in microseconds.
+
+    Parameters:
+        label (```str```): Name of the run.
+        latencies (```List```[```float```]): Sorted latencies in seconds.
+    """
+    mean: float = sum(latencies) / len(latencies)
+    p50: float = latencies[len(latencies) // 2]
+    p99: float = latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))]
+    print(f"{label:<32} mean {mean * 1e6:8.1f} us   p50 {p50 * 1e6:8.1f} us   p99 {p99 * 1e6:8.1f} us")
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Per-call latency of PatientDAO.getPatientByID and DiagnosisDAO.addDignosis with and without prepared statements.")
+    parser.add_argument("--calls", type=int, default=2000, help="Calls timed per run. Default is 2000.")
+    args: argparse.Namespace = parser.parse_args()
+
+    patientDAO: PatientDAO = PatientDAO()
+    diagnosisDAO: DiagnosisDAO = DiagnosisDAO()
+    patient: Patient | None = patientDAO.addPatient(Patient("Benchmark", 40, "F", 65, 140))
+    if patient is None:
+        print("Could not create benchmark patient")
+        return
+
+    diagnosisIDs: List[int] = []
+    def addDiagnosis() -> None:
+        diagnosis: Diagnosis | None = diagnosisDAO.addDignosis(Diagnosis(DiagnosisLevel.NO_DEHYDRATION, patient.patientID))
+        if diagnosis is not None:
+            diagnosisIDs.append(diagnosis.diagnosisID)
+
+    try:
+        for prepare in (False, True):
+            statements.prepare = prepare
+            mode: str = "prepared" if prepare else "unprepared"
+            timeCalls(lambda: patientDAO.getPatientByID(patient.patientID), 50)
+            report(f"getPatientByID ({mode})", timeCalls(lambda: patientDAO.getPatientByID(patient.patientID), args.calls))
+            report(f"addDignosis ({mode})", timeCalls(addDiagnosis, args.calls))
+    finally:
+        statements.prepare = True
+        for diagnosisID in diagnosisIDs:
+            diagnosisDAO.deleteDiagnosis(diagnosisID)
+        patientDAO.deletePatient(patient.patientID)
+        connectionUtil.closePool()
+
+if __name__ == "__main__":
+    main()
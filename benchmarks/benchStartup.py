@@ -0,0 +1,83 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+# Run in a fresh interpreter per sample, so every sample is a cold start.
+probe: str = """
+import json, sys, time
+start = time.perf_counter()
+from bots.medicalBot import MedicalBot
+imported = time.perf_counter()
+bot = MedicalBot()
+constructed = time.perf_counter()
+driverLoaded = "psycopg" in sys.modules
+modulesLoaded = len(sys.modules)
+bot.patientService.getPatientByID(1)
+looked = time.perf_counter()
+print(json.dumps({
+    "importBot": imported - start,
+    "constructBot": constructed - imported,
+    "firstLookup": looked - constructed,
+    "psycopgLoaded": driverLoaded,
+    "modulesLoaded": modulesLoaded,
+}))
+"""
+
+def sample(directory: str, storage: str | None) -> Dict[str, Any]:
+    """
+    Start a new interpreter, import and construct the bot, and do one patient lookup.
+
+    Parameters:
+        directory (```str```): Project directory to run in.
+        storage (```str | None```): Storage backend to run on (MEDBOT_STORAGE), or None for the configured one.
+
+    Returns:
+        (```Dict```[```str```, ```Any```]): Seconds spent importing, constructing and on the first lookup, whole process time, and whether psycopg and how many modules were loaded before the lookup.
+    """
+    environment: Dict[str, str] = dict(os.environ)
+    if storage is not None:
+        environment["MEDBOT_STORAGE"] = storage
+    start: float = time.perf_counter()
+    result: subprocess.CompletedProcess = subprocess.run([sys.executable, "-c", probe], cwd=directory, env=environment, capture_output=True, text=True, check=True)
+    process: float = time.perf_counter() - start
+    timings: Dict[str, Any] = json.loads(result.stdout.strip().splitlines()[-1])
+    timings["process"] = process
+    return timings
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Measure cold-start time of the bot: importing it, constructing MedicalBot and the first patient lookup, each in a new interpreter.")
+    parser.add_argument("--runs", type=int, default=10, help="Cold starts measured. Default is 10.")
+    parser.add_argument("--storage", default=None, help="Storage backend to run on (postgres, sqlite or memory). Default is the configured one.")
+    parser.add_argument("--directory", default=".", help="Project directory to start the bot in, e.g. a checkout of another revision to compare with. Default is the current directory.")
+    parser.add_argument("--output", default="-", help="File to write the JSON results to, or - for stdout. Default is -.")
+    args: argparse.Namespace = parser.parse_args()
+
+    samples: List[Dict[str, Any]] = [sample(args.directory, args.storage) for _ in range(args.runs)]
+    summary: Dict[str, Any] = {}
+    for stage in ("importBot", "constructBot", "firstLookup", "process"):
+        values: List[float] = sorted(s[stage] for s in samples)
+        summary[stage] = {"meanMs": round(sum(values) / len(values) * 1e3, 2), "p50Ms": round(values[len(values) // 2] * 1e3, 2), "minMs": round(values[0] * 1e3, 2)}
+    summary["psycopgLoadedBeforeLookup"] = samples[0]["psycopgLoaded"]
+    summary["modulesLoadedBeforeLookup"] = samples[0]["modulesLoaded"]
+
+    report: Dict[str, Any] = {
+        "directory": os.path.abspath(args.directory),
+        "storage": args.storage,
+        "runs": args.runs,
+        "summary": summary,
+        "samples": samples,
+    }
+    if args.output == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        for stage in ("importBot", "constructBot", "firstLookup", "process"):
+            print(f"{stage:<14} mean {summary[stage]['meanMs']:8.2f} ms   p50 {summary[stage]['p50Ms']:8.2f} ms   min {summary[stage]['minMs']:8.2f} ms")
+
+if __name__ == "__main__":
+    main()
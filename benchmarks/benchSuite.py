@@ -0,0 +1,208 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterator, List
+from unittest import mock
+
+from bots.decisionTree import DecisionTree
+from bots.medicalBot import MedicalBot
+from dao.storage import DiagnosisStorage, PatientStorage
+from dao.storageFactory import StorageFactory
+from models.diagnosis import Diagnosis, DiagnosisLevel
+from models.patient import Patient
+from services.diagnosisService import DiagnosisService
+from services.patientService import PatientService
+
+# Every path through the questionnaire: appearance, then eyes or skin.
+answerSets: List[List[str]] = [["1", "1"], ["1", "2"], ["2", "1"], ["2", "2"]]
+
+
+def timeCalls(call: Callable[[int], object], calls: int) -> List[float]:
+    """
+    Time calls to a function one after another.
+
+    Parameters:
+        call (```Callable```[[```int```], ```object```]): Function to call, given the call number.
+        calls (```int```): Number of calls.
+
+    Returns:
+        (```List```[```float```]): Sorted latency of every call, in seconds.
+    """
+    latencies: List[float] = []
+    for i in range(calls):
+        start: float = time.perf_counter()
+        call(i)
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """
+    Summarize the latencies of a run.
+
+    Parameters:
+        latencies (```List```[```float```]): Sorted latencies in seconds.
+
+    Returns:
+        (```Dict```[```str```, ```float```]): calls, meanUs, p50Us, p99Us, maxUs and opsPerSec.
+    """
+    total: float = sum(latencies)
+    return {
+        "calls": len(latencies),
+        "meanUs": round(total / len(latencies) * 1e6, 2),
+        "p50Us": round(latencies[len(latencies) // 2] * 1e6, 2),
+        "p99Us": round(latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))] * 1e6, 2),
+        "maxUs": round(latencies[-1] * 1e6, 2),
+        "opsPerSec": round(len(latencies) / total, 1) if total > 0 else 0.0,
+    }
+
+def seed(patientDAO: PatientStorage, diagnosisDAO: DiagnosisStorage, size: int, rng: random.Random) -> List[int]:
+    """
+    Fill an empty database with synthetic patients, each with one to three diagnoses.
+
+    Parameters:
+        patientDAO (```PatientStorage```): Patient DAO of the database.
+        diagnosisDAO (```DiagnosisStorage```): Diagnosis DAO of the database.
+        size (```int```): Number of patients.
+        rng (```random.Random```): Seeded random generator, so every run stores the same data.
+
+    Returns:
+        (```List```[```int```]): IDs of the patients.
+    """
+    patients: List[Patient] = [Patient(f"Patient {i}", 1 + i % 90, "MF"[i % 2], 40 + i % 40, 20 + i % 200) for i in range(size)]
+    patientDAO.addPatients(patients)
+    levels: List[DiagnosisLevel] = list(DiagnosisLevel)
+    diagnosisDAO.addDiagnoses([Diagnosis(rng.choice(levels), patient.patientID) for patient in patients for _ in range(rng.randint(1, 3))])
+    return [patient.patientID for patient in patients]
+
+def benchDataset(backend: str, size: int, calls: int, scans: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """
+    Time the DAO and service hot paths on a new database of one backend and size.
+
+    Parameters:
+        backend (```str```): Storage backend, memory or sqlite.
+        size (```int```): Number of patients stored before timing.
+        calls (```int```): Calls timed for single-row operations.
+        scans (```int```): Calls timed for whole-table operations.
+        rng (```random.Random```): Seeded random generator.
+
+    Returns:
+        (```List```[```Dict```[```str```, ```Any```]]): One result per benchmark.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        factory: StorageFactory = StorageFactory(backend, os.path.join(directory, "bench.sqlite3"))
+        patientDAO: PatientStorage = factory.getPatientDAO()
+        diagnosisDAO: DiagnosisStorage = factory.getDiagnosisDAO()
+        patientIDs: List[int] = seed(patientDAO, diagnosisDAO, size, rng)
+        patientService: PatientService = PatientService(patientDAO)
+        bot: MedicalBot = MedicalBot(patientService, DiagnosisService(diagnosisDAO, patientService=patientService))
+        lookups: List[int] = [rng.choice(patientIDs) for _ in range(calls)]
+
+        benchmarks: Dict[str, tuple[Callable[[int], object], int]] = {
+            "dao.getPatientByID": (lambda i: patientDAO.getPatientByID(lookups[i]), calls),
+            "service.getPatientByID": (lambda i: patientService.getPatientByID(lookups[i]), calls),
+            "dao.getDiagnosesByPatientID": (lambda i: diagnosisDAO.getDiagnosesByPatientID(lookups[i]), calls),
+            "dao.getAllPatients": (lambda i: patientDAO.getAllPatients(), scans),
+            "bot.savePatientAndDiagnosis.new": (lambda i: bot.savePatientAndDiagnosis(Patient(f"New {i}", 30, "F", 60, 120), Diagnosis(DiagnosisLevel.SOME_DEHYDRATION)), calls),
+            "bot.savePatientAndDiagnosis.returning": (lambda i: bot.savePatientAndDiagnosis(patientService.getPatientByID(lookups[i]), Diagnosis(DiagnosisLevel.NO_DEHYDRATION)), calls),
+            "bot.listPatientsAndDiagnoses": (lambda i: bot.listPatientsAndDiagnoses(), scans),
+        }
+
+        results: List[Dict[str, Any]] = []
+        # The bot prints every saved and listed patient, and asks before each page; answer n to list every page.
+        with contextlib.redirect_stdout(io.StringIO()) as output, mock.patch("builtins.input", return_value="n"):
+            for name, (call, count) in benchmarks.items():
+                output.seek(0)
+                output.truncate()
+                results.append({"backend": backend, "size": size, "benchmark": name, **summarize(timeCalls(call, count))})
+        factory.close()
+    return results
+
+def benchAssessment(questionnaire: DecisionTree, calls: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """
+    Time the dehydration assessment, which does not depend on the stored data.
+
+    Parameters:
+        questionnaire (```DecisionTree```): Compiled questionnaire.
+        calls (```int```): Calls timed.
+        rng (```random.Random```): Seeded random generator.
+
+    Returns:
+        (```List```[```Dict```[```str```, ```Any```]]): One result per benchmark.
+    """
+    answers: List[List[str]] = [rng.choice(answerSets) for _ in range(calls)]
+
+    def run(i: int) -> str:
+        scripted: Iterator[str] = iter(answers[i])
+        return questionnaire.run(lambda prompt: next(scripted))
+
+    benchmarks: Dict[str, Callable[[int], object]] = {
+        "assessment.evaluate": lambda i: questionnaire.evaluate(answers[i]),
+        "assessment.run": run,
+    }
+    results: List[Dict[str, Any]] = [{"backend": None, "size": None, "benchmark": name, **summarize(timeCalls(call, calls))} for name, call in benchmarks.items()]
+
+    try:
+        import numpy as np
+        from bots.batchDiagnosis import BatchDiagnoser
+    except ImportError:
+        return results
+    diagnoser: BatchDiagnoser = BatchDiagnoser(questionnaire)
+    # The follow-up answer goes to eyes or skin, whichever appearance leads to; the other column is ignored.
+    columns: Dict[str, Any] = {
+        "appearance": np.array([int(answer[0]) for answer in answers]),
+        "eyes": np.array([int(answer[1]) for answer in answers]),
+        "skin": np.array([int(answer[1]) for answer in answers]),
+    }
+    latencies: List[float] = timeCalls(lambda i: diagnoser.diagnose(columns), 10)
+    # Report the batch as per-record cost, comparable with the rows above.
+    result: Dict[str, Any] = summarize([latency / calls for latency in latencies])
+    result["calls"] = calls * len(latencies)
+    results.append({"backend": None, "size": None, "benchmark": "assessment.batchDiagnose", **result})
+    return results
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Time DAO, service and questionnaire hot paths at several dataset sizes on local storage backends and write the results as JSON.")
+    parser.add_argument("--sizes", default="100,1000,10000", help="Comma separated numbers of patients to store before timing. Default is 100,1000,10000.")
+    parser.add_argument("--backends", default="memory,sqlite", help="Comma separated storage backends: memory, sqlite. Default is both.")
+    parser.add_argument("--calls", type=int, default=1000, help="Calls timed for single-row operations and assessment. Default is 1000.")
+    parser.add_argument("--scans", type=int, default=5, help="Calls timed for whole-table operations. Default is 5.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for data and lookups. Default is 42.")
+    parser.add_argument("--output", default="-", help="File to write the JSON results to, or - for stdout. Default is -.")
+    args: argparse.Namespace = parser.parse_args()
+
+    backends: List[str] = [backend.strip() for backend in args.backends.split(",")]
+    for backend in backends:
+        if backend not in ("memory", "sqlite"):
+            parser.error(f"unsupported backend {backend}, expected memory or sqlite")
+    sizes: List[int] = [int(size) for size in args.sizes.split(",")]
+    rng: random.Random = random.Random(args.seed)
+
+    results: List[Dict[str, Any]] = benchAssessment(DecisionTree.load(), args.calls, rng)
+    for backend in backends:
+        for size in sizes:
+            results.extend(benchDataset(backend, size, args.calls, args.scans, rng))
+
+    report: Dict[str, Any] = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {"sizes": sizes, "backends": backends, "calls": args.calls, "scans": args.scans, "seed": args.seed},
+        "results": results,
+    }
+    if args.output == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+        for result in results:
+            print(f"{result['benchmark']:<40} {result['backend'] or '':<7} {result['size'] or '':>7} mean {result['meanUs']:10.1f} us   p50 {result['p50Us']:10.1f} us   p99 {result['p99Us']:10.1f} us")
+
+if __name__ == "__main__":
+    main()
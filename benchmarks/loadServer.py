@@ -0,0 +1,86 @@
+import argparse
+import asyncio
+import time
+from typing import List
+
+promptMarker: bytes = b"> "
+
+async def runSession(host: str, port: int, answers: List[str], latencies: List[float]) -> None:
+    """
+    Run one scripted questionnaire session against the server, recording the latency of every answer.
+
+    Parameters:
+        host (```str```): Server address.
+        port (```int```): Server port.
+        answers (```List```[```str```]): Answers to send, one per prompt.
+        latencies (```List```[```float```]): List to append each answer's round-trip latency (seconds) to.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        await reader.readuntil(promptMarker)
+        for answer in answers:
+            start: float = time.perf_counter()
+            writer.write(answer.encode() + b"\n")
+            await writer.drain()
+            await reader.readuntil(promptMarker)
+            latencies.append(time.perf_counter() - start)
+        writer.write(b"q\n")
+        await writer.drain()
+    finally:
+        writer.close()
+
+async def runClient(host: str, port: int, sessions: int, answers: List[str], latencies: List[float]) -> None:
+    """
+    Run sessions one after another, like one clinician.
+
+    Parameters:
+        host (```str```): Server address.
+        port (```int```): Server port.
+        sessions (```int```): Number of sessions to run.
+        answers (```List```[```str```]): Answers to send in every session.
+        latencies (```List```[```float```]): List to append answer latencies to.
+    """
+    for _ in range(sessions):
+        await runSession(host, port, answers, latencies)
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Nearest-rank percentile.
+
+    Parameters:
+        values (```List```[```float```]): Sorted values.
+        fraction (```float```): Percentile as a fraction, such as 0.99.
+
+    Returns:
+        (```float```): The percentile value, or 0 if there are no values.
+    """
+    if len(values) == 0:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+async def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Load test server.py with concurrent scripted questionnaire sessions and report sessions/sec and answer latency.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=50, help="Concurrent clinicians. Default is 50.")
+    parser.add_argument("--sessions", type=int, default=20, help="Sessions run by each clinician. Default is 20.")
+    parser.add_argument("--patient-id", type=int, default=None, help="Diagnose this returning patient in every session. Default creates a new patient per session.")
+    args: argparse.Namespace = parser.parse_args()
+
+    if args.patient_id is None:
+        answers: List[str] = ["1", "Load Test", "40", "F", "65", "140", "1", "1"]
+    else:
+        answers = ["2", str(args.patient_id), "2", "1"]
+
+    latencies: List[float] = []
+    start: float = time.perf_counter()
+    await asyncio.gather(*(runClient(args.host, args.port, args.sessions, answers, latencies) for _ in range(args.clients)))
+    elapsed: float = time.perf_counter() - start
+
+    latencies.sort()
+    totalSessions: int = args.clients * args.sessions
+    print(f"sessions: {totalSessions} in {elapsed:.2f}s ({totalSessions / elapsed:.1f} sessions/sec)")
+    print(f"answer latency: p50 {percentile(latencies, 0.50) * 1000:.1f} ms, p99 {percentile(latencies, 0.99) * 1000:.1f} ms, max {latencies[-1] * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,135 @@
+from typing import Any, ClassVar, Dict, List, Mapping
+
+import numpy as np
+
+from bots.decisionTree import DecisionTree, getQuestionnaire
+from models.diagnosis import DiagnosisLevel
+
+
+class BatchDiagnoser:
+    """
+    Diagnose many questionnaire answer sets at once, such as triage answers from intake kiosks.
+    The decision tree is compiled into a transition matrix with one row per question and one column per answer code, and a batch is diagnosed by stepping every answer set
+    down the tree together, one vectorized lookup per level. The work per batch grows with the depth of the tree, and the matrix with the number of questions, so adding a question stays cheap.
+
+    Answers are integer codes (the questionnaire's answers are "1", "2", ...). A code that is not an answer to its question gives no diagnosis if that question is asked, and is ignored if it is not.
+    Diagnoses are returned as DiagnosisLevel codes, as stored in the diagnosis table, with 0 for no diagnosis.
+
+    Attributes:
+        (```class```) maxAnswerCode (```int```): Largest answer code supported, which bounds the width of the transition matrix.
+        questionnaire (```DecisionTree```): Questionnaire the rules come from.
+        columns (```List```[```str```]): Question names, in transition matrix row order.
+        transitions (```np.ndarray```): Next question of every question and answer code, or -(DiagnosisLevel code + 1) when the answer ends the questionnaire (-1 for no diagnosis). The last column stands for any code that is not an answer.
+    """
+
+    maxAnswerCode: ClassVar[int] = 255
+
+    def __init__(self, questionnaire: DecisionTree | None = None) -> None:
+        """
+        Constructor for BatchDiagnoser class. Builds the transition matrix. Raises ValueError if an answer is not an integer code up to maxAnswerCode, or an outcome is not a DiagnosisLevel.
+
+        Parameters:
+            questionnaire (```DecisionTree```): Questionnaire to diagnose with. Default is resources/questionnaire.json.
+        """
+        self.questionnaire: DecisionTree = getQuestionnaire() if questionnaire is None else questionnaire
+        self.columns: List[str] = list(self.questionnaire.names)
+
+        levels: List[int] = []
+        for outcome in self.questionnaire.outcomes:
+            level: DiagnosisLevel | None = DiagnosisLevel.of(outcome)
+            if level is None:
+                raise ValueError(f"Batch diagnosis needs every questionnaire outcome to be a DiagnosisLevel, not {outcome}")
+            levels.append(int(level))
+
+        width: int = 0
+        for transitions in self.questionnaire.transitions:
+            if not all(answer.isascii() and answer.isdecimal() and int(answer) <= self.maxAnswerCode for answer in transitions):
+                raise ValueError(f"Batch diagnosis needs every questionnaire answer to be an integer code up to {self.maxAnswerCode}")
+            width = max(width, max(int(answer) for answer in transitions) + 2)
+
+        self.transitions: np.ndarray = np.full((len(self.columns), width), -1, dtype=np.int16)
+        for node, transitions in enumerate(self.questionnaire.transitions):
+            for answer, transition in transitions.items():
+                self.transitions[node, int(answer)] = transition if transition >= 0 else -(levels[-transition - 1] + 1)
+
+    def diagnose(self, answers: Mapping[str, Any]) -> np.ndarray:
+        """
+        Diagnose a batch of answer sets.
+
+        Parameters:
+            answers (```Mapping```[```str```, ```Any```]): Question name (such as "appearance", "eyes", "skin") mapped to a NumPy array or buffer of integer answer codes, one per answer set. All columns must have the same length; a question that is never asked may be left out.
+
+        Returns:
+            (```np.ndarray```): uint8 DiagnosisLevel code of each answer set, 0 for no diagnosis.
+        """
+        width: int = self.transitions.shape[1]
+        given: Dict[str, np.ndarray] = {}
+        for name in self.columns:
+            if name in answers:
+                given[name] = self.__asArray(answers[name])
+        if len(given) == 0:
+            raise ValueError("No answer columns given")
+        length: int = len(next(iter(given.values())))
+        if any(len(codes) != length for codes in given.values()):
+            raise ValueError("Answer columns must all have the same length")
+
+        # One row of answer codes per question, codes that are not an answer (and questions left out) mapped to the last column.
+        codes: np.ndarray = np.full((len(self.columns), length), width - 1, dtype=np.int16)
+        for node, name in enumerate(self.columns):
+            if name in given:
+                codes[node] = np.where((given[name] >= 0) & (given[name] < width - 1), given[name], width - 1)
+
+        rows: np.ndarray = np.arange(length)
+        state: np.ndarray = np.zeros(length, dtype=np.int16)
+        for _ in self.columns:
+            asked: np.ndarray = state >= 0
+            if not asked.any():
+                break
+            rowNodes: np.ndarray = np.where(asked, state, 0)
+            state = np.where(asked, self.transitions[rowNodes, codes[rowNodes, rows]], state)
+        return np.where(state < 0, -state - 1, 0).astype(np.uint8)
+
+    def decode(self, levels: np.ndarray) -> np.ndarray:
+        """
+        Turn DiagnosisLevel codes into diagnoses.
+
+        Parameters:
+            levels (```np.ndarray```): DiagnosisLevel codes from diagnose().
+
+        Returns:
+            (```np.ndarray```): Diagnosis of each code, "" for no diagnosis.
+        """
+        labels: np.ndarray = np.array([""] + [level.label for level in DiagnosisLevel], dtype=object)
+        diagnoses: np.ndarray = labels[levels]
+        return diagnoses
+
+    def counts(self, levels: np.ndarray) -> Dict[str, int]:
+        """
+        Count how many answer sets got each diagnosis.
+
+        Parameters:
+            levels (```np.ndarray```): DiagnosisLevel codes from diagnose().
+
+        Returns:
+            (```Dict```[```str```, ```int```]): Number of answer sets per diagnosis, "" for no diagnosis.
+        """
+        totals: np.ndarray = np.bincount(np.asarray(levels, dtype=np.int64), minlength=len(DiagnosisLevel) + 1)
+        return {label: int(total) for label, total in zip([""] + [level.label for level in DiagnosisLevel], totals)}
+
+    @staticmethod
+    def __asArray(column: Any) -> np.ndarray:
+        """
+        View a column of answer codes as an integer NumPy array without copying where possible.
+
+        Parameters:
+            column (```Any```): NumPy array, array.array, memoryview or other sequence of integers; raw bytes are read as one unsigned byte per code.
+
+        Returns:
+            (```np.ndarray```): One-dimensional integer array.
+        """
+        if isinstance(column, (bytes, bytearray)):
+            return np.frombuffer(column, dtype=np.uint8)
+        codes: np.ndarray = np.asarray(column)
+        if codes.ndim != 1 or not np.issubdtype(codes.dtype, np.integer):
+            raise ValueError("Answer columns must be one-dimensional integer arrays")
+        return codes
@@ -0,0 +1,175 @@
+from typing import ClassVar, List
+from bots.decisionTree import DecisionTree, getQuestionnaire
+from bots.medicalBot import MedicalBot
+from models.diagnosis import Diagnosis
+from models.patient import Patient
+from services.asyncDiagnosisService import AsyncDiagnosisService
+from services.asyncPatientService import AsyncPatientService
+
+
+class BotSession:
+    """
+    One clinician's questionnaire session, driven one answer at a time instead of by input() so many sessions can be served by one process.
+    Holds where the session is in the patient check-in → questionnaire flow and the answers given so far. Sessions share the async services they are given, and with them the connection pool and patient cache.
+
+    Attributes:
+        (```class```) patientTypePrompt (```str```): Prompt to choose a new or returning patient.
+        (```class```) patientIDPrompt (```str```): Prompt to get a returning patient's ID.
+        (```class```) invalidAnswerMessage (```str```): Message sent when an answer cannot be used.
+        (```class```) patientFields (```List```[```tuple```[```str```, ```str```]]): Session states asking for new patient information, with their prompts.
+        patientService (```AsyncPatientService```): Async patient service shared by all sessions.
+        diagnosisService (```AsyncDiagnosisService```): Async diagnosis service shared by all sessions.
+        questionnaire (```DecisionTree```): Compiled dehydration questionnaire.
+        state (```str```): The question the session is waiting for an answer to.
+        node (```int```): Questionnaire node the session is at while state is "questionnaire".
+        patientID (```int | None```): Patient ID of a returning patient, or None for a new patient.
+        patientAnswers (```List```[```str```]): New patient information answered so far.
+        finished (```bool```): True once the clinician has quit the session.
+    """
+
+    patientTypePrompt: ClassVar[str] = "Is this a new patient or returning patient?\n - New patient, press 1\n - Returning patient, press 2\n - To quit, press q\n"
+    patientIDPrompt: ClassVar[str] = "Please enter patient ID:\n"
+    invalidAnswerMessage: ClassVar[str] = "Invalid answer."
+    patientFields: ClassVar[List[tuple[str, str]]] = [
+        ("name", MedicalBot.namePrompt),
+        ("age", MedicalBot.agePrompt),
+        ("gender", MedicalBot.genderPrompt),
+        ("height", MedicalBot.heightPrompt),
+        ("weight", MedicalBot.weightPrompt),
+    ]
+
+    def __init__(self, patientService: AsyncPatientService, diagnosisService: AsyncDiagnosisService, questionnaire: DecisionTree | None = None) -> None:
+        """
+        Constructor for BotSession class.
+
+        Parameters:
+            patientService (```AsyncPatientService```): Async patient service shared by all sessions.
+            diagnosisService (```AsyncDiagnosisService```): Async diagnosis service shared by all sessions.
+            questionnaire (```DecisionTree```): Compiled dehydration questionnaire. Default is resources/questionnaire.json.
+        """
+        self.patientService: AsyncPatientService = patientService
+        self.diagnosisService: AsyncDiagnosisService = diagnosisService
+        self.questionnaire: DecisionTree = getQuestionnaire() if questionnaire is None else questionnaire
+        self.finished: bool = False
+        self.state: str = "patientType"
+        self.patientID: int | None = None
+        self.patientAnswers: List[str] = []
+        self.node: int = 0
+
+    def start(self) -> str:
+        """
+        Get the first prompt of the session.
+
+        Returns:
+            (```str```): Prompt to send to the clinician.
+        """
+        return self.patientTypePrompt
+
+    async def answer(self, text: str) -> str:
+        """
+        Give the session the clinician's answer to its last prompt and move to the next question.
+
+        Parameters:
+            text (```str```): The clinician's answer.
+
+        Returns:
+            (```str```): Message and next prompt to send to the clinician. Empty once the session is finished.
+        """
+        text = text.strip()
+        if text == "q":
+            self.finished = True
+            return ""
+
+        if self.state == "patientType":
+            if text == "1":
+                return self.__next("name")
+            if text == "2":
+                return self.__next("patientID")
+        elif self.state == "patientID":
+            if text.isdecimal():
+                patient: Patient | None = await self.patientService.getPatientByID(int(text))
+                if patient is None:
+                    return f"{MedicalBot.getPatientInforErrorMessage} {text}\n" + self.__restart()
+                self.patientID = patient.patientID
+                return self.__next("questionnaire")
+        elif self.state in [field for field, _ in self.patientFields]:
+            # isdecimal() rather than isdigit(): digits such as "²" pass isdigit() but int() rejects them.
+            if self.state in ("age", "height", "weight") and not text.isdecimal():
+                return f"{self.invalidAnswerMessage}\n" + self.__prompt()
+            self.patientAnswers.append(text)
+            fieldIndex: int = len(self.patientAnswers)
+            return self.__next(self.patientFields[fieldIndex][0] if fieldIndex < len(self.patientFields) else "questionnaire")
+        elif self.state == "questionnaire":
+            transition: int | None = self.questionnaire.step(self.node, text)
+            if transition is not None and transition >= 0:
+                self.node = transition
+                return self.__prompt()
+            if transition is not None:
+                return await self.__save(self.questionnaire.outcomes[-transition - 1]) + self.__restart()
+
+        return f"{self.invalidAnswerMessage}\n" + self.__prompt()
+
+    async def __save(self, finalDiagnosis: str) -> str:
+        """
+        Save the diagnosis, and the patient if they are new, with the shared services.
+
+        Parameters:
+            finalDiagnosis (```str```): Diagnosis to save.
+
+        Returns:
+            (```str```): Message telling the clinician the diagnosis and whether it was saved.
+        """
+        diagnosis: Diagnosis = Diagnosis(finalDiagnosis, self.patientID)
+        if self.patientID is None:
+            name, age, gender, height, weight = self.patientAnswers
+            patient: Patient = Patient(name, int(age), gender, int(height), int(weight))
+            if await self.diagnosisService.createPatientAndDiagnosis(patient, diagnosis) is None:
+                return f"{finalDiagnosis}\n{MedicalBot.saveErrorMessage}\n"
+        elif await self.diagnosisService.createDiagnosis(diagnosis) is None:
+            return f"{finalDiagnosis}\n{MedicalBot.saveErrorMessage}\n"
+        return f"{finalDiagnosis}\n{diagnosis}\nSaved!\n"
+
+    def __next(self, state: str) -> str:
+        """
+        Move the session to state.
+
+        Parameters:
+            state (```str```): Next question.
+
+        Returns:
+            (```str```): Prompt of the next question.
+        """
+        self.state = state
+        return self.__prompt()
+
+    def __prompt(self) -> str:
+        """
+        Get the prompt of the question the session is waiting for.
+
+        Returns:
+            (```str```): Prompt to send to the clinician.
+        """
+        if self.state == "questionnaire":
+            return self.questionnaire.prompts[self.node]
+        prompts: dict[str, str] = dict(self.patientFields)
+        prompts.update({"patientType": self.patientTypePrompt, "patientID": self.patientIDPrompt})
+        return prompts[self.state]
+
+    def __restart(self) -> str:
+        """
+        Forget the current patient and go back to the first question.
+
+        Returns:
+            (```str```): First prompt of the session.
+        """
+        self.__reset()
+        return self.__prompt()
+
+    def __reset(self) -> None:
+        """
+        Clear the current patient and answers and wait for the patient type.
+        """
+        self.state = "patientType"
+        self.patientID = None
+        self.patientAnswers = []
+        self.node = 0
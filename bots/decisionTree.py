@@ -0,0 +1,200 @@
+import json
+import os
+from typing import Any, Callable, Dict, List, Mapping, Sequence
+
+defaultPath: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources", "questionnaire.json")
+
+
+class DecisionTree:
+    """
+    Questionnaire protocol compiled from a declarative definition (see resources/questionnaire.json) into a compact node array.
+    Evaluating a set of answers walks at most one node per question asked (O(depth)) and does no I/O, so the same protocol can run interactively, from batch answer sets or behind a server.
+
+    Nodes are numbered from 0 (the root question). A transition is a node number when it leads to another question, or -(outcome code + 1) when it ends the questionnaire.
+
+    Attributes:
+        names (```List```[```str```]): Question name of each node.
+        prompts (```List```[```str```]): Prompt of each node.
+        transitions (```List```[```Dict```[```str```, ```int```]]): Answer of each node mapped to its transition.
+        outcomes (```List```[```str```]): Diagnosis of each outcome code.
+    """
+
+    def __init__(self, definition: Dict[str, Any]) -> None:
+        """
+        Constructor for DecisionTree class. Compiles and checks a questionnaire definition.
+
+        Parameters:
+            definition (```Dict```[```str```, ```Any```]): Questionnaire definition with root (first question name), outcomes (list of diagnoses) and questions (question name mapped to its prompt and answers; each answer leads to a question or an outcome).
+        """
+        questions: Dict[str, Any] = definition["questions"]
+        self.outcomes: List[str] = list(definition["outcomes"])
+        self.names: List[str] = [definition["root"]] + [name for name in questions if name != definition["root"]]
+        self.prompts: List[str] = []
+        self.transitions: List[Dict[str, int]] = []
+
+        nodes: Dict[str, int] = {name: node for node, name in enumerate(self.names)}
+        for name in self.names:
+            if name not in questions:
+                raise ValueError(f"Questionnaire has no question named {name}")
+            self.prompts.append(questions[name]["prompt"])
+            transitions: Dict[str, int] = {}
+            for answer, target in questions[name]["answers"].items():
+                if "question" in target:
+                    if target["question"] not in nodes:
+                        raise ValueError(f"Question {name} answer {answer} leads to unknown question {target['question']}")
+                    transitions[answer] = nodes[target["question"]]
+                elif target.get("outcome") in self.outcomes:
+                    transitions[answer] = -(self.outcomes.index(target["outcome"]) + 1)
+                else:
+                    raise ValueError(f"Question {name} answer {answer} leads to unknown outcome {target.get('outcome')}")
+            self.transitions.append(transitions)
+        self.__checkAcyclic()
+
+    @classmethod
+    def load(cls, path: str = defaultPath) -> "DecisionTree":
+        """
+        Compile a questionnaire definition from a JSON file.
+
+        Parameters:
+            path (```str```): Path to the JSON definition. Default is resources/questionnaire.json.
+
+        Returns:
+            (```DecisionTree```): The compiled questionnaire.
+        """
+        with open(path, encoding="utf-8") as file:
+            return cls(json.load(file))
+
+    def step(self, node: int, answer: str) -> int | None:
+        """
+        Follow one answer from a node.
+
+        Parameters:
+            node (```int```): Current node.
+            answer (```str```): Answer to the node's question.
+
+        Returns:
+            (```int | None```): Next node (0 or more), outcome as -(outcome code + 1), or None if the answer is not valid.
+        """
+        return self.transitions[node].get(answer.strip())
+
+    def evaluateCode(self, answers: Sequence[str], node: int = 0) -> int:
+        """
+        Diagnose from a set of answers, starting at node.
+
+        Parameters:
+            answers (```Sequence```[```str```]): Answers in the order the questions are asked. Answers left over after an outcome is reached are ignored.
+            node (```int```): Node to start at. Default is the root question.
+
+        Returns:
+            (```int```): Outcome code, or -1 if an answer is not valid or there are too few answers.
+        """
+        for answer in answers:
+            transition: int | None = self.step(node, answer)
+            if transition is None:
+                return -1
+            if transition < 0:
+                return -transition - 1
+            node = transition
+        return -1
+
+    def evaluateCodeByName(self, answers: Mapping[str, Any]) -> int:
+        """
+        Diagnose from answers keyed by question name, such as a record from an intake kiosk. Only the questions on the path taken are looked up.
+
+        Parameters:
+            answers (```Mapping```[```str```, ```Any```]): Question name mapped to its answer. Answers are compared as strings.
+
+        Returns:
+            (```int```): Outcome code, or -1 if an asked question has no answer or an answer is not valid.
+        """
+        node: int = 0
+        for _ in self.names:
+            answer: Any = answers.get(self.names[node])
+            transition: int | None = None if answer is None else self.step(node, str(answer))
+            if transition is None:
+                return -1
+            if transition < 0:
+                return -transition - 1
+            node = transition
+        return -1
+
+    def evaluate(self, answers: Sequence[str], node: int = 0) -> str:
+        """
+        Diagnose from a set of answers, starting at node.
+
+        Parameters:
+            answers (```Sequence```[```str```]): Answers in the order the questions are asked.
+            node (```int```): Node to start at. Default is the root question.
+
+        Returns:
+            (```str```): Diagnosis, or "" if an answer is not valid or there are too few answers.
+        """
+        code: int = self.evaluateCode(answers, node)
+        return "" if code < 0 else self.outcomes[code]
+
+    def run(self, ask: Callable[[str], str]) -> str:
+        """
+        Run the questionnaire interactively, asking one question at a time.
+
+        Parameters:
+            ask (```Callable```[[```str```], ```str```]): Function that shows a prompt and returns the answer, such as input.
+
+        Returns:
+            (```str```): Diagnosis, or "" if an answer is not valid.
+        """
+        node: int = 0
+        while True:
+            transition: int | None = self.step(node, ask(self.prompts[node]))
+            if transition is None:
+                return ""
+            if transition < 0:
+                return self.outcomes[-transition - 1]
+            node = transition
+
+    def nodeOf(self, name: str) -> int:
+        """
+        Get the node of a question.
+
+        Parameters:
+            name (```str```): Question name.
+
+        Returns:
+            (```int```): Node of the question.
+        """
+        return self.names.index(name)
+
+    def __checkAcyclic(self) -> None:
+        """
+        Check no answer path leads back to a question already asked, so every evaluation ends.
+        """
+        visiting: set[int] = set()
+        done: set[int] = set()
+
+        def visit(node: int) -> None:
+            if node in done:
+                return
+            if node in visiting:
+                raise ValueError(f"Questionnaire loops back to question {self.names[node]}")
+            visiting.add(node)
+            for transition in self.transitions[node].values():
+                if transition >= 0:
+                    visit(transition)
+            visiting.discard(node)
+            done.add(node)
+
+        visit(0)
+
+
+questionnaire: DecisionTree | None = None
+
+def getQuestionnaire() -> DecisionTree:
+    """
+    Get the default questionnaire, compiling resources/questionnaire.json on first use.
+
+    Returns:
+        (```DecisionTree```): The compiled default questionnaire.
+    """
+    global questionnaire
+    if questionnaire is None:
+        questionnaire = DecisionTree.load()
+    return questionnaire
@@ -1,8 +1,9 @@
 from typing import ClassVar, Dict, List
-from models.diagnosis import Diagnosis
+from bots.decisionTree import DecisionTree, getQuestionnaire
+from models.diagnosis import Diagnosis, DiagnosisLevel
 from models.patient import Patient
 from services.diagnosisService import DiagnosisService
-from services.patientService import PatientService
+from services.patientService import PatientService, getDefaultPatientService
 
 
 class MedicalBot:
@@ -17,9 +18,9 @@ class MedicalBot:
         (```class````) genderPrompt (```str```): Prompt to get patient gender.
         (```class````) heightPrompt (```str```): Prompt to get patient height.
         (```class````) weightPrompt (```str```): Prompt to get patient weight.
-        (```class````) appearancePrompt (```str```): Prompt to assess patient appearance.
-        (```class````) eyePrompt (```str```): Prompt to assess patiet eys.
-        (```class````) skinPrompt (```str```): Prompt to assess the patients skin.
+        (```class````) searchPrompt (```str```): Prompt to get the start of a patient name to search for.
+        (```class````) nextPagePrompt (```str```): Prompt to show the next page of results.
+        (```class````) pageSize (```int```): Number of patients shown per page when listing or searching.
         (```class````) patientErrorMessage (```str```): Error message displayed when invalid patient information is received.
         (```class````) saveErrorMessage (```str```): Error message displayed when patient or diagnosis could not be saved to the database.
         (```class````) diagnosisErrorMessage (```str```): Error message displayed when invalid diagnosis information is received.
@@ -28,6 +29,7 @@ class MedicalBot:
         (```class````) noDehydration (```str```): No Dehydration diagnosis.
         patientService (```PatientService```): Patient service object to validate patient information and access database.
         diagnosisService (```DiagnosisService```): Diagnosis service object to validate diagnosis information and access the database.
+        questionnaire (```DecisionTree```): Compiled dehydration questionnaire.
     """
 
     namePrompt: ClassVar[str] = "What is the patient's name?\n"
@@ -35,37 +37,68 @@ class MedicalBot:
     genderPrompt: ClassVar[str] = "What is the patient's gender?\n"
     heightPrompt: ClassVar[str] = "What is the patient's height?\n"
     weightPrompt: ClassVar[str] = "What is the patient's weight?\n"
-    appearancePrompt: ClassVar[str] = "How is the patient's general appearance?\n - 1: Normal appearance\n - 2: Irritable or lethargic\n"
 
-    eyePrompt: ClassVar[str] = "How are the patient's eyes?\n - 1: Eyes normal or slightly sunken\n - 2: Eyes very sunken\n"
-    skinPrompt: ClassVar[str] = "How is the patient's skin when you pinch it?\n - 1: Normal skin pinch\n - 2: Slow skin pinch\n"
+    searchPrompt: ClassVar[str] = "Enter the start of the patient's name:\n"
+    nextPagePrompt: ClassVar[str] = "For more patients press n, to stop press any other key\n"
+    pageSize: ClassVar[int] = 20
 
     patientErrorMessage: ClassVar[str] = "Could not save patient information due to invalid input."
     saveErrorMessage: ClassVar[str] = "Could not save Patient or Diagnosis information."
     diagnosisErrorMessage: ClassVar[str] = "Could not get new diagnosis information."
     getPatientInforErrorMessage: ClassVar[str] = "Could not get Patient information"
 
-    severeDehydration: ClassVar[str] = "Severe dehydration"
-    someDehydration: ClassVar[str] = "Some dehydration"
-    noDehydration: ClassVar[str]= "No dehydration"
+    severeDehydration: ClassVar[str] = DiagnosisLevel.SEVERE_DEHYDRATION.label
+    someDehydration: ClassVar[str] = DiagnosisLevel.SOME_DEHYDRATION.label
+    noDehydration: ClassVar[str]= DiagnosisLevel.NO_DEHYDRATION.label
 
-    def __init__(self, patientService: PatientService | None = None, diagnosisService: DiagnosisService | None = None) -> None:
+    def __init__(self, patientService: PatientService | None = None, diagnosisService: DiagnosisService | None = None, questionnaire: DecisionTree | None = None) -> None:
         """
-        Constructor for MedicalBot class.
+        Constructor for MedicalBot class. Services and questionnaire not given are created on first use, so constructing a bot does not touch the config file or the database.
 
         Attributes:
             patientService (```PatientService```): Patient service object to validate patient information and access database.
             diagnosisService (```DiagnosisService```): Diagnosis service object to validate diagnosis information and access the database.
+            questionnaire (```DecisionTree```): Compiled dehydration questionnaire. Default is resources/questionnaire.json.
         """
-        if patientService is None:
-            self.patientService: PatientService | None = PatientService()
-        else:
-            self.patientService = patientService
-        
-        if diagnosisService is None:
-            self.diagnosisService: DiagnosisService | None = DiagnosisService()
-        else:
-            self.diagnosisService = diagnosisService
+        self.__patientService: PatientService | None = patientService
+        self.__diagnosisService: DiagnosisService | None = diagnosisService
+        self.__questionnaire: DecisionTree | None = questionnaire
+
+    @property
+    def patientService(self) -> PatientService:
+        """
+        Patient service. If none was given, the shared patient service of the configured storage backend, fetched on first use.
+
+        Returns:
+            (```PatientService```): The patient service.
+        """
+        if self.__patientService is None:
+            self.__patientService = getDefaultPatientService()
+        return self.__patientService
+
+    @property
+    def diagnosisService(self) -> DiagnosisService:
+        """
+        Diagnosis service, created on first use if none was given. Shares the patient service's cache.
+
+        Returns:
+            (```DiagnosisService```): The diagnosis service.
+        """
+        if self.__diagnosisService is None:
+            self.__diagnosisService = DiagnosisService(patientService=self.patientService)
+        return self.__diagnosisService
+
+    @property
+    def questionnaire(self) -> DecisionTree:
+        """
+        Compiled dehydration questionnaire, loaded on first use if none was given.
+
+        Returns:
+            (```DecisionTree```): The questionnaire.
+        """
+        if self.__questionnaire is None:
+            self.__questionnaire = getQuestionnaire()
+        return self.__questionnaire
 
     def __assessSkin(self, skin: str) -> str:
         """
@@ -77,12 +110,7 @@ class MedicalBot:
         Returns:
             (```str```): Diagnosis of skin for dehydration.
         """
-        diagnosis: str = ""
-        if skin == "1":
-            diagnosis = self.someDehydration
-        elif skin == "2":
-            diagnosis = self.severeDehydration
-        return diagnosis
+        return self.questionnaire.evaluate([skin], self.questionnaire.nodeOf("skin"))
 
     def __assessEyes(self, eyes: str) -> str:
         """
@@ -94,12 +122,7 @@ class MedicalBot:
         Returns:
             (```str```): Diagnosis of eyes for dehydration.
         """
-        diagnosis: str = ""
-        if eyes == "1":
-            diagnosis = self.noDehydration
-        elif eyes == "2":
-            diagnosis = self.severeDehydration
-        return diagnosis
+        return self.questionnaire.evaluate([eyes], self.questionnaire.nodeOf("eyes"))
 
     def __assessAppearance(self) -> str:
         """
@@ -108,15 +131,7 @@ class MedicalBot:
         Returns:
             (```str```): Diagnosis of dehydration from appearance.
         """
-        diagnosis: str = ""
-        appearance = input(self.appearancePrompt)
-        if appearance == "1":
-            eyes = input(self.eyePrompt)
-            diagnosis = self.__assessEyes(eyes)
-        elif appearance == "2":
-            skin = input(self.skinPrompt)
-            diagnosis = self.__assessSkin(skin)
-        return diagnosis
+        return self.questionnaire.run(input)
     
     def __getPatientInfo(self) -> Patient:
         """
@@ -165,33 +180,52 @@ class MedicalBot:
             (```bool```): True if successfully saved, false otherswise.
         """
         if self.patientService.getPatientByID(patient.patientID) is None:
-            checkPatient: Patient | None = self.patientService.createPatient(patient)
-            if checkPatient is None:
+            patient.patientID = None
+            if self.diagnosisService.createPatientAndDiagnosis(patient, diagnosis) is None:
                 return False
-            diagnosis.patientID = checkPatient.patientID
         else:
             diagnosis.patientID = patient.patientID
-        checkDiagnosis: Diagnosis = self.diagnosisService.createDiagnosis(diagnosis)
-        if checkDiagnosis is None:
-            return False
+            checkDiagnosis: Diagnosis = self.diagnosisService.createDiagnosis(diagnosis)
+            if checkDiagnosis is None:
+                return False
         print(patient, diagnosis)
         return True
     
     def listPatientsAndDiagnoses(self) -> None:
         """
-        List all patients and there diagnoses (if any) printed to console.
+        List all patients and there diagnoses (if any) printed to console, a page at a time. The next page is only fetched when asked for.
         """
-        patients: List[Patient] = self.patientService.getAllPatients()
+        cursor: int | None = None
         print("----------")
         print()
-        for patient in patients:
-            diagnoses: List[Diagnosis] = self.diagnosisService.getDiagnosesByPatientID(patient.patientID)
-            print(patient)
-            for diagnosis in diagnoses:
-                print(diagnosis)
-            print()
-            print("----------")
-            print()
+        while True:
+            patients: List[tuple[Patient, List[Diagnosis]]]
+            patients, cursor = self.patientService.getPatientsWithDiagnosesPage(self.pageSize, cursor)
+            for patient, diagnoses in patients:
+                print(patient)
+                for diagnosis in diagnoses:
+                    print(diagnosis)
+                print()
+                print("----------")
+                print()
+            if cursor is None or input(self.nextPagePrompt) != "n":
+                return
+
+    def searchPatients(self) -> None:
+        """
+        Search patients by the start of their name and print the matches to console a page at a time.
+        """
+        namePrefix: str = input(self.searchPrompt)
+        cursor: tuple[str, int] | None = None
+        while True:
+            patients: List[Patient]
+            patients, cursor = self.patientService.searchPatients(namePrefix, self.pageSize, cursor)
+            if len(patients) == 0:
+                print("No patients found.")
+            for patient in patients:
+                print(patient)
+            if cursor is None or input(self.nextPagePrompt) != "n":
+                return
 
     def newDiagnosis(self, patientID: int | None = None) -> None:
         """
@@ -0,0 +1,173 @@
+from typing import Any, List
+from models.diagnosis import Diagnosis
+from models.patient import Patient
+
+from dao.statementRegistry import statements
+from utils import connectionUtil
+
+
+class AsyncDiagnosisDAO:
+    """
+    Asyncio counterpart of DiagnosisDAO. Access diagnosis information in the database and return as a diagnosis object, using connections from the asyncio connection pool so many lookups can run concurrently.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for AsyncDiagnosisDAO class.
+        """
+        pass
+
+    async def getAllDiagnosis(self) -> List[Diagnosis]:
+        """
+        Get all diagnoses infromation from the database.
+
+        Returns:
+            (```List```[```Diagnosis```]): List of all diagnoses as diagnosis objects. If database is empty, return empty list.
+        """
+        return await self.__getDiagnoses("diagnosis.getAll", ())
+
+    async def getDiagnosesByPatientID(self, patientID: int) -> List[Diagnosis]:
+        """
+        Get all diagnoses for patient ID.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```List```[```Diagnosis```]): List of all diagnoses as diagnosis objects.
+        """
+        return await self.__getDiagnoses("diagnosis.getByPatientID", (patientID,))
+
+    async def getDiagnosisByID(self, diagnosisID: int) -> Diagnosis | None:
+        """
+        Get diagnosis for diagnosis ID.
+
+        Parameters:
+            diagnosisID (```int```): Diagnosis ID.
+
+        Returns:
+            (```Diangosis | None ```): Diagnosis object or None.
+        """
+        diagnoses: List[Diagnosis] = await self.__getDiagnoses("diagnosis.getByID", (diagnosisID,))
+        if len(diagnoses) != 1:
+            return None
+        return diagnoses[0]
+
+    async def addDignosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Add diagnosis to database.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis object (No diagnosisID!) to add to database.
+
+        Returns:
+            (```Diagnosis```): Diagnosis object with diagnosisID from database.
+        """
+        try:
+            async with connectionUtil.asyncConnection() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, "diagnosis.add", (diagnosis.patientID, diagnosis.level))
+
+                row: tuple[Any, ...] | None = await cursor.fetchone()
+                if row is not None:
+                    diagnosis.diagnosisID = row[0]
+                    return diagnosis
+        except Exception as e:
+            print(e)
+
+        return None
+
+    async def addPatientAndDiagnosis(self, patient: Patient, diagnosis: Diagnosis) -> tuple[Patient, Diagnosis] | None:
+        """
+        Add a new patient and their diagnosis to database atomically, in one statement on one connection. Either both rows are saved or neither is.
+
+        Parameters:
+            patient (```Patient```): Patient object (No patientID!) to add to database.
+            diagnosis (```Diagnosis```): Diagnosis object (No diagnosisID or patientID!) to add to database for patient.
+
+        Returns:
+            (```tuple```[```Patient```, ```Diagnosis```] | None): Patient with patientID and diagnosis with diagnosisID and patientID from database, or None if nothing was saved.
+        """
+        try:
+            async with connectionUtil.asyncTransaction() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, "diagnosis.addWithPatient", (patient.name, patient.age, patient.gender, patient.height, patient.weight, diagnosis.level))
+
+                row: tuple[Any, ...] | None = await cursor.fetchone()
+                if row is not None:
+                    patient.patientID, diagnosis.diagnosisID = row
+                    diagnosis.patientID = patient.patientID
+                    return (patient, diagnosis)
+        except Exception as e:
+            print(e)
+
+        return None
+
+    async def updateDiagnosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Update diagnosis in database.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diangosis to update in database.
+
+        Returns:
+            (```Diagnosis | None```): Updated diagnosis if update was successful or None otherwise.
+        """
+        try:
+            async with connectionUtil.asyncConnection() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, "diagnosis.update", (diagnosis.patientID, diagnosis.level, diagnosis.diagnosisID))
+
+                checkDiagnosis: tuple[Any, ...] | None = await cursor.fetchone()
+                if checkDiagnosis is not None:
+                    diagnosis.diagnosisID, diagnosis.patientID, diagnosis.diagnosis = checkDiagnosis
+                    return diagnosis
+        except Exception as e:
+            print(e)
+
+        return None
+
+    async def deleteDiagnosis(self, diagnosisID: int) -> bool:
+        """
+        Delete diagnosis at diagnosisID in database.
+
+        Parameters:
+            diagnosisID (```int```): Diagnosis ID.
+
+        Returns:
+            (```bool```): True if diagnosis at diagnosis ID was deleted, False otherwise.
+        """
+        try:
+            async with connectionUtil.asyncConnection() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, "diagnosis.delete", (diagnosisID,))
+
+                return cursor.rowcount > 0
+        except Exception as e:
+            print(e)
+
+        return False
+
+    async def __getDiagnoses(self, statement: str, params: tuple[Any, ...]) -> List[Diagnosis]:
+        """
+        Run a diagnosis query and return the rows as diagnosis objects.
+
+        Parameters:
+            statement (```str```): Name of a registered statement selecting all diagnosis columns.
+            params (```tuple```[```Any```, ...]): Query parameters.
+
+        Returns:
+            (```List```[```Diagnosis```]): Rows as diagnosis objects. Empty list if the query failed.
+        """
+        diagnosisList: List[Diagnosis] = []
+
+        try:
+            async with connectionUtil.asyncConnection() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, statement, params)
+
+                rs: List[tuple[Any, ...]] = await cursor.fetchall()
+                for tup in rs:
+                    diagnosisID: int; patientID: int; finalDiagnosis: int
+                    diagnosisID, patientID, finalDiagnosis = tup
+
+                    diagnosisList.append(Diagnosis(finalDiagnosis, patientID, diagnosisID))
+        except Exception as e:
+            print(e)
+
+        return diagnosisList
@@ -0,0 +1,163 @@
+from typing import Any, List
+from models.diagnosis import Diagnosis
+from models.patient import Patient
+
+from dao.statementRegistry import statements
+from utils import connectionUtil
+
+
+class AsyncPatientDAO:
+    """
+    Asyncio counterpart of PatientDAO. Access patient information in the database and return as a patient object, using connections from the asyncio connection pool so many lookups can run concurrently.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for AsyncPatientDAO class.
+        """
+        pass
+
+    async def getAllPatients(self) -> List[Patient]:
+        """
+        Get all patient information from the database.
+
+        Returns:
+            (```List```[```Patient```]): List of all patients and their information as patient objects. If database is empty, return empty list.
+        """
+        patientList: List[Patient] = []
+
+        try:
+            async with connectionUtil.asyncConnection() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, "patient.getAll")
+
+                rs: List[tuple[Any, ...]] = await cursor.fetchall()
+                for tup in rs:
+                    patientID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    patientID, patientName, patientAge, patientGender, patientHeight, patientWeight = tup
+
+                    patientList.append(Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patientID))
+        except Exception as e:
+            print(e)
+
+        return patientList
+
+    async def getAllPatientsWithDiagnoses(self) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get all patients and their diagnoses from the database in a single query.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): List of all patients paired with their diagnoses, ordered by patient ID. If database is empty, return empty list.
+        """
+        patientList: List[tuple[Patient, List[Diagnosis]]] = []
+
+        try:
+            async with connectionUtil.asyncConnection() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, "patient.getAllWithDiagnoses")
+
+                rs: List[tuple[Any, ...]] = await cursor.fetchall()
+                for tup in rs:
+                    patientID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    diagnosisID: int | None; finalDiagnosis: int | None
+                    patientID, patientName, patientAge, patientGender, patientHeight, patientWeight, diagnosisID, finalDiagnosis = tup
+
+                    if len(patientList) == 0 or patientList[-1][0].patientID != patientID:
+                        patientList.append((Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patientID), []))
+
+                    if diagnosisID is not None:
+                        patientList[-1][1].append(Diagnosis(finalDiagnosis, patientID, diagnosisID))
+        except Exception as e:
+            print(e)
+
+        return patientList
+
+    async def getPatientByID(self, patientID: int) -> Patient | None:
+        """
+        Get paitient by patientID.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```Patient | None```): patient object or None
+        """
+        patient: Patient | None = None
+
+        try:
+            async with connectionUtil.asyncConnection() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, "patient.getByID", (patientID,))
+
+                tup: tuple[Any, ...] | None = await cursor.fetchone()
+                if tup is not None:
+                    patient_ID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    patient_ID, patientName, patientAge, patientGender, patientHeight, patientWeight = tup
+                    patient = Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patient_ID)
+        except Exception as e:
+            print(e)
+
+        return patient
+
+    async def addPatient(self, patient: Patient) -> Patient | None:
+        """
+        Add patient to database.
+
+        Parameters:
+            patient (```Patient```): Patient object (No patientID!) to add to database.
+
+        Returns:
+            (```Patient```): Patient object with patientID from database.
+        """
+        try:
+            async with connectionUtil.asyncConnection() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, "patient.add", (patient.name, patient.age, patient.gender, patient.height, patient.weight))
+
+                row: tuple[Any, ...] | None = await cursor.fetchone()
+                if row is not None:
+                    patient.patientID = row[0]
+                    return patient
+        except Exception as e:
+            print(e)
+
+        return None
+
+    async def updatePatient(self, patient: Patient) -> Patient | None:
+        """
+        Update patient in database.
+
+        Parameters:
+            patient (```Patient```): Patient and their information to update in database.
+
+        Returns:
+            (```Patient | None```): Updated patient if update was successful or None otherwise.
+        """
+        try:
+            async with connectionUtil.asyncConnection() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, "patient.update", (patient.name, patient.age, patient.gender, patient.height, patient.weight, patient.patientID))
+
+                checkPatient: tuple[Any, ...] | None = await cursor.fetchone()
+                if checkPatient is not None:
+                    patient.patientID, patient.name, patient.age, patient.gender, patient.height, patient.weight = checkPatient
+                    return patient
+        except Exception as e:
+            print(e)
+
+        return None
+
+    async def deletePatient(self, patientID: int) -> bool:
+        """
+        Delete patient at patientID in database.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```bool```): True if patient at patient ID was deleted, False otherwise.
+        """
+        try:
+            async with connectionUtil.asyncConnection() as conn, conn.cursor() as cursor:
+                await statements.executeAsync(cursor, "patient.delete", (patientID,))
+
+                return cursor.rowcount > 0
+        except Exception as e:
+            print(e)
+
+        return False
@@ -0,0 +1,127 @@
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Iterator, List
+from models.diagnosis import Diagnosis, DiagnosisLevel
+from models.patient import Patient
+
+from dao.statementRegistry import statements
+from utils import connectionUtil
+
+if TYPE_CHECKING:
+    import psycopg
+
+
+class BulkDAO:
+    """
+    Load large numbers of patients and diagnoses into the database with PostgreSQL COPY instead of one INSERT per row, and stream them back out with a server-side cursor.
+
+    Attributes:
+        (```class```) itersize (```int```): Default number of rows fetched per round-trip by iterExportRows.
+        (```class```) exportColumns (```List```[```str```]): Column names of the rows yielded by iterExportRows.
+    """
+
+    itersize: ClassVar[int] = 5000
+    exportColumns: ClassVar[List[str]] = ["patient_id", "name", "age", "gender", "height", "weight", "diagnosis_id", "diagnosis"]
+
+    def __init__(self) -> None:
+        """
+        Constructor for BulkDAO class.
+        """
+        pass
+
+    def copyPatientsAndDiagnoses(self, records: List[tuple[Patient, List[Diagnosis]]]) -> bool:
+        """
+        Add new patients and their diagnoses to database in one transaction using COPY.
+        IDs are reserved from the table sequences before copying, so every patient and diagnosis object gets its generated ID back.
+        A patient that already has a patientID is not copied, only its diagnoses are.
+
+        Parameters:
+            records (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): Patients (No patientID for new patients!) paired with their diagnoses (No diagnosisID!).
+
+        Returns:
+            (```bool```): True if all rows were saved, False if nothing was saved.
+        """
+        newPatients: List[Patient] = [patient for patient, _ in records if patient.patientID is None]
+        diagnoses: List[Diagnosis] = [diagnosis for _, patientDiagnoses in records for diagnosis in patientDiagnoses]
+
+        try:
+            with connectionUtil.transaction() as conn, conn.cursor() as cursor:
+                patientIDs: List[int] = self.__reserveIDs(cursor, "patient", "patient_id", len(newPatients))
+                for patient, patientID in zip(newPatients, patientIDs):
+                    patient.patientID = patientID
+
+                diagnosisIDs: List[int] = self.__reserveIDs(cursor, "diagnosis", "diagnosis_id", len(diagnoses))
+                for patient, patientDiagnoses in records:
+                    for diagnosis in patientDiagnoses:
+                        diagnosis.patientID = patient.patientID
+                for diagnosis, diagnosisID in zip(diagnoses, diagnosisIDs):
+                    diagnosis.diagnosisID = diagnosisID
+
+                with statements.record("bulk.copyPatients") as run, cursor.copy(statements.sql("bulk.copyPatients")) as copy:
+                    for patient in newPatients:
+                        copy.write_row((patient.patientID, patient.name, patient.age, patient.gender, patient.height, patient.weight))
+                    run.rows = len(newPatients)
+
+                with statements.record("bulk.copyDiagnoses") as run, cursor.copy(statements.sql("bulk.copyDiagnoses")) as copy:
+                    for diagnosis in diagnoses:
+                        copy.write_row((diagnosis.diagnosisID, diagnosis.patientID, int(diagnosis.level)))
+                    run.rows = len(diagnoses)
+            return True
+        except Exception as e:
+            print(e)
+            for patient in newPatients:
+                patient.patientID = None
+            for diagnosis in diagnoses:
+                diagnosis.diagnosisID = None
+
+        return False
+
+    def iterExportRows(self, sinceDiagnosisID: int | None = None, itersize: int | None = None, sinceSnapshot: str | None = None, onSnapshot: Callable[[str], None] | None = None) -> Iterator[tuple[Any, ...]]:
+        """
+        Stream every patient joined with their diagnosis history with a server-side cursor, one row per diagnosis, columns as in BulkDAO.exportColumns. Diagnosis codes are decoded to their labels.
+        Rows are read in a repeatable read transaction, so the whole stream comes from one snapshot of the database.
+
+        Parameters:
+            sinceDiagnosisID (```int | None```): If given, only diagnoses with a greater diagnosis ID are streamed, ordered by diagnosis ID. Otherwise every patient is streamed, ordered by patient ID, with a row of null diagnosis columns for patients without diagnoses.
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is BulkDAO.itersize.
+            sinceSnapshot (```str | None```): If given, only diagnoses committed after this snapshot was taken (not visible in it) are streamed, ordered by diagnosis ID. Takes precedence over sinceDiagnosisID.
+            onSnapshot (```Callable```[[```str```], ```None```] | ```None```): Called with the snapshot the rows are read from before the first row is yielded, to pass as sinceSnapshot to the next incremental export.
+
+        Returns:
+            (```Iterator```[```tuple```[```Any```, ...]]): Iterator over the export rows.
+        """
+        with connectionUtil.transaction() as conn, conn.cursor() as cursor, conn.cursor(name="export_stream") as stream:
+            statements.execute(cursor, "bulk.repeatableRead")
+            snapshot: str = statements.execute(cursor, "bulk.currentSnapshot").fetchone()[0]
+            if onSnapshot is not None:
+                onSnapshot(snapshot)
+
+            stream.itersize = itersize or BulkDAO.itersize
+            rows: Iterator[tuple[Any, ...]]
+            if sinceSnapshot is not None:
+                rows = statements.stream(stream, "bulk.exportSinceSnapshot", (sinceSnapshot, sinceSnapshot))
+            elif sinceDiagnosisID is not None:
+                rows = statements.stream(stream, "bulk.exportSince", (sinceDiagnosisID,))
+            else:
+                rows = statements.stream(stream, "bulk.exportAll")
+
+            for row in rows:
+                level: DiagnosisLevel | None = DiagnosisLevel.of(row[-1])
+                yield row[:-1] + (None if level is None else level.label,)
+
+    def __reserveIDs(self, cursor: "psycopg.Cursor", table: str, column: str, count: int) -> List[int]:
+        """
+        Reserve count values from the serial sequence of table.column.
+
+        Parameters:
+            cursor (```psycopg.Cursor```): Cursor of the transaction the IDs are used in.
+            table (```str```): Table name.
+            column (```str```): Serial column name.
+            count (```int```): Number of IDs to reserve.
+
+        Returns:
+            (```List```[```int```]): Reserved IDs in ascending order.
+        """
+        if count == 0:
+            return []
+        statements.execute(cursor, "bulk.reserveIDs", (table, column, count))
+        rs: List[tuple[Any, ...]] = cursor.fetchall()
+        return [tup[0] for tup in rs]
@@ -1,23 +1,24 @@
 
-from typing import Any, ClassVar, List
-import psycopg
-from dao.patientDAO import PatientDAO
+from typing import Any, ClassVar, Iterator, List
 
-from models.diagnosis import Diagnosis
+from models.diagnosis import Diagnosis, DiagnosisLevel
+from models.diagnosisFrame import DiagnosisFrame
+from models.patient import Patient
+from dao.statementRegistry import statements
+from dao.storage import DiagnosisStorage
 from utils import connectionUtil
 
 
-class DiagnosisDAO:
+class DiagnosisDAO(DiagnosisStorage):
     """
-    Access diagnosis information in the database and return as a diagnosis object. Save diagnosis information in the database by passing in diagnosis object.
+    Access diagnosis information in the PostgreSQL database and return as a diagnosis object. Save diagnosis information in the database by passing in diagnosis object.
+    Every method borrows its own pooled connection and cursor for the duration of the call, so one DAO can be shared by many threads.
 
     Attributes:
-        (```class```) conn (```psycopg.Connection | None```): Connection to the database or None if no connection or connection was closed.
-        (```class```) cursor (```psycopg.Cursor | None```): Cursor to perform actions on database and return data from database or None if no cursor or cursor was closed.
+        (```class```) itersize (```int```): Default number of rows fetched per round-trip by the streaming iter* methods.
     """
 
-    conn: ClassVar[psycopg.Connection | None] = None
-    cursor: ClassVar[psycopg.Cursor | None] = None
+    itersize: ClassVar[int] = 1000
 
     def __init__(self) -> None:
         """
@@ -34,27 +35,95 @@ class DiagnosisDAO:
         """
         diagnosisList: List[Diagnosis] = []
         try:
-            DiagnosisDAO.conn = connectionUtil.getConnection()
-            DiagnosisDAO.cursor = DiagnosisDAO.conn.cursor()
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "diagnosis.getAll")
 
-            sql: str = """SELECT * FROM diagnosis;"""
-            DiagnosisDAO.cursor.execute(sql)
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                for tup in rs:
+                    diagnosisID: int; patientID: int; finalDiagnosis: int
+                    diagnosisID, patientID, finalDiagnosis = tup
 
-            rs: List[tuple[Any, ...]] = DiagnosisDAO.cursor.fetchall()
-            for tup in rs:
-                diagnosisID: int; patientID: int; finalDiagnosis: str
-                diagnosisID, patientID, finalDiagnosis = tup
+                    diagnosis: Diagnosis = Diagnosis(finalDiagnosis, patientID, diagnosisID)
 
-                diagnosis: Diagnosis = Diagnosis(finalDiagnosis, patientID, diagnosisID)
+                    diagnosisList.append(diagnosis)
+        except Exception as e:
+            print(e)
+        return diagnosisList
+
+    def getDiagnosesPage(self, afterDiagnosisID: int | None, limit: int) -> List[Diagnosis]:
+        """
+        Get one page of diagnoses ordered by diagnosis ID, using the diagnosis ID of the last diagnosis of the previous page as a keyset instead of OFFSET.
+
+        Parameters:
+            afterDiagnosisID (```int | None```): Diagnosis ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of diagnoses to return.
+
+        Returns:
+            (```List```[```Diagnosis```]): Diagnoses with a diagnosis ID greater than afterDiagnosisID. Empty list if there are none.
+        """
+        diagnosisList: List[Diagnosis] = []
+        try:
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "diagnosis.getPage", (afterDiagnosisID or 0, limit))
 
-                diagnosisList.append(diagnosis)
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                for tup in rs:
+                    diagnosisID: int; patientID: int; finalDiagnosis: int
+                    diagnosisID, patientID, finalDiagnosis = tup
 
+                    diagnosisList.append(Diagnosis(finalDiagnosis, patientID, diagnosisID))
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
         return diagnosisList
 
+    def iterAllDiagnosis(self, itersize: int | None = None) -> Iterator[Diagnosis]:
+        """
+        Stream all diagnoses information from the database with a server-side cursor, so memory stays bounded by itersize rather than table size.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is DiagnosisDAO.itersize.
+
+        Returns:
+            (```Iterator```[```Diagnosis```]): Iterator over all diagnoses as diagnosis objects, ordered by diagnosis ID. If the query fails, the error is raised, even after some rows were yielded.
+        """
+        try:
+            with connectionUtil.connection() as conn, conn.transaction(), conn.cursor(name="diagnosis_stream") as cursor:
+                cursor.itersize = itersize or DiagnosisDAO.itersize
+
+                for tup in statements.stream(cursor, "diagnosis.getAllOrdered"):
+                    diagnosisID: int; patientID: int; finalDiagnosis: int
+                    diagnosisID, patientID, finalDiagnosis = tup
+
+                    yield Diagnosis(finalDiagnosis, patientID, diagnosisID)
+        except Exception as e:
+            # Re-raised so a stream cut short is not mistaken for the whole table.
+            print(e)
+            raise
+
+    def getAllDiagnosisFrame(self, itersize: int | None = None) -> DiagnosisFrame:
+        """
+        Get all diagnoses information from the database as a columnar DiagnosisFrame, filled straight from a server-side cursor without building a Diagnosis object per row.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is DiagnosisDAO.itersize.
+
+        Returns:
+            (```DiagnosisFrame```): All diagnoses, ordered by diagnosis ID. If database is empty or the query failed, return empty frame.
+        """
+        frame: DiagnosisFrame = DiagnosisFrame()
+        try:
+            with connectionUtil.connection() as conn, conn.transaction(), conn.cursor(name="diagnosis_frame") as cursor:
+                cursor.itersize = itersize or DiagnosisDAO.itersize
+
+                for tup in statements.stream(cursor, "diagnosis.getAllOrdered"):
+                    frame.appendRow(tup)
+        except Exception as e:
+            print(e)
+            # Not the rows read before the failure, which would pass for the whole table.
+            return DiagnosisFrame()
+
+        return frame
+
     def getDiagnosesByPatientID(self, patientID: int) -> List[Diagnosis]:
         """
         Get all diagnoses for patient ID.
@@ -67,25 +136,19 @@ class DiagnosisDAO:
         """
         diagnosisList: List[Diagnosis] = []
         try:
-            DiagnosisDAO.conn = connectionUtil.getConnection()
-            DiagnosisDAO.cursor = DiagnosisDAO.conn.cursor()
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "diagnosis.getByPatientID", (patientID,))
 
-            sql: str = """SELECT * FROM diagnosis WHERE patient_id = %s;"""
-            DiagnosisDAO.cursor.execute(sql, (patientID,))
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                for tup in rs:
+                    diagnosisID: int; patient_ID: int; finalDiagnosis: int
+                    diagnosisID, patient_ID, finalDiagnosis = tup
 
-            rs: List[tuple[Any, ...]] = DiagnosisDAO.cursor.fetchall()
-            for tup in rs:
-                diagnosisID: int; patient_ID: int; finalDiagnosis: str
-                diagnosisID, patient_ID, finalDiagnosis = tup
-
-                diagnosis: Diagnosis = Diagnosis(finalDiagnosis, patient_ID, diagnosisID)
-
-                diagnosisList.append(diagnosis)
+                    diagnosis: Diagnosis = Diagnosis(finalDiagnosis, patient_ID, diagnosisID)
 
+                    diagnosisList.append(diagnosis)
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
         return diagnosisList
 
     def getDiagnosisByID(self, diagnosisID: int) -> Diagnosis | None:
@@ -100,24 +163,19 @@ class DiagnosisDAO:
         """
         diagnosis: Diagnosis | None = None
         try:
-            DiagnosisDAO.conn = connectionUtil.getConnection()
-            DiagnosisDAO.cursor = DiagnosisDAO.conn.cursor()
-
-            sql: str = """SELECT * FROM diagnosis WHERE diagnosis_id = %s;"""
-            DiagnosisDAO.cursor.execute(sql, (diagnosisID,))
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "diagnosis.getByID", (diagnosisID,))
 
-            rs: List[tuple[Any, ...]] = DiagnosisDAO.cursor.fetchall()
-            if len(rs) > 1:
-                return diagnosis
-            for tup in rs:
-                diagnosis_ID: int; patient_ID: int; finalDiagnosis: str
-                diagnosis_ID, patient_ID, finalDiagnosis = tup
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                if len(rs) > 1:
+                    return diagnosis
+                for tup in rs:
+                    diagnosis_ID: int; patient_ID: int; finalDiagnosis: int
+                    diagnosis_ID, patient_ID, finalDiagnosis = tup
 
-                diagnosis = Diagnosis(finalDiagnosis, patient_ID, diagnosis_ID)
+                    diagnosis = Diagnosis(finalDiagnosis, patient_ID, diagnosis_ID)
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
 
         return diagnosis
 
@@ -132,27 +190,76 @@ class DiagnosisDAO:
             (```Diagnosis```): Diagnosis object with diagnosisID from database.
         """
         patientID: int = diagnosis.patientID
-        finalDiagnosis: str = diagnosis.diagnosis
+        finalDiagnosis: DiagnosisLevel = diagnosis.level
 
         try:
-            DiagnosisDAO.conn = connectionUtil.getConnection()
-            DiagnosisDAO.cursor = DiagnosisDAO.conn.cursor()
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "diagnosis.add", (patientID, finalDiagnosis))
+
+                if cursor.rowcount > 0:
+                    diagnosisID: int = cursor.fetchone()[0]
+                    diagnosis.diagnosisID = diagnosisID
+                    return diagnosis
+                else:
+                    return None
+        except Exception as e:
+            print(e)
+        
+        return None
 
-            sql: str = """INSERT INTO diagnosis(patient_id, diagnosis) VALUES (%s, %s) RETURNING *;"""
-            DiagnosisDAO.cursor.execute(sql, (patientID, finalDiagnosis))
+    def addDiagnoses(self, diagnoses: List[Diagnosis]) -> List[Diagnosis] | None:
+        """
+        Add many diagnoses to database in one transaction. The inserts are sent with executemany in pipeline mode, so the batch costs one connection and about one round-trip instead of one per diagnosis.
 
-            if DiagnosisDAO.cursor.rowcount > 0:
-                diagnosisID: int = DiagnosisDAO.cursor.fetchone()[0]
+        Parameters:
+            diagnoses (```List```[```Diagnosis```]): Diagnosis objects (No diagnosisID!) to add to database.
+
+        Returns:
+            (```List```[```Diagnosis```] | None): The same diagnosis objects with their diagnosisID from database, in input order, or None if nothing was saved.
+        """
+        if len(diagnoses) == 0:
+            return []
+
+        try:
+            with connectionUtil.transaction() as conn, conn.cursor() as cursor:
+                statements.executemany(cursor, "diagnosis.add", [(diagnosis.patientID, diagnosis.level) for diagnosis in diagnoses], returning=True)
+
+                diagnosisIDs: List[int] = []
+                for _ in diagnoses:
+                    diagnosisIDs.append(cursor.fetchone()[0])
+                    cursor.nextset()
+            for diagnosis, diagnosisID in zip(diagnoses, diagnosisIDs):
                 diagnosis.diagnosisID = diagnosisID
-                return diagnosis
-            else:
-                return None
-            
+            return diagnoses
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
-        
+
+        return None
+
+    def addPatientAndDiagnosis(self, patient: Patient, diagnosis: Diagnosis) -> tuple[Patient, Diagnosis] | None:
+        """
+        Add a new patient and their diagnosis to database atomically, in one statement on one connection. Either both rows are saved or neither is.
+
+        Parameters:
+            patient (```Patient```): Patient object (No patientID!) to add to database.
+            diagnosis (```Diagnosis```): Diagnosis object (No diagnosisID or patientID!) to add to database for patient.
+
+        Returns:
+            (```tuple```[```Patient```, ```Diagnosis```] | None): Patient with patientID and diagnosis with diagnosisID and patientID from database, or None if nothing was saved.
+        """
+        try:
+            with connectionUtil.transaction() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "diagnosis.addWithPatient", (patient.name, patient.age, patient.gender, patient.height, patient.weight, diagnosis.level))
+
+                row: tuple[Any, ...] | None = cursor.fetchone()
+                if row is None:
+                    return None
+                patient.patientID, diagnosis.diagnosisID = row
+                diagnosis.patientID = patient.patientID
+                return (patient, diagnosis)
+        except Exception as e:
+            print(e)
+
         return None
 
     def updateDiagnosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
@@ -166,27 +273,45 @@ class DiagnosisDAO:
             (```Diagnosis | None```): Updated diagnosis if update was successful or None otherwise.
         """
         patientID: int = diagnosis.patientID
-        finalDiagnosis: str = diagnosis.diagnosis
+        finalDiagnosis: DiagnosisLevel = diagnosis.level
         diagnosisID: int = diagnosis.diagnosisID
 
         try:
-            DiagnosisDAO.conn = connectionUtil.getConnection()
-            DiagnosisDAO.cursor = DiagnosisDAO.conn.cursor()
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "diagnosis.update", (patientID, finalDiagnosis, diagnosisID))
 
-            sql: str = """UPDATE diagnosis SET patient_id = %s, diagnosis = %s WHERE diagnosis_id = %s RETURNING *;"""
-            DiagnosisDAO.cursor.execute(sql, (patientID, finalDiagnosis, diagnosisID))
+                checkDiagnosis: tuple[Any, ...] | None = cursor.fetchone()
 
-            checkDiagnosis: tuple[Any, ...] | None = DiagnosisDAO.cursor.fetchone()
+                if checkDiagnosis is not None:
+                    diagnosis.diagnosisID, diagnosis.patientID, diagnosis.diagnosis = checkDiagnosis
+                    return diagnosis
+                else:
+                    return None
+        except Exception as e:
+            print(e)
 
-            if checkDiagnosis is not None:
-                diagnosis.diagnosisID, diagnosis.patientID, diagnosis.diagnosis = checkDiagnosis
-                return diagnosis
-            else:
-                return None
+        return None
+
+    def updateDiagnosisIfPatientExists(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Update diagnosis in database only if both the diagnosis and its patient exist, checked by the UPDATE statement itself instead of separate lookups.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diangosis to update in database.
+
+        Returns:
+            (```Diagnosis | None```): Updated diagnosis if update was successful, or None if the diagnosis or patient does not exist or the update failed.
+        """
+        try:
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "diagnosis.updateIfPatientExists", (diagnosis.patientID, diagnosis.level, diagnosis.diagnosisID, diagnosis.patientID))
+
+                checkDiagnosis: tuple[Any, ...] | None = cursor.fetchone()
+                if checkDiagnosis is not None:
+                    diagnosis.diagnosisID, diagnosis.patientID, diagnosis.diagnosis = checkDiagnosis
+                    return diagnosis
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
 
         return None
 
@@ -201,36 +326,38 @@ class DiagnosisDAO:
             (```bool```): True if diagnosis at diagnosis ID was deleted, False otherwise.
         """
         try:
-            DiagnosisDAO.conn = connectionUtil.getConnection()
-            DiagnosisDAO.cursor = DiagnosisDAO.conn.cursor()
-
-            sql: str = """DELETE FROM diagnosis WHERE diagnosis_id = %s;"""
-            DiagnosisDAO.cursor.execute(sql, (diagnosisID,))
-
-            rowCount: int = DiagnosisDAO.cursor.rowcount
-            if rowCount > 0:
-                return True
-            else:
-                return False
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "diagnosis.delete", (diagnosisID,))
+
+                rowCount: int = cursor.rowcount
+                if rowCount > 0:
+                    return True
+                else:
+                    return False
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
 
         return False
 
-    def __closeResources(self) -> None:
+    def deleteDiagnoses(self, diagnosisIDs: List[int]) -> int:
         """
-        Close cursor and conn resources if they are open.
+        Delete many diagnoses in database in one transaction, sent with executemany in pipeline mode.
+
+        Parameters:
+            diagnosisIDs (```List```[```int```]): Diagnosis IDs.
+
+        Returns:
+            (```int```): Number of diagnoses deleted. IDs without a diagnosis are skipped.
         """
+        if len(diagnosisIDs) == 0:
+            return 0
+
         try:
-            if DiagnosisDAO.cursor is not None:
-                DiagnosisDAO.cursor.close()
+            with connectionUtil.transaction() as conn, conn.cursor() as cursor:
+                statements.executemany(cursor, "diagnosis.delete", [(diagnosisID,) for diagnosisID in diagnosisIDs])
+
+                return cursor.rowcount
         except Exception as e:
             print(e)
 
-        try:
-            if DiagnosisDAO.conn is not None:
-                DiagnosisDAO.conn.close()
-        except Exception as e:
-            print(e)
\ No newline at end of file
+        return 0
@@ -0,0 +1,637 @@
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+from dao.statementRegistry import StatementRun, statements
+from dao.storage import DiagnosisStorage, PatientStorage
+from models.diagnosis import Diagnosis, DiagnosisLevel
+from models.patient import Patient
+
+
+def searchNameOf(text: str) -> str:
+    """
+    Lowercase text one character at a time, like PostgreSQL's lower(). Unlike str.lower(), which turns a final Σ into ς, a prefix then always lowercases to a prefix of the lowercase names it starts.
+
+    Parameters:
+        text (```str```): Name or name prefix.
+
+    Returns:
+        (```str```): Lowercase text, used to match and order name searches.
+    """
+    return "".join(character.lower() for character in text)
+
+
+class MemoryDatabase:
+    """
+    Patient and diagnosis tables held in process memory, for tests, benchmarks and kiosks that do not need data to outlive the process.
+    Rows are stored as tuples laid out like the database tables, so objects handed out by the DAOs never alias stored data. One lock guards every read and write, and each DAO operation is recorded in utils.metrics like a database statement.
+
+    Attributes:
+        patients (```Dict```[```int```, ```tuple```[```Any```, ...]]): Patient rows (patient_id, name, age, gender, height, weight) by patient ID, in ID order.
+        diagnoses (```Dict```[```int```, ```tuple```[```Any```, ...]]): Diagnosis rows (diagnosis_id, patient_id, diagnosis) by diagnosis ID, in ID order.
+        diagnosisIDsByPatient (```Dict```[```int```, ```List```[```int```]]): Diagnosis IDs of each patient, in ID order, the in-memory counterpart of the diagnosis(patient_id) index.
+        lock (```threading.RLock```): Lock held for every operation on the tables.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for MemoryDatabase class. Creates empty tables.
+        """
+        self.patients: Dict[int, tuple[Any, ...]] = {}
+        self.diagnoses: Dict[int, tuple[Any, ...]] = {}
+        self.diagnosisIDsByPatient: Dict[int, List[int]] = {}
+        self.lock: threading.RLock = threading.RLock()
+        self.__lastPatientID: int = 0
+        self.__lastDiagnosisID: int = 0
+
+    @contextmanager
+    def use(self, name: str) -> Iterator[StatementRun]:
+        """
+        Hold the lock for one operation on the tables, recorded in utils.metrics under name.
+
+        Parameters:
+            name (```str```): Statement name to record the operation under.
+
+        Returns:
+            (```Iterator```[```StatementRun```]): Context manager giving the run, to set the rows the operation returned or affected.
+        """
+        with self.lock, statements.record(name) as run:
+            yield run
+
+    def nextPatientID(self) -> int:
+        """
+        Generate the next patient ID, like the patient_id serial sequence.
+
+        Returns:
+            (```int```): New patient ID.
+        """
+        self.__lastPatientID += 1
+        return self.__lastPatientID
+
+    def nextDiagnosisID(self) -> int:
+        """
+        Generate the next diagnosis ID, like the diagnosis_id serial sequence.
+
+        Returns:
+            (```int```): New diagnosis ID.
+        """
+        self.__lastDiagnosisID += 1
+        return self.__lastDiagnosisID
+
+    def patientOf(self, row: tuple[Any, ...]) -> Patient:
+        """
+        Build a patient object from a patient row.
+
+        Parameters:
+            row (```tuple```[```Any```, ...]): Patient row.
+
+        Returns:
+            (```Patient```): New patient object.
+        """
+        patientID, name, age, gender, height, weight = row
+        return Patient(name, age, gender, height, weight, patientID)
+
+    def diagnosisOf(self, row: tuple[Any, ...]) -> Diagnosis:
+        """
+        Build a diagnosis object from a diagnosis row.
+
+        Parameters:
+            row (```tuple```[```Any```, ...]): Diagnosis row.
+
+        Returns:
+            (```Diagnosis```): New diagnosis object.
+        """
+        diagnosisID, patientID, level = row
+        return Diagnosis(level, patientID, diagnosisID)
+
+    def diagnosesOf(self, patientID: int) -> List[Diagnosis]:
+        """
+        Build the diagnosis objects of a patient.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```List```[```Diagnosis```]): Diagnoses of the patient ordered by diagnosis ID.
+        """
+        return [self.diagnosisOf(self.diagnoses[diagnosisID]) for diagnosisID in self.diagnosisIDsByPatient.get(patientID, [])]
+
+    def insertDiagnosis(self, diagnosis: Diagnosis) -> int:
+        """
+        Insert a diagnosis row, checking the same constraints as the diagnosis table.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis to insert.
+
+        Returns:
+            (```int```): New diagnosis ID.
+        """
+        self.checkDiagnosis(diagnosis.patientID, diagnosis.level)
+        diagnosisID: int = self.nextDiagnosisID()
+        self.diagnoses[diagnosisID] = (diagnosisID, diagnosis.patientID, int(diagnosis.level))
+        self.diagnosisIDsByPatient.setdefault(diagnosis.patientID, []).append(diagnosisID)
+        return diagnosisID
+
+    def insertPatient(self, patient: Patient) -> int:
+        """
+        Insert a patient row.
+
+        Parameters:
+            patient (```Patient```): Patient to insert.
+
+        Returns:
+            (```int```): New patient ID.
+        """
+        patientID: int = self.nextPatientID()
+        self.patients[patientID] = (patientID, patient.name, patient.age, patient.gender, patient.height, patient.weight)
+        return patientID
+
+    def updateDiagnosis(self, diagnosis: Diagnosis) -> bool:
+        """
+        Update a diagnosis row, checking the same constraints as the diagnosis table.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis to update, with its diagnosis ID.
+
+        Returns:
+            (```bool```): True if the diagnosis existed and was updated, False otherwise.
+        """
+        row: tuple[Any, ...] | None = self.diagnoses.get(diagnosis.diagnosisID)
+        if row is None:
+            return False
+        self.checkDiagnosis(diagnosis.patientID, diagnosis.level)
+        if row[1] != diagnosis.patientID:
+            self.diagnosisIDsByPatient[row[1]].remove(diagnosis.diagnosisID)
+            patientDiagnosisIDs: List[int] = self.diagnosisIDsByPatient.setdefault(diagnosis.patientID, [])
+            patientDiagnosisIDs.append(diagnosis.diagnosisID)
+            patientDiagnosisIDs.sort()
+        self.diagnoses[diagnosis.diagnosisID] = (diagnosis.diagnosisID, diagnosis.patientID, int(diagnosis.level))
+        return True
+
+    def deleteDiagnosis(self, diagnosisID: int) -> bool:
+        """
+        Delete a diagnosis row.
+
+        Parameters:
+            diagnosisID (```int```): ID of the diagnosis to delete.
+
+        Returns:
+            (```bool```): True if the diagnosis existed and was deleted, False otherwise.
+        """
+        row: tuple[Any, ...] | None = self.diagnoses.pop(diagnosisID, None)
+        if row is None:
+            return False
+        self.diagnosisIDsByPatient[row[1]].remove(diagnosisID)
+        return True
+
+    def checkDiagnosis(self, patientID: int | None, level: DiagnosisLevel | None) -> None:
+        """
+        Check a diagnosis row against the constraints of the diagnosis table: the diagnosis is a DiagnosisLevel and the patient exists.
+
+        Parameters:
+            patientID (```int | None```): Patient ID of the diagnosis.
+            level (```DiagnosisLevel | None```): Diagnosis level.
+        """
+        if level is None:
+            raise ValueError("diagnosis is not a valid DiagnosisLevel")
+        if patientID is not None and patientID not in self.patients:
+            raise LookupError(f"Patient {patientID} does not exist")
+
+
+class MemoryPatientDAO(PatientStorage):
+    """
+    Patient storage in a MemoryDatabase.
+
+    Attributes:
+        database (```MemoryDatabase```): Tables the patients are stored in, shared with MemoryDiagnosisDAO.
+    """
+
+    def __init__(self, database: MemoryDatabase) -> None:
+        """
+        Constructor for MemoryPatientDAO class.
+
+        Parameters:
+            database (```MemoryDatabase```): Tables to store patients in.
+        """
+        self.database: MemoryDatabase = database
+
+    def getAllPatients(self) -> List[Patient]:
+        """
+        Get all patient information from the database.
+
+        Returns:
+            (```List```[```Patient```]): List of all patients and their information as patient objects, ordered by patient ID. If database is empty, return empty list.
+        """
+        with self.database.use("memory.patient.getAll") as run:
+            patients: List[Patient] = [self.database.patientOf(row) for row in self.database.patients.values()]
+            run.rows = len(patients)
+        return patients
+
+    def getAllPatientsWithDiagnoses(self) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get all patients and their diagnoses from the database.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): List of all patients paired with their diagnoses, ordered by patient ID. Patients without diagnoses have an empty list. If database is empty, return empty list.
+        """
+        with self.database.use("memory.patient.getAllWithDiagnoses") as run:
+            patients: List[tuple[Patient, List[Diagnosis]]] = [(self.database.patientOf(row), self.database.diagnosesOf(patientID)) for patientID, row in self.database.patients.items()]
+            run.rows = len(patients)
+        return patients
+
+    def getPatientsPage(self, afterPatientID: int | None, limit: int) -> List[Patient]:
+        """
+        Get one page of patients ordered by patient ID, using the patient ID of the last patient of the previous page as a keyset.
+
+        Parameters:
+            afterPatientID (```int | None```): Patient ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of patients to return.
+
+        Returns:
+            (```List```[```Patient```]): Patients with a patient ID greater than afterPatientID. Empty list if there are none.
+        """
+        with self.database.use("memory.patient.getPage") as run:
+            patients: List[Patient] = [self.database.patientOf(row) for row in self.__pageRows(afterPatientID, limit)]
+            run.rows = len(patients)
+        return patients
+
+    def getPatientsWithDiagnosesPage(self, afterPatientID: int | None, limit: int) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get one page of patients and their diagnoses ordered by patient ID, using the patient ID of the last patient of the previous page as a keyset.
+
+        Parameters:
+            afterPatientID (```int | None```): Patient ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of patients to return.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): Patients with a patient ID greater than afterPatientID paired with their diagnoses. Empty list if there are none.
+        """
+        with self.database.use("memory.patient.getPageWithDiagnoses") as run:
+            patients: List[tuple[Patient, List[Diagnosis]]] = [(self.database.patientOf(row), self.database.diagnosesOf(row[0])) for row in self.__pageRows(afterPatientID, limit)]
+            run.rows = len(patients)
+        return patients
+
+    def getPatientByID(self, patientID: int) -> Patient | None:
+        """
+        Get patient by patientID.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```Patient | None```): Patient object, or None if there is no patient at patientID.
+        """
+        with self.database.use("memory.patient.getByID") as run:
+            row: tuple[Any, ...] | None = self.database.patients.get(patientID)
+            run.rows = 0 if row is None else 1
+        return None if row is None else self.database.patientOf(row)
+
+    def getExistingPatientIDs(self, patientIDs: List[int]) -> set[int]:
+        """
+        Find which of many patient IDs are for real, existing patients.
+
+        Parameters:
+            patientIDs (```List```[```int```]): Patient IDs to check.
+
+        Returns:
+            (```set```[```int```]): The patient IDs that exist. Empty set if none exist.
+        """
+        with self.database.use("memory.patient.getExistingIDs") as run:
+            existing: set[int] = {patientID for patientID in patientIDs if patientID in self.database.patients}
+            run.rows = len(existing)
+        return existing
+
+    def searchPatientsByName(self, namePrefix: str, limit: int, after: tuple[str, int] | None = None) -> List[tuple[Patient, str]]:
+        """
+        Get patients whose name starts with namePrefix (case-insensitive), ordered by lowercase name then patient ID.
+        Paged with a keyset: pass the lowercase name and patient ID of the last patient of the previous page as after.
+
+        Parameters:
+            namePrefix (```str```): Start of the patient name.
+            limit (```int```): Maximum number of patients to return.
+            after (```tuple```[```str```, ```int```] | None): Lowercase name and patient ID to continue after, or None for the first page.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```str```]]): Matching patients, each with its lowercase name. Empty list if there are none.
+        """
+        prefix: str = searchNameOf(namePrefix)
+        with self.database.use("memory.patient.searchByName") as run:
+            keys: List[tuple[str, int]] = [key for key in ((searchNameOf(row[1]), row[0]) for row in self.database.patients.values()) if key[0].startswith(prefix)]
+            if after is not None:
+                keys = [key for key in keys if key > after]
+            keys.sort()
+            patients: List[tuple[Patient, str]] = [(self.database.patientOf(self.database.patients[patientID]), searchName) for searchName, patientID in keys[:limit]]
+            run.rows = len(patients)
+        return patients
+
+    def addPatient(self, patient: Patient) -> Patient | None:
+        """
+        Add patient to database.
+
+        Parameters:
+            patient (```Patient```): Patient object (No patientID!) to add to database.
+
+        Returns:
+            (```Patient | None```): Patient object with patientID from database.
+        """
+        with self.database.use("memory.patient.add") as run:
+            patient.patientID = self.database.insertPatient(patient)
+            run.rows = 1
+        return patient
+
+    def addPatients(self, patients: List[Patient]) -> List[Patient] | None:
+        """
+        Add many patients to database under one hold of the lock. If any insert fails, nothing is saved.
+
+        Parameters:
+            patients (```List```[```Patient```]): Patient objects (No patientID!) to add to database.
+
+        Returns:
+            (```List```[```Patient```] | None): The same patient objects with their patientID from database, in input order, or None if nothing was saved.
+        """
+        with self.database.use("memory.patient.addMany") as run:
+            for patient in patients:
+                patient.patientID = self.database.insertPatient(patient)
+            run.rows = len(patients)
+        return patients
+
+    def updatePatient(self, patient: Patient) -> Patient | None:
+        """
+        Update patient in database.
+
+        Parameters:
+            patient (```Patient```): Patient and their information to update in database.
+
+        Returns:
+            (```Patient | None```): Updated patient if update was successful or None otherwise.
+        """
+        with self.database.use("memory.patient.update") as run:
+            run.rows = 0
+            if patient.patientID not in self.database.patients:
+                return None
+            self.database.patients[patient.patientID] = (patient.patientID, patient.name, patient.age, patient.gender, patient.height, patient.weight)
+            run.rows = 1
+        return patient
+
+    def updatePatients(self, patients: List[Patient]) -> List[Patient] | None:
+        """
+        Update many patients in database under one hold of the lock. If any patient does not exist, nothing is updated.
+
+        Parameters:
+            patients (```List```[```Patient```]): Patients and their information to update in database.
+
+        Returns:
+            (```List```[```Patient```] | None): The same patient objects as updated in database, in input order, or None if nothing was updated.
+        """
+        with self.database.use("memory.patient.updateMany") as run:
+            run.rows = 0
+            if any(patient.patientID not in self.database.patients for patient in patients):
+                return None
+            for patient in patients:
+                self.database.patients[patient.patientID] = (patient.patientID, patient.name, patient.age, patient.gender, patient.height, patient.weight)
+            run.rows = len(patients)
+        return patients
+
+    def deletePatient(self, patientID: int) -> bool:
+        """
+        Delete patient at patientID in database. A patient with diagnoses is not deleted.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```bool```): True if patient at patient ID was deleted, False otherwise.
+        """
+        with self.database.use("memory.patient.delete") as run:
+            run.rows = 0
+            if patientID not in self.database.patients or len(self.database.diagnosisIDsByPatient.get(patientID, [])) > 0:
+                return False
+            del self.database.patients[patientID]
+            self.database.diagnosisIDsByPatient.pop(patientID, None)
+            run.rows = 1
+            return True
+
+    def __pageRows(self, afterPatientID: int | None, limit: int) -> List[tuple[Any, ...]]:
+        """
+        Patient rows of one page, in patient ID order. The caller holds the lock.
+
+        Parameters:
+            afterPatientID (```int | None```): Patient ID the previous page ended with, or None for the first page.
+            limit (```int```): Maximum number of rows.
+
+        Returns:
+            (```List```[```tuple```[```Any```, ...]]): Patient rows of the page.
+        """
+        return [row for row in self.database.patients.values() if row[0] > (afterPatientID or 0)][:limit]
+
+class MemoryDiagnosisDAO(DiagnosisStorage):
+    """
+    Diagnosis storage in a MemoryDatabase.
+
+    Attributes:
+        database (```MemoryDatabase```): Tables the diagnoses are stored in, shared with MemoryPatientDAO.
+    """
+
+    def __init__(self, database: MemoryDatabase) -> None:
+        """
+        Constructor for MemoryDiagnosisDAO class.
+
+        Parameters:
+            database (```MemoryDatabase```): Tables to store diagnoses in.
+        """
+        self.database: MemoryDatabase = database
+
+    def getAllDiagnosis(self) -> List[Diagnosis]:
+        """
+        Get all diagnoses information from the database.
+
+        Returns:
+            (```List```[```Diagnosis```]): List of all diagnoses as diagnosis objects, ordered by diagnosis ID. If database is empty, return empty list.
+        """
+        with self.database.use("memory.diagnosis.getAll") as run:
+            diagnoses: List[Diagnosis] = [self.database.diagnosisOf(row) for row in self.database.diagnoses.values()]
+            run.rows = len(diagnoses)
+        return diagnoses
+
+    def getDiagnosesPage(self, afterDiagnosisID: int | None, limit: int) -> List[Diagnosis]:
+        """
+        Get one page of diagnoses ordered by diagnosis ID, using the diagnosis ID of the last diagnosis of the previous page as a keyset.
+
+        Parameters:
+            afterDiagnosisID (```int | None```): Diagnosis ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of diagnoses to return.
+
+        Returns:
+            (```List```[```Diagnosis```]): Diagnoses with a diagnosis ID greater than afterDiagnosisID. Empty list if there are none.
+        """
+        with self.database.use("memory.diagnosis.getPage") as run:
+            rows: List[tuple[Any, ...]] = [row for row in self.database.diagnoses.values() if row[0] > (afterDiagnosisID or 0)][:limit]
+            run.rows = len(rows)
+        return [self.database.diagnosisOf(row) for row in rows]
+
+    def getDiagnosesByPatientID(self, patientID: int) -> List[Diagnosis]:
+        """
+        Get all diagnoses for patient ID.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```List```[```Diagnosis```]): List of all diagnoses of the patient as diagnosis objects, ordered by diagnosis ID. Empty list if there are none.
+        """
+        with self.database.use("memory.diagnosis.getByPatientID") as run:
+            diagnoses: List[Diagnosis] = self.database.diagnosesOf(patientID)
+            run.rows = len(diagnoses)
+        return diagnoses
+
+    def getDiagnosisByID(self, diagnosisID: int) -> Diagnosis | None:
+        """
+        Get diagnosis for diagnosis ID.
+
+        Parameters:
+            diagnosisID (```int```): Diagnosis ID.
+
+        Returns:
+            (```Diagnosis | None```): Diagnosis object, or None if there is no diagnosis at diagnosisID.
+        """
+        with self.database.use("memory.diagnosis.getByID") as run:
+            row: tuple[Any, ...] | None = self.database.diagnoses.get(diagnosisID)
+            run.rows = 0 if row is None else 1
+        return None if row is None else self.database.diagnosisOf(row)
+
+    def addDignosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Add diagnosis to database. The diagnosis must have a valid level and, if it has a patientID, the patient must exist.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis object (No diagnosisID!) to add to database.
+
+        Returns:
+            (```Diagnosis | None```): Diagnosis object with diagnosisID from database, or None if it was not saved.
+        """
+        try:
+            with self.database.use("memory.diagnosis.add") as run:
+                diagnosis.diagnosisID = self.database.insertDiagnosis(diagnosis)
+                run.rows = 1
+            return diagnosis
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def addDiagnoses(self, diagnoses: List[Diagnosis]) -> List[Diagnosis] | None:
+        """
+        Add many diagnoses to database under one hold of the lock. If any diagnosis is rejected, nothing is saved.
+
+        Parameters:
+            diagnoses (```List```[```Diagnosis```]): Diagnosis objects (No diagnosisID!) to add to database.
+
+        Returns:
+            (```List```[```Diagnosis```] | None): The same diagnosis objects with their diagnosisID from database, in input order, or None if nothing was saved.
+        """
+        try:
+            with self.database.use("memory.diagnosis.addMany") as run:
+                for diagnosis in diagnoses:
+                    self.database.checkDiagnosis(diagnosis.patientID, diagnosis.level)
+                diagnosisIDs: List[int] = [self.database.insertDiagnosis(diagnosis) for diagnosis in diagnoses]
+                run.rows = len(diagnosisIDs)
+            for diagnosis, diagnosisID in zip(diagnoses, diagnosisIDs):
+                diagnosis.diagnosisID = diagnosisID
+            return diagnoses
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def addPatientAndDiagnosis(self, patient: Patient, diagnosis: Diagnosis) -> tuple[Patient, Diagnosis] | None:
+        """
+        Add a new patient and their diagnosis to database atomically, under one hold of the lock. Either both rows are saved or neither is.
+
+        Parameters:
+            patient (```Patient```): Patient object (No patientID!) to add to database.
+            diagnosis (```Diagnosis```): Diagnosis object (No diagnosisID or patientID!) to add to database for patient.
+
+        Returns:
+            (```tuple```[```Patient```, ```Diagnosis```] | None): Patient with patientID and diagnosis with diagnosisID and patientID from database, or None if nothing was saved.
+        """
+        try:
+            with self.database.use("memory.diagnosis.addWithPatient") as run:
+                self.database.checkDiagnosis(None, diagnosis.level)
+                patientID: int = self.database.insertPatient(patient)
+                diagnosis.patientID = patientID
+                diagnosis.diagnosisID = self.database.insertDiagnosis(diagnosis)
+                run.rows = 2
+            patient.patientID = patientID
+            return (patient, diagnosis)
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def updateDiagnosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Update diagnosis in database.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis to update in database.
+
+        Returns:
+            (```Diagnosis | None```): Updated diagnosis if update was successful or None otherwise.
+        """
+        try:
+            with self.database.use("memory.diagnosis.update") as run:
+                updated: bool = self.database.updateDiagnosis(diagnosis)
+                run.rows = int(updated)
+            return diagnosis if updated else None
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def updateDiagnosisIfPatientExists(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Update diagnosis in database only if both the diagnosis and its patient exist, checked under one hold of the lock.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis to update in database.
+
+        Returns:
+            (```Diagnosis | None```): Updated diagnosis if update was successful, or None if the diagnosis or patient does not exist or the update failed.
+        """
+        try:
+            with self.database.use("memory.diagnosis.updateIfPatientExists") as run:
+                updated: bool = diagnosis.patientID in self.database.patients and self.database.updateDiagnosis(diagnosis)
+                run.rows = int(updated)
+            return diagnosis if updated else None
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def deleteDiagnosis(self, diagnosisID: int) -> bool:
+        """
+        Delete diagnosis at diagnosisID in database.
+
+        Parameters:
+            diagnosisID (```int```): Diagnosis ID.
+
+        Returns:
+            (```bool```): True if diagnosis at diagnosis ID was deleted, False otherwise.
+        """
+        with self.database.use("memory.diagnosis.delete") as run:
+            deleted: bool = self.database.deleteDiagnosis(diagnosisID)
+            run.rows = int(deleted)
+        return deleted
+
+    def deleteDiagnoses(self, diagnosisIDs: List[int]) -> int:
+        """
+        Delete many diagnoses in database under one hold of the lock.
+
+        Parameters:
+            diagnosisIDs (```List```[```int```]): Diagnosis IDs.
+
+        Returns:
+            (```int```): Number of diagnoses deleted. IDs without a diagnosis are skipped.
+        """
+        with self.database.use("memory.diagnosis.deleteMany") as run:
+            run.rows = sum(self.database.deleteDiagnosis(diagnosisID) for diagnosisID in diagnosisIDs)
+        return run.rows
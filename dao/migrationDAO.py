@@ -0,0 +1,86 @@
+from typing import Any, ClassVar, List
+
+from dao.statementRegistry import statements
+from utils import connectionUtil
+
+
+class MigrationDAO:
+    """
+    Apply schema migrations to the database and track them in the schema_version table.
+
+    Attributes:
+        (```class```) lockKey (```int```): Key of the transaction-level advisory lock held while a migration is applied, so concurrent runners apply each migration once.
+    """
+
+    lockKey: ClassVar[int] = 7426911
+
+    def __init__(self) -> None:
+        """
+        Constructor for MigrationDAO class.
+        """
+        pass
+
+    def createVersionTable(self) -> bool:
+        """
+        Create the schema_version table if it does not exist.
+
+        Returns:
+            (```bool```): True if the table exists, False otherwise.
+        """
+        try:
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "migration.createVersionTable")
+                return True
+        except Exception as e:
+            print(e)
+
+        return False
+
+    def getAppliedVersions(self) -> List[int]:
+        """
+        Get the versions of all applied migrations.
+
+        Returns:
+            (```List```[```int```]): Applied versions in ascending order. Empty list if none are applied or schema_version does not exist.
+        """
+        versions: List[int] = []
+
+        try:
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "migration.getAppliedVersions")
+
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                versions = [tup[0] for tup in rs]
+        except Exception as e:
+            print(e)
+
+        return versions
+
+    def applyMigration(self, version: int, name: str, script: str) -> bool:
+        """
+        Run a migration script and record its version, in one transaction. Does nothing if the version is already recorded.
+
+        Parameters:
+            version (```int```): Migration version.
+            name (```str```): Migration name.
+            script (```str```): SQL of the migration. May hold several statements.
+
+        Returns:
+            (```bool```): True if the migration is applied (now or before), False if it failed and was rolled back.
+        """
+        try:
+            with connectionUtil.transaction() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "migration.lock", (self.lockKey,))
+                statements.execute(cursor, "migration.isApplied", (version,))
+                if cursor.fetchone() is not None:
+                    return True
+
+                # Scripts are not registered statements; each is recorded in utils.metrics under its own name.
+                with statements.record(f"migration.{version:03d}_{name}", cursor):
+                    cursor.execute(script)
+                statements.execute(cursor, "migration.record", (version, name))
+                return True
+        except Exception as e:
+            print(e)
+
+        return False
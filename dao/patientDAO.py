@@ -1,22 +1,24 @@
 
-from typing import Any, ClassVar, List
-import psycopg
+from typing import Any, ClassVar, Iterator, List
+from models.diagnosis import Diagnosis
 from models.patient import Patient
+from models.patientFrame import PatientFrame
 
+from dao.statementRegistry import statements
+from dao.storage import PatientStorage
 from utils import connectionUtil
 
 
-class PatientDAO:
+class PatientDAO(PatientStorage):
     """
-    Access patient information in the database and return as a patient object. Save patient information in the database by passing in patient object.
+    Access patient information in the PostgreSQL database and return as a patient object. Save patient information in the database by passing in patient object.
+    Every method borrows its own pooled connection and cursor for the duration of the call, so one DAO can be shared by many threads.
 
     Attributes:
-        (```class```) conn (```psycopg.Connection | None```): Connection to the database or None if no connection or connection was closed.
-        (```class```) cursor (```psycopg.Cursor | None```): Cursor to perform actions on database and return data from database or None if no cursor or cursor was closed.
+        (```class```) itersize (```int```): Default number of rows fetched per round-trip by the streaming iter* methods.
     """
 
-    conn: ClassVar[psycopg.Connection | None] = None
-    cursor: ClassVar[psycopg.Cursor | None] = None
+    itersize: ClassVar[int] = 1000
 
     def __init__(self) -> None:
         """
@@ -34,27 +36,196 @@ class PatientDAO:
         patientList: List[Patient] = []
 
         try:
-            PatientDAO.conn = connectionUtil.getConnection()
-            PatientDAO.cursor = PatientDAO.conn.cursor()
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "patient.getAll")
 
-            sql: str = """SELECT * FROM patient;"""
-            PatientDAO.cursor.execute(sql)
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                for tup in rs:
+                    patientID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    patientID, patientName, patientAge, patientGender, patientHeight, patientWeight = tup
 
-            rs: List[tuple[Any, ...]] = PatientDAO.cursor.fetchall()
-            for tup in rs:
-                patientID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
-                patientID, patientName, patientAge, patientGender, patientHeight, patientWeight = tup
+                    patient: Patient = Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patientID)
 
-                patient: Patient = Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patientID)
+                    patientList.append(patient)
+        except Exception as e:
+            print(e)
+
+        return patientList
+
+    def getPatientsPage(self, afterPatientID: int | None, limit: int) -> List[Patient]:
+        """
+        Get one page of patients ordered by patient ID, using the patient ID of the last patient of the previous page as a keyset instead of OFFSET.
+
+        Parameters:
+            afterPatientID (```int | None```): Patient ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of patients to return.
 
-                patientList.append(patient)
+        Returns:
+            (```List```[```Patient```]): Patients with a patient ID greater than afterPatientID. Empty list if there are none.
+        """
+        patientList: List[Patient] = []
+
+        try:
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "patient.getPage", (afterPatientID or 0, limit))
+
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                for tup in rs:
+                    patientID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    patientID, patientName, patientAge, patientGender, patientHeight, patientWeight = tup
+
+                    patientList.append(Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patientID))
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
 
         return patientList
 
+    def iterAllPatients(self, itersize: int | None = None) -> Iterator[Patient]:
+        """
+        Stream all patient information from the database with a server-side cursor, so memory stays bounded by itersize rather than table size.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is PatientDAO.itersize.
+
+        Returns:
+            (```Iterator```[```Patient```]): Iterator over all patients as patient objects, ordered by patient ID. If the query fails, the error is raised, even after some rows were yielded.
+        """
+        try:
+            with connectionUtil.connection() as conn, conn.transaction(), conn.cursor(name="patient_stream") as cursor:
+                cursor.itersize = itersize or PatientDAO.itersize
+
+                for tup in statements.stream(cursor, "patient.getAllOrdered"):
+                    patientID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    patientID, patientName, patientAge, patientGender, patientHeight, patientWeight = tup
+
+                    yield Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patientID)
+        except Exception as e:
+            # Re-raised so a stream cut short is not mistaken for the whole table.
+            print(e)
+            raise
+
+    def getAllPatientsFrame(self, itersize: int | None = None) -> PatientFrame:
+        """
+        Get all patient information from the database as a columnar PatientFrame, filled straight from a server-side cursor without building a Patient object per row.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is PatientDAO.itersize.
+
+        Returns:
+            (```PatientFrame```): All patients, ordered by patient ID. If database is empty or the query failed, return empty frame.
+        """
+        frame: PatientFrame = PatientFrame()
+        try:
+            with connectionUtil.connection() as conn, conn.transaction(), conn.cursor(name="patient_frame") as cursor:
+                cursor.itersize = itersize or PatientDAO.itersize
+
+                for tup in statements.stream(cursor, "patient.getAllOrdered"):
+                    frame.appendRow(tup)
+        except Exception as e:
+            print(e)
+            # Not the rows read before the failure, which would pass for the whole table.
+            return PatientFrame()
+
+        return frame
+
+    def getAllPatientsWithDiagnoses(self) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get all patients and their diagnoses from the database in a single query.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): List of all patients paired with their diagnoses, ordered by patient ID. Patients without diagnoses have an empty list. If database is empty, return empty list.
+        """
+        patientList: List[tuple[Patient, List[Diagnosis]]] = []
+
+        try:
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "patient.getAllWithDiagnoses")
+
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                for tup in rs:
+                    patientID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    diagnosisID: int | None; finalDiagnosis: int | None
+                    patientID, patientName, patientAge, patientGender, patientHeight, patientWeight, diagnosisID, finalDiagnosis = tup
+
+                    if len(patientList) == 0 or patientList[-1][0].patientID != patientID:
+                        patient: Patient = Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patientID)
+                        patientList.append((patient, []))
+
+                    if diagnosisID is not None:
+                        patientList[-1][1].append(Diagnosis(finalDiagnosis, patientID, diagnosisID))
+        except Exception as e:
+            print(e)
+
+        return patientList
+
+    def getPatientsWithDiagnosesPage(self, afterPatientID: int | None, limit: int) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get one page of patients and their diagnoses ordered by patient ID, using the patient ID of the last patient of the previous page as a keyset instead of OFFSET.
+
+        Parameters:
+            afterPatientID (```int | None```): Patient ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of patients to return.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): Patients with a patient ID greater than afterPatientID paired with their diagnoses. Empty list if there are none.
+        """
+        patientList: List[tuple[Patient, List[Diagnosis]]] = []
+
+        try:
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "patient.getPageWithDiagnoses", (afterPatientID or 0, limit))
+
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                for tup in rs:
+                    patientID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    diagnosisID: int | None; finalDiagnosis: int | None
+                    patientID, patientName, patientAge, patientGender, patientHeight, patientWeight, diagnosisID, finalDiagnosis = tup
+
+                    if len(patientList) == 0 or patientList[-1][0].patientID != patientID:
+                        patientList.append((Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patientID), []))
+
+                    if diagnosisID is not None:
+                        patientList[-1][1].append(Diagnosis(finalDiagnosis, patientID, diagnosisID))
+        except Exception as e:
+            print(e)
+
+        return patientList
+
+    def iterAllPatientsWithDiagnoses(self, itersize: int | None = None) -> Iterator[tuple[Patient, List[Diagnosis]]]:
+        """
+        Stream all patients and their diagnoses from the database with a server-side cursor, so memory stays bounded by itersize rather than table size.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is PatientDAO.itersize.
+
+        Returns:
+            (```Iterator```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): Iterator over all patients paired with their diagnoses, ordered by patient ID. If the query fails, the error is raised, even after some rows were yielded.
+        """
+        try:
+            with connectionUtil.connection() as conn, conn.transaction(), conn.cursor(name="patient_diagnosis_stream") as cursor:
+                cursor.itersize = itersize or PatientDAO.itersize
+
+                current: tuple[Patient, List[Diagnosis]] | None = None
+                for tup in statements.stream(cursor, "patient.getAllWithDiagnoses"):
+                    patientID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    diagnosisID: int | None; finalDiagnosis: int | None
+                    patientID, patientName, patientAge, patientGender, patientHeight, patientWeight, diagnosisID, finalDiagnosis = tup
+
+                    if current is None or current[0].patientID != patientID:
+                        if current is not None:
+                            yield current
+                        current = (Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patientID), [])
+
+                    if diagnosisID is not None:
+                        current[1].append(Diagnosis(finalDiagnosis, patientID, diagnosisID))
+
+                if current is not None:
+                    yield current
+        except Exception as e:
+            # Re-raised so a stream cut short is not mistaken for the whole table.
+            print(e)
+            raise
+
     def getPatientByID(self, patientID: int) -> Patient | None:
         """
         Get paitient by patientID.
@@ -68,27 +239,81 @@ class PatientDAO:
         patient: Patient | None = None
 
         try:
-            PatientDAO.conn = connectionUtil.getConnection()
-            PatientDAO.cursor = PatientDAO.conn.cursor()
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "patient.getByID", (patientID,))
+
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                if len(rs) > 1:
+                    return patient
+                for tuple in rs:
+                    patient_ID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    patient_ID, patientName, patientAge, patientGender, patientHeight, patientWeight = tuple
+                    patient = Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patient_ID)
+        except Exception as e:
+            print(e)
 
-            sql: str = """SELECT * FROM patient WHERE patient_id = %s;"""
-            PatientDAO.cursor.execute(sql, (patientID,))
+        return patient
+    
+    def getExistingPatientIDs(self, patientIDs: List[int]) -> set[int]:
+        """
+        Find which of many patient IDs are for real, existing patients, in one query.
+
+        Parameters:
+            patientIDs (```List```[```int```]): Patient IDs to check.
 
-            rs: List[tuple[Any, ...]] = PatientDAO.cursor.fetchall()
-            if len(rs) > 1:
-                return patient
-            for tuple in rs:
-                patient_ID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
-                patient_ID, patientName, patientAge, patientGender, patientHeight, patientWeight = tuple
-                patient = Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patient_ID)
+        Returns:
+            (```set```[```int```]): The patient IDs that exist. Empty set if none exist or the query failed.
+        """
+        existing: set[int] = set()
+        if len(patientIDs) == 0:
+            return existing
+
+        try:
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "patient.getExistingIDs", (list(patientIDs),))
 
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                existing = {tup[0] for tup in rs}
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
 
-        return patient
-    
+        return existing
+
+    def searchPatientsByName(self, namePrefix: str, limit: int, after: tuple[str, int] | None = None) -> List[tuple[Patient, str]]:
+        """
+        Get patients whose name starts with namePrefix (case-insensitive), ordered by lowercase name then patient ID.
+        Paged with a keyset: pass the lowercase name and patient ID of the last patient of the previous page as after.
+        Both the prefix and the names are lowercased by PostgreSQL's lower(), and the lowercase names are returned as computed by the database, so the keyset matches the ordering even for names that Python's str.lower() lowercases differently.
+
+        Parameters:
+            namePrefix (```str```): Start of the patient name.
+            limit (```int```): Maximum number of patients to return.
+            after (```tuple```[```str```, ```int```] | None): Lowercase name and patient ID to continue after, or None for the first page.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```str```]]): Matching patients, each with its lowercase name. Empty list if there are none.
+        """
+        patientList: List[tuple[Patient, str]] = []
+        pattern: str = namePrefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+        try:
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                if after is None:
+                    statements.execute(cursor, "patient.searchByName", (pattern, limit))
+                else:
+                    statements.execute(cursor, "patient.searchByNameAfter", (pattern, after[0], after[1], limit))
+
+                rs: List[tuple[Any, ...]] = cursor.fetchall()
+                for tup in rs:
+                    searchName: str; patientID: int; patientName: str; patientAge: int; patientGender: str; patientHeight: int; patientWeight: int
+                    searchName, patientID, patientName, patientAge, patientGender, patientHeight, patientWeight = tup
+
+                    patientList.append((Patient(patientName, patientAge, patientGender, patientHeight, patientWeight, patientID), searchName))
+        except Exception as e:
+            print(e)
+
+        return patientList
+
     def addPatient(self, patient: Patient) -> Patient | None:
         """
         Add patient to database.
@@ -106,25 +331,48 @@ class PatientDAO:
         patientWeight: int = patient.weight
 
         try:
-            PatientDAO.conn = connectionUtil.getConnection()
-            PatientDAO.cursor = PatientDAO.conn.cursor()
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "patient.add", (patientName, patientAge, patientGender, patientHeight, patientWeight))
+
+                if cursor.rowcount > 0:
+                    patientID: int = cursor.fetchone()[0]
+                    patient.patientID = patientID
+                    print(patient)
+                    return patient
+                else:
+                    return None
+        except Exception as e:
+            print(e)
+        
+        return None
 
-            sql: str = """INSERT INTO patient(name, age, gender, height, weight) VALUES (%s, %s, %s, %s, %s) RETURNING *;"""
-            PatientDAO.cursor.execute(sql, (patientName, patientAge, patientGender, patientHeight, patientWeight))
+    def addPatients(self, patients: List[Patient]) -> List[Patient] | None:
+        """
+        Add many patients to database in one transaction. The inserts are sent with executemany in pipeline mode, so the batch costs one connection and about one round-trip instead of one per patient.
 
-            if PatientDAO.cursor.rowcount > 0:
-                patientID: int = PatientDAO.cursor.fetchone()[0]
-                patient.patientID = patientID
-                print(patient)
-                return patient
-            else:
-                return None
+        Parameters:
+            patients (```List```[```Patient```]): Patient objects (No patientID!) to add to database.
 
+        Returns:
+            (```List```[```Patient``` | None]): The same patient objects with their patientID from database, in input order, or None if nothing was saved.
+        """
+        if len(patients) == 0:
+            return []
+
+        try:
+            with connectionUtil.transaction() as conn, conn.cursor() as cursor:
+                statements.executemany(cursor, "patient.add", [(patient.name, patient.age, patient.gender, patient.height, patient.weight) for patient in patients], returning=True)
+
+                patientIDs: List[int] = []
+                for _ in patients:
+                    patientIDs.append(cursor.fetchone()[0])
+                    cursor.nextset()
+            for patient, patientID in zip(patients, patientIDs):
+                patient.patientID = patientID
+            return patients
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
-        
+
         return None
 
     def updatePatient(self, patient: Patient) -> Patient | None:
@@ -145,67 +393,72 @@ class PatientDAO:
         patientID: int = patient.patientID
 
         try:
-            PatientDAO.conn = connectionUtil.getConnection()
-            PatientDAO.cursor = PatientDAO.conn.cursor()
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "patient.update", (patientName, patientAge, patientGender, patientHeight, patientWeight, patientID))
 
-            sql: str = """UPDATE patient SET name = %s, age = %s, gender = %s, height = %s, weight = %s WHERE patient_id = %s RETURNING *;"""
-            PatientDAO.cursor.execute(sql, (patientName, patientAge, patientGender, patientHeight, patientWeight, patientID))
+                checkPatient: tuple[Any, ...] | None = cursor.fetchone()
 
-            checkPatient: tuple[Any, ...] | None = PatientDAO.cursor.fetchone()
-            
-            if checkPatient is not None:
-                patient.patientID, patient.name, patient.age, patient.gender, patient.height, patient.weight = checkPatient
-                return patient
-            else:
-                return None
+                if checkPatient is not None:
+                    patient.patientID, patient.name, patient.age, patient.gender, patient.height, patient.weight = checkPatient
+                    return patient
+                else:
+                    return None
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
         
         return None
 
-    def deletePatient(self, patientID: int) -> bool:
+    def updatePatients(self, patients: List[Patient]) -> List[Patient] | None:
         """
-        Delete patient at patientID in database.
+        Update many patients in database in one transaction, sent with executemany in pipeline mode. If any patient does not exist, nothing is updated.
 
         Parameters:
-            patientID (```int```): Patient ID.
+            patients (```List```[```Patient```]): Patients and their information to update in database.
 
         Returns:
-            (```bool```): True if patient at patient ID was deleted, False otherwise.
+            (```List```[```Patient```] | None): The same patient objects as updated in database, in input order, or None if nothing was updated.
         """
-        try:
-            PatientDAO.conn = connectionUtil.getConnection()
-            PatientDAO.cursor = PatientDAO.conn.cursor()
-
-            sql: str = """DELETE FROM patient WHERE patient_id = %s;"""
-            PatientDAO.cursor.execute(sql, (patientID,))
+        if len(patients) == 0:
+            return []
 
-            rowCount: int = PatientDAO.cursor.rowcount
-            if rowCount > 0:
-                return True
-            else:
-                return False
+        try:
+            with connectionUtil.transaction() as conn, conn.cursor() as cursor:
+                statements.executemany(cursor, "patient.update", [(patient.name, patient.age, patient.gender, patient.height, patient.weight, patient.patientID) for patient in patients], returning=True)
+
+                rows: List[tuple[Any, ...]] = []
+                for patient in patients:
+                    row: tuple[Any, ...] | None = cursor.fetchone()
+                    if row is None:
+                        raise LookupError(f"Patient {patient.patientID} does not exist")
+                    rows.append(row)
+                    cursor.nextset()
+            for patient, row in zip(patients, rows):
+                patient.patientID, patient.name, patient.age, patient.gender, patient.height, patient.weight = row
+            return patients
         except Exception as e:
             print(e)
-        finally:
-            self.__closeResources()
-        return False
 
-    def __closeResources(self) -> None:
-        """
-        Close cursor and conn resources if they are open.
+        return None
+
+    def deletePatient(self, patientID: int) -> bool:
         """
-        try:
-            if PatientDAO.cursor is not None:
-                PatientDAO.cursor.close()
-        except Exception as e:
-            print(e)
+        Delete patient at patientID in database.
 
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```bool```): True if patient at patient ID was deleted, False otherwise.
+        """
         try:
-            if PatientDAO.conn is not None:
-                PatientDAO.conn.close()
+            with connectionUtil.connection() as conn, conn.cursor() as cursor:
+                statements.execute(cursor, "patient.delete", (patientID,))
+
+                rowCount: int = cursor.rowcount
+                if rowCount > 0:
+                    return True
+                else:
+                    return False
         except Exception as e:
             print(e)
-
+        return False
@@ -0,0 +1,644 @@
+import sqlite3
+import string
+import threading
+from contextlib import contextmanager
+from typing import Any, ClassVar, Dict, Iterator, List, Sequence
+from dao.statementRegistry import statements
+from dao.storage import DiagnosisStorage, PatientStorage
+from models.diagnosis import Diagnosis
+from models.patient import Patient
+
+
+class SQLiteDatabase:
+    """
+    Embedded SQLite database file holding the patient and diagnosis tables, for single-workstation kiosks that have no PostgreSQL server. The schema is created on open.
+    One connection is shared by both DAOs and guarded by a lock, since SQLite runs one write at a time anyway and a local file needs no pool.
+
+    Attributes:
+        (```class```) schema (```str```): Tables and indexes, matching resources/sql/createTables.sql and the migrations.
+        path (```str```): Database file, or ":memory:" for a private in-memory database.
+        conn (```sqlite3.Connection```): The shared connection.
+        lock (```threading.RLock```): Lock held while the connection is in use.
+    """
+
+    schema: ClassVar[str] = """
+        CREATE TABLE IF NOT EXISTS patient(
+            patient_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            age INTEGER,
+            gender TEXT,
+            height INTEGER,
+            weight INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS diagnosis(
+            diagnosis_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            patient_id INTEGER REFERENCES patient(patient_id),
+            diagnosis INTEGER NOT NULL CHECK (diagnosis BETWEEN 1 AND 3)
+        );
+        CREATE INDEX IF NOT EXISTS diagnosis_patient_id_idx ON diagnosis (patient_id);
+        CREATE INDEX IF NOT EXISTS patient_name_search_idx ON patient (lower(name), patient_id);
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Constructor for SQLiteDatabase class. Opens the database file, creating it and its tables if needed.
+
+        Parameters:
+            path (```str```): Database file, or ":memory:" for a private in-memory database.
+        """
+        self.path: str = path
+        self.conn: sqlite3.Connection = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA foreign_keys = ON;")
+        self.conn.execute("PRAGMA journal_mode = WAL;")
+        self.conn.executescript(self.schema)
+        self.lock: threading.RLock = threading.RLock()
+
+    @contextmanager
+    def transaction(self, name: str) -> Iterator[sqlite3.Cursor]:
+        """
+        Use the connection for one transaction: committed if the block succeeds, rolled back if it raises. The block runs registered statements on the cursor, read with statements.sql().
+        The transaction is recorded in utils.metrics under name, with the rows it inserted, updated or deleted.
+
+        Parameters:
+            name (```str```): Statement name to record the transaction under, the name of the statement it runs or of the operation if it runs several.
+
+        Returns:
+            (```Iterator```[```sqlite3.Cursor```]): Context manager giving a cursor of the transaction.
+        """
+        with self.lock, statements.record(name) as run, self.conn:
+            changes: int = self.conn.total_changes
+            cursor: sqlite3.Cursor = self.conn.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+                run.rows = self.conn.total_changes - changes
+
+    def query(self, name: str, params: Sequence[Any] = ()) -> List[tuple[Any, ...]]:
+        """
+        Run a registered query and fetch all of its rows. The query is recorded in utils.metrics under its name, with the rows it returned.
+
+        Parameters:
+            name (```str```): Statement name of the query in dao.statementRegistry.
+            params (```Sequence```[```Any```]): Query parameters. Default is none.
+
+        Returns:
+            (```List```[```tuple```[```Any```, ...]]): Rows of the query.
+        """
+        with self.lock, statements.record(name) as run:
+            rows: List[tuple[Any, ...]] = self.conn.execute(statements.sql(name), params).fetchall()
+            run.rows = len(rows)
+        return rows
+
+    def close(self) -> None:
+        """
+        Close the connection.
+        """
+        with self.lock:
+            self.conn.close()
+
+
+def patientOf(row: tuple[Any, ...]) -> Patient:
+    """
+    Build a patient object from a patient row.
+
+    Parameters:
+        row (```tuple```[```Any```, ...]): patient_id, name, age, gender, height, weight.
+
+    Returns:
+        (```Patient```): New patient object.
+    """
+    patientID, name, age, gender, height, weight = row
+    return Patient(name, age, gender, height, weight, patientID)
+
+asciiLowercase: Dict[int, int] = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+def sqliteLower(text: str) -> str:
+    """
+    Lowercase text like SQLite's built-in lower(), which only lowercases ASCII letters.
+
+    Parameters:
+        text (```str```): Text to lowercase.
+
+    Returns:
+        (```str```): Text with A-Z lowercased and every other character unchanged.
+    """
+    return text.translate(asciiLowercase)
+
+def patientsWithDiagnosesOf(rows: List[tuple[Any, ...]]) -> List[tuple[Patient, List[Diagnosis]]]:
+    """
+    Group patient LEFT JOIN diagnosis rows, ordered by patient ID, into patients paired with their diagnoses.
+
+    Parameters:
+        rows (```List```[```tuple```[```Any```, ...]]): patient_id, name, age, gender, height, weight, diagnosis_id, diagnosis.
+
+    Returns:
+        (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): Patients paired with their diagnoses.
+    """
+    patientList: List[tuple[Patient, List[Diagnosis]]] = []
+    for row in rows:
+        if len(patientList) == 0 or patientList[-1][0].patientID != row[0]:
+            patientList.append((patientOf(row[:6]), []))
+        if row[6] is not None:
+            patientList[-1][1].append(Diagnosis(row[7], row[0], row[6]))
+    return patientList
+
+
+class SQLitePatientDAO(PatientStorage):
+    """
+    Patient storage in an embedded SQLite database.
+
+    Attributes:
+        database (```SQLiteDatabase```): Database the patients are stored in, shared with SQLiteDiagnosisDAO.
+    """
+
+    def __init__(self, database: SQLiteDatabase) -> None:
+        """
+        Constructor for SQLitePatientDAO class.
+
+        Parameters:
+            database (```SQLiteDatabase```): Database to store patients in.
+        """
+        self.database: SQLiteDatabase = database
+
+    def getAllPatients(self) -> List[Patient]:
+        """
+        Get all patient information from the database.
+
+        Returns:
+            (```List```[```Patient```]): List of all patients and their information as patient objects, ordered by patient ID. If database is empty or the query failed, return empty list.
+        """
+        try:
+            rows: List[tuple[Any, ...]] = self.database.query("sqlite.patient.getAll")
+            return [patientOf(row) for row in rows]
+        except Exception as e:
+            print(e)
+
+        return []
+
+    def getAllPatientsWithDiagnoses(self) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get all patients and their diagnoses from the database in one query.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): List of all patients paired with their diagnoses, ordered by patient ID. Patients without diagnoses have an empty list. If database is empty or the query failed, return empty list.
+        """
+        try:
+            rows: List[tuple[Any, ...]] = self.database.query("sqlite.patient.getAllWithDiagnoses")
+            return patientsWithDiagnosesOf(rows)
+        except Exception as e:
+            print(e)
+
+        return []
+
+    def getPatientsPage(self, afterPatientID: int | None, limit: int) -> List[Patient]:
+        """
+        Get one page of patients ordered by patient ID, using the patient ID of the last patient of the previous page as a keyset instead of OFFSET.
+
+        Parameters:
+            afterPatientID (```int | None```): Patient ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of patients to return.
+
+        Returns:
+            (```List```[```Patient```]): Patients with a patient ID greater than afterPatientID. Empty list if there are none or the query failed.
+        """
+        try:
+            rows: List[tuple[Any, ...]] = self.database.query("sqlite.patient.getPage", (afterPatientID or 0, limit))
+            return [patientOf(row) for row in rows]
+        except Exception as e:
+            print(e)
+
+        return []
+
+    def getPatientsWithDiagnosesPage(self, afterPatientID: int | None, limit: int) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get one page of patients and their diagnoses ordered by patient ID, using the patient ID of the last patient of the previous page as a keyset instead of OFFSET.
+
+        Parameters:
+            afterPatientID (```int | None```): Patient ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of patients to return.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): Patients with a patient ID greater than afterPatientID paired with their diagnoses. Empty list if there are none or the query failed.
+        """
+        try:
+            rows: List[tuple[Any, ...]] = self.database.query("sqlite.patient.getPageWithDiagnoses", (afterPatientID or 0, limit))
+            return patientsWithDiagnosesOf(rows)
+        except Exception as e:
+            print(e)
+
+        return []
+
+    def getPatientByID(self, patientID: int) -> Patient | None:
+        """
+        Get patient by patientID.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```Patient | None```): Patient object, or None if there is no patient at patientID or the query failed.
+        """
+        try:
+            rows: List[tuple[Any, ...]] = self.database.query("sqlite.patient.getByID", (patientID,))
+            return None if len(rows) == 0 else patientOf(rows[0])
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def getExistingPatientIDs(self, patientIDs: List[int]) -> set[int]:
+        """
+        Find which of many patient IDs are for real, existing patients in one query.
+
+        Parameters:
+            patientIDs (```List```[```int```]): Patient IDs to check.
+
+        Returns:
+            (```set```[```int```]): The patient IDs that exist. Empty set if none exist or the query failed.
+        """
+        if len(patientIDs) == 0:
+            return set()
+        try:
+            rows: List[tuple[Any, ...]] = self.database.query("sqlite.patient.getExistingIDs", (str(list(patientIDs)),))
+            return {row[0] for row in rows}
+        except Exception as e:
+            print(e)
+
+        return set()
+
+    def searchPatientsByName(self, namePrefix: str, limit: int, after: tuple[str, int] | None = None) -> List[tuple[Patient, str]]:
+        """
+        Get patients whose name starts with namePrefix (case-insensitive), ordered by lowercase name then patient ID.
+        Paged with a keyset: pass the lowercase name and patient ID of the last patient of the previous page as after.
+
+        Parameters:
+            namePrefix (```str```): Start of the patient name.
+            limit (```int```): Maximum number of patients to return.
+            after (```tuple```[```str```, ```int```] | None): Lowercase name and patient ID to continue after, or None for the first page.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```str```]]): Matching patients, each with its lowercase name as SQLite's lower() computes it. Empty list if there are none or the query failed.
+        """
+        try:
+            # The bounds of the prefix range are lowercased like lower(name), so a name matches exactly when its lowercase form starts with the prefix.
+            prefix: str = sqliteLower(namePrefix)
+            rows: List[tuple[Any, ...]]
+            if prefix == "":
+                if after is None:
+                    rows = self.database.query("sqlite.patient.searchAllNames", (limit,))
+                else:
+                    rows = self.database.query("sqlite.patient.searchAllNamesAfter", (after[0], after[1], limit))
+            else:
+                end: str = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+                if after is None:
+                    rows = self.database.query("sqlite.patient.searchByName", (prefix, end, limit))
+                else:
+                    rows = self.database.query("sqlite.patient.searchByNameAfter", (prefix, end, after[0], after[1], limit))
+            return [(patientOf(row[1:]), row[0]) for row in rows]
+        except Exception as e:
+            print(e)
+
+        return []
+
+    def addPatient(self, patient: Patient) -> Patient | None:
+        """
+        Add patient to database.
+
+        Parameters:
+            patient (```Patient```): Patient object (No patientID!) to add to database.
+
+        Returns:
+            (```Patient | None```): Patient object with patientID from database, or None if it was not saved.
+        """
+        try:
+            with self.database.transaction("sqlite.patient.add") as cursor:
+                cursor.execute(statements.sql("sqlite.patient.add"), (patient.name, patient.age, patient.gender, patient.height, patient.weight))
+                patient.patientID = cursor.lastrowid
+            return patient
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def addPatients(self, patients: List[Patient]) -> List[Patient] | None:
+        """
+        Add many patients to database in one transaction. If any insert fails, nothing is saved.
+
+        Parameters:
+            patients (```List```[```Patient```]): Patient objects (No patientID!) to add to database.
+
+        Returns:
+            (```List```[```Patient```] | None): The same patient objects with their patientID from database, in input order, or None if nothing was saved.
+        """
+        try:
+            patientIDs: List[int] = []
+            with self.database.transaction("sqlite.patient.add") as cursor:
+                for patient in patients:
+                    cursor.execute(statements.sql("sqlite.patient.add"), (patient.name, patient.age, patient.gender, patient.height, patient.weight))
+                    patientIDs.append(cursor.lastrowid)
+            for patient, patientID in zip(patients, patientIDs):
+                patient.patientID = patientID
+            return patients
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def updatePatient(self, patient: Patient) -> Patient | None:
+        """
+        Update patient in database.
+
+        Parameters:
+            patient (```Patient```): Patient and their information to update in database.
+
+        Returns:
+            (```Patient | None```): Updated patient if update was successful or None otherwise.
+        """
+        try:
+            with self.database.transaction("sqlite.patient.update") as cursor:
+                cursor.execute(statements.sql("sqlite.patient.update"), (patient.name, patient.age, patient.gender, patient.height, patient.weight, patient.patientID))
+                if cursor.rowcount > 0:
+                    return patient
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def updatePatients(self, patients: List[Patient]) -> List[Patient] | None:
+        """
+        Update many patients in database in one transaction. If any patient does not exist, nothing is updated.
+
+        Parameters:
+            patients (```List```[```Patient```]): Patients and their information to update in database.
+
+        Returns:
+            (```List```[```Patient```] | None): The same patient objects as updated in database, in input order, or None if nothing was updated.
+        """
+        try:
+            with self.database.transaction("sqlite.patient.update") as cursor:
+                for patient in patients:
+                    cursor.execute(statements.sql("sqlite.patient.update"), (patient.name, patient.age, patient.gender, patient.height, patient.weight, patient.patientID))
+                    if cursor.rowcount == 0:
+                        raise LookupError(f"Patient {patient.patientID} does not exist")
+            return patients
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def deletePatient(self, patientID: int) -> bool:
+        """
+        Delete patient at patientID in database. A patient with diagnoses is not deleted.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```bool```): True if patient at patient ID was deleted, False otherwise.
+        """
+        try:
+            with self.database.transaction("sqlite.patient.delete") as cursor:
+                cursor.execute(statements.sql("sqlite.patient.delete"), (patientID,))
+                return cursor.rowcount > 0
+        except Exception as e:
+            print(e)
+
+        return False
+
+
+class SQLiteDiagnosisDAO(DiagnosisStorage):
+    """
+    Diagnosis storage in an embedded SQLite database.
+
+    Attributes:
+        database (```SQLiteDatabase```): Database the diagnoses are stored in, shared with SQLitePatientDAO.
+    """
+
+    def __init__(self, database: SQLiteDatabase) -> None:
+        """
+        Constructor for SQLiteDiagnosisDAO class.
+
+        Parameters:
+            database (```SQLiteDatabase```): Database to store diagnoses in.
+        """
+        self.database: SQLiteDatabase = database
+
+    def getAllDiagnosis(self) -> List[Diagnosis]:
+        """
+        Get all diagnoses information from the database.
+
+        Returns:
+            (```List```[```Diagnosis```]): List of all diagnoses as diagnosis objects, ordered by diagnosis ID. If database is empty or the query failed, return empty list.
+        """
+        return self.__getDiagnoses("sqlite.diagnosis.getAll", ())
+
+    def getDiagnosesPage(self, afterDiagnosisID: int | None, limit: int) -> List[Diagnosis]:
+        """
+        Get one page of diagnoses ordered by diagnosis ID, using the diagnosis ID of the last diagnosis of the previous page as a keyset instead of OFFSET.
+
+        Parameters:
+            afterDiagnosisID (```int | None```): Diagnosis ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of diagnoses to return.
+
+        Returns:
+            (```List```[```Diagnosis```]): Diagnoses with a diagnosis ID greater than afterDiagnosisID. Empty list if there are none or the query failed.
+        """
+        return self.__getDiagnoses("sqlite.diagnosis.getPage", (afterDiagnosisID or 0, limit))
+
+    def getDiagnosesByPatientID(self, patientID: int) -> List[Diagnosis]:
+        """
+        Get all diagnoses for patient ID.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```List```[```Diagnosis```]): List of all diagnoses of the patient as diagnosis objects, ordered by diagnosis ID. Empty list if there are none or the query failed.
+        """
+        return self.__getDiagnoses("sqlite.diagnosis.getByPatientID", (patientID,))
+
+    def getDiagnosisByID(self, diagnosisID: int) -> Diagnosis | None:
+        """
+        Get diagnosis for diagnosis ID.
+
+        Parameters:
+            diagnosisID (```int```): Diagnosis ID.
+
+        Returns:
+            (```Diagnosis | None```): Diagnosis object, or None if there is no diagnosis at diagnosisID or the query failed.
+        """
+        diagnoses: List[Diagnosis] = self.__getDiagnoses("sqlite.diagnosis.getByID", (diagnosisID,))
+        return diagnoses[0] if len(diagnoses) == 1 else None
+
+    def addDignosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Add diagnosis to database. The diagnosis must have a valid level and, if it has a patientID, the patient must exist.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis object (No diagnosisID!) to add to database.
+
+        Returns:
+            (```Diagnosis | None```): Diagnosis object with diagnosisID from database, or None if it was not saved.
+        """
+        try:
+            with self.database.transaction("sqlite.diagnosis.add") as cursor:
+                cursor.execute(statements.sql("sqlite.diagnosis.add"), (diagnosis.patientID, self.__code(diagnosis)))
+                diagnosis.diagnosisID = cursor.lastrowid
+            return diagnosis
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def addDiagnoses(self, diagnoses: List[Diagnosis]) -> List[Diagnosis] | None:
+        """
+        Add many diagnoses to database in one transaction. If any diagnosis is rejected, nothing is saved.
+
+        Parameters:
+            diagnoses (```List```[```Diagnosis```]): Diagnosis objects (No diagnosisID!) to add to database.
+
+        Returns:
+            (```List```[```Diagnosis```] | None): The same diagnosis objects with their diagnosisID from database, in input order, or None if nothing was saved.
+        """
+        try:
+            diagnosisIDs: List[int] = []
+            with self.database.transaction("sqlite.diagnosis.add") as cursor:
+                for diagnosis in diagnoses:
+                    cursor.execute(statements.sql("sqlite.diagnosis.add"), (diagnosis.patientID, self.__code(diagnosis)))
+                    diagnosisIDs.append(cursor.lastrowid)
+            for diagnosis, diagnosisID in zip(diagnoses, diagnosisIDs):
+                diagnosis.diagnosisID = diagnosisID
+            return diagnoses
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def addPatientAndDiagnosis(self, patient: Patient, diagnosis: Diagnosis) -> tuple[Patient, Diagnosis] | None:
+        """
+        Add a new patient and their diagnosis to database atomically, in one transaction. Either both rows are saved or neither is.
+
+        Parameters:
+            patient (```Patient```): Patient object (No patientID!) to add to database.
+            diagnosis (```Diagnosis```): Diagnosis object (No diagnosisID or patientID!) to add to database for patient.
+
+        Returns:
+            (```tuple```[```Patient```, ```Diagnosis```] | None): Patient with patientID and diagnosis with diagnosisID and patientID from database, or None if nothing was saved.
+        """
+        try:
+            with self.database.transaction("sqlite.diagnosis.addWithPatient") as cursor:
+                cursor.execute(statements.sql("sqlite.patient.add"), (patient.name, patient.age, patient.gender, patient.height, patient.weight))
+                patientID: int = cursor.lastrowid
+                cursor.execute(statements.sql("sqlite.diagnosis.add"), (patientID, self.__code(diagnosis)))
+                diagnosisID: int = cursor.lastrowid
+            patient.patientID = patientID
+            diagnosis.patientID, diagnosis.diagnosisID = patientID, diagnosisID
+            return (patient, diagnosis)
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def updateDiagnosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Update diagnosis in database.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis to update in database.
+
+        Returns:
+            (```Diagnosis | None```): Updated diagnosis if update was successful or None otherwise.
+        """
+        try:
+            with self.database.transaction("sqlite.diagnosis.update") as cursor:
+                cursor.execute(statements.sql("sqlite.diagnosis.update"), (diagnosis.patientID, self.__code(diagnosis), diagnosis.diagnosisID))
+                if cursor.rowcount > 0:
+                    return diagnosis
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def updateDiagnosisIfPatientExists(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Update diagnosis in database only if both the diagnosis and its patient exist, checked by the UPDATE statement itself instead of separate lookups.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis to update in database.
+
+        Returns:
+            (```Diagnosis | None```): Updated diagnosis if update was successful, or None if the diagnosis or patient does not exist or the update failed.
+        """
+        try:
+            with self.database.transaction("sqlite.diagnosis.updateIfPatientExists") as cursor:
+                cursor.execute(statements.sql("sqlite.diagnosis.updateIfPatientExists"), (diagnosis.patientID, self.__code(diagnosis), diagnosis.diagnosisID, diagnosis.patientID))
+                if cursor.rowcount > 0:
+                    return diagnosis
+        except Exception as e:
+            print(e)
+
+        return None
+
+    def deleteDiagnosis(self, diagnosisID: int) -> bool:
+        """
+        Delete diagnosis at diagnosisID in database.
+
+        Parameters:
+            diagnosisID (```int```): Diagnosis ID.
+
+        Returns:
+            (```bool```): True if diagnosis at diagnosis ID was deleted, False otherwise.
+        """
+        return self.deleteDiagnoses([diagnosisID]) > 0
+
+    def deleteDiagnoses(self, diagnosisIDs: List[int]) -> int:
+        """
+        Delete many diagnoses in database in one transaction.
+
+        Parameters:
+            diagnosisIDs (```List```[```int```]): Diagnosis IDs.
+
+        Returns:
+            (```int```): Number of diagnoses deleted. IDs without a diagnosis are skipped.
+        """
+        try:
+            with self.database.transaction("sqlite.diagnosis.delete") as cursor:
+                cursor.executemany(statements.sql("sqlite.diagnosis.delete"), [(diagnosisID,) for diagnosisID in diagnosisIDs])
+                return cursor.rowcount
+        except Exception as e:
+            print(e)
+
+        return 0
+
+    def __getDiagnoses(self, name: str, params: tuple[Any, ...]) -> List[Diagnosis]:
+        """
+        Run a diagnosis query and return the rows as diagnosis objects.
+
+        Parameters:
+            name (```str```): Statement name of a query selecting all diagnosis columns.
+            params (```tuple```[```Any```, ...]): Query parameters.
+
+        Returns:
+            (```List```[```Diagnosis```]): Rows as diagnosis objects. Empty list if there are none or the query failed.
+        """
+        try:
+            rows: List[tuple[Any, ...]] = self.database.query(name, params)
+            return [Diagnosis(level, patientID, diagnosisID) for diagnosisID, patientID, level in rows]
+        except Exception as e:
+            print(e)
+
+        return []
+
+    @staticmethod
+    def __code(diagnosis: Diagnosis) -> int | None:
+        """
+        Get the stored code of a diagnosis.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis.
+
+        Returns:
+            (```int | None```): DiagnosisLevel code, or None if the diagnosis has no valid level (rejected by the table).
+        """
+        return None if diagnosis.level is None else int(diagnosis.level)
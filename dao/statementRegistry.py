@@ -0,0 +1,299 @@
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Sequence
+
+if TYPE_CHECKING:
+    import psycopg
+
+from utils.metrics import metrics
+
+
+class Statement:
+    """
+    Class to hold a named SQL statement of a DAO.
+
+    Attributes:
+        name (```str```): Name the DAOs use to run the statement.
+        sql (```str```): SQL of the statement.
+        prepare (```bool```): Whether the statement is prepared on the server. Only SELECT, INSERT, UPDATE and DELETE statements can be.
+    """
+
+    def __init__(self, name: str, sql: str, prepare: bool = True) -> None:
+        """
+        Constructor for Statement class.
+
+        Parameters:
+            name (```str```): Name the DAOs use to run the statement.
+            sql (```str```): SQL of the statement.
+            prepare (```bool```): Whether the statement is prepared on the server. Default is True.
+        """
+        self.name: str = name
+        self.sql: str = sql
+        self.prepare: bool = prepare
+
+
+class StatementRun:
+    """
+    One recorded run of a statement, given to the with block of StatementRegistry.record().
+
+    Attributes:
+        rows (```int | None```): Rows the run returned or affected. Left as None, the cursor's row count is recorded.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for StatementRun class.
+        """
+        self.rows: int | None = None
+
+
+class StatementRegistry:
+    """
+    Registry of the SQL statements run by the DAOs, by name.
+    Statements are run with psycopg's prepare=True: the first run on a pooled connection prepares the statement on the server, and every later run on that connection reuses the plan instead of parsing and planning the SQL again.
+    Pooled connections keep their prepared statements for their whole life, so a statement is prepared once per connection.
+    Every run through execute(), executemany(), executeAsync() and stream() is recorded in utils.metrics: its latency, the rows it returned or affected, and whether it failed.
+    Work that cannot go through them (COPY, migration scripts, the memory backend) is wrapped in record() under its own name. The SQLite backend's statements are registered here too, under "sqlite." names, and run by SQLiteDatabase.
+
+    Attributes:
+        statements (```Dict```[```str```, ```Statement```]): Registered statements by name.
+        prepare (```bool```): Whether statements are prepared at all. Turn off to compare against unprepared execution.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for StatementRegistry class. Creates an empty registry.
+        """
+        self.statements: Dict[str, Statement] = {}
+        self.prepare: bool = True
+
+    def register(self, name: str, sql: str, prepare: bool = True) -> None:
+        """
+        Register a statement.
+
+        Parameters:
+            name (```str```): Name to run the statement by. Must not be registered already.
+            sql (```str```): SQL of the statement.
+            prepare (```bool```): Whether the statement can be prepared on the server. Default is True.
+        """
+        if name in self.statements:
+            raise ValueError(f"Statement {name} is already registered")
+        self.statements[name] = Statement(name, sql, prepare)
+
+    def sql(self, name: str) -> str:
+        """
+        Get the SQL of a statement, for statements that cannot be run with execute(), such as COPY. Runs of it must be wrapped in record() to appear in utils.metrics.
+
+        Parameters:
+            name (```str```): Statement name.
+
+        Returns:
+            (```str```): SQL of the statement.
+        """
+        return self.statements[name].sql
+
+    def execute(self, cursor: "psycopg.Cursor", name: str, params: Sequence[Any] | None = None) -> "psycopg.Cursor":
+        """
+        Run a statement, prepared on the cursor's connection if it can be.
+
+        Parameters:
+            cursor (```psycopg.Cursor```): Client-side cursor to run the statement on.
+            name (```str```): Statement name.
+            params (```Sequence```[```Any```] | None): Statement parameters.
+
+        Returns:
+            (```psycopg.Cursor```): The cursor, ready to fetch results.
+        """
+        statement: Statement = self.statements[name]
+        with self.record(name, cursor):
+            return cursor.execute(statement.sql, params, prepare=self.prepare and statement.prepare)
+
+    def executemany(self, cursor: "psycopg.Cursor", name: str, paramsSeq: Iterable[Sequence[Any]], returning: bool = False) -> "psycopg.Cursor":
+        """
+        Run a statement once per parameter set. psycopg sends all of them in pipeline mode, without waiting for each result, and prepares the statement on the connection.
+
+        Parameters:
+            cursor (```psycopg.Cursor```): Client-side cursor to run the statement on.
+            name (```str```): Statement name.
+            paramsSeq (```Iterable```[```Sequence```[```Any```]]): Parameters of every run.
+            returning (```bool```): Keep the result of every run, to be read one result set at a time with fetch*() and nextset(). Default is False.
+
+        Returns:
+            (```psycopg.Cursor```): The cursor, on the result of the first run if returning.
+        """
+        with self.record(name, cursor):
+            cursor.executemany(self.statements[name].sql, paramsSeq, returning=returning)
+        return cursor
+
+    async def executeAsync(self, cursor: "psycopg.AsyncCursor", name: str, params: Sequence[Any] | None = None) -> "psycopg.AsyncCursor":
+        """
+        Run a statement on an asyncio cursor, prepared on the cursor's connection if it can be.
+
+        Parameters:
+            cursor (```psycopg.AsyncCursor```): Client-side asyncio cursor to run the statement on.
+            name (```str```): Statement name.
+            params (```Sequence```[```Any```] | None): Statement parameters.
+
+        Returns:
+            (```psycopg.AsyncCursor```): The cursor, ready to fetch results.
+        """
+        statement: Statement = self.statements[name]
+        with self.record(name, cursor):
+            return await cursor.execute(statement.sql, params, prepare=self.prepare and statement.prepare)
+
+    def stream(self, cursor: "psycopg.Cursor", name: str, params: Sequence[Any] | None = None) -> Iterator[tuple[Any, ...]]:
+        """
+        Run a query on a server-side (named) cursor and yield its rows as they are fetched, itersize rows per round-trip.
+        The run is recorded once the stream is read to the end: the latency covers the whole stream, including the time the caller spends on each row, and the rows are the rows yielded.
+
+        Parameters:
+            cursor (```psycopg.Cursor```): Server-side cursor to run the query on.
+            name (```str```): Statement name.
+            params (```Sequence```[```Any```] | None): Statement parameters.
+
+        Returns:
+            (```Iterator```[```tuple```[```Any```, ...]]): Iterator over the rows.
+        """
+        with self.record(name, cursor) as run:
+            run.rows = 0
+            cursor.execute(self.statements[name].sql, params)
+            for row in cursor:
+                run.rows += 1
+                yield row
+
+    @contextmanager
+    def record(self, name: str, cursor: Any = None) -> Iterator[StatementRun]:
+        """
+        Record the run of a statement in utils.metrics: its latency and rows if the with block succeeds, an error if it raises.
+
+        Parameters:
+            name (```str```): Statement name.
+            cursor (```Any```): Cursor the statement runs on, whose row count is recorded unless the with block sets the run's rows. Default is None, recording the run's rows or none.
+
+        Returns:
+            (```Iterator```[```StatementRun```]): Context manager timing the with block, giving the run to set its rows on.
+        """
+        run: StatementRun = StatementRun()
+        start: float = time.perf_counter()
+        try:
+            yield run
+        except Exception:
+            metrics.recordError(name)
+            raise
+        rows: int = run.rows if run.rows is not None else (cursor.rowcount if cursor is not None else -1)
+        metrics.observeStatement(name, time.perf_counter() - start, rows)
+
+    def __len__(self) -> int:
+        """
+        Number of registered statements.
+
+        Returns:
+            (```int```): Number of statements.
+        """
+        return len(self.statements)
+
+
+statements: StatementRegistry = StatementRegistry()
+
+# Patients
+statements.register("patient.getAll", """SELECT * FROM patient;""")
+statements.register("patient.getAllOrdered", """SELECT * FROM patient ORDER BY patient_id;""")
+statements.register("patient.getPage", """SELECT * FROM patient WHERE patient_id > %s ORDER BY patient_id LIMIT %s;""")
+statements.register("patient.getByID", """SELECT * FROM patient WHERE patient_id = %s;""")
+# The prefix is lowercased by lower() like the names, and each patient's lower(name) is returned as the keyset of the next page.
+statements.register("patient.searchByName", """SELECT lower(name) COLLATE "C", * FROM patient WHERE lower(name) COLLATE "C" LIKE lower(%s) || '%%'
+    ORDER BY lower(name) COLLATE "C", patient_id LIMIT %s;""")
+statements.register("patient.searchByNameAfter", """SELECT lower(name) COLLATE "C", * FROM patient WHERE lower(name) COLLATE "C" LIKE lower(%s) || '%%' AND (lower(name) COLLATE "C", patient_id) > (%s, %s)
+    ORDER BY lower(name) COLLATE "C", patient_id LIMIT %s;""")
+statements.register("patient.add", """INSERT INTO patient(name, age, gender, height, weight) VALUES (%s, %s, %s, %s, %s) RETURNING *;""")
+statements.register("patient.update", """UPDATE patient SET name = %s, age = %s, gender = %s, height = %s, weight = %s WHERE patient_id = %s RETURNING *;""")
+statements.register("patient.getExistingIDs", """SELECT patient_id FROM patient WHERE patient_id = ANY(%s);""")
+statements.register("patient.delete", """DELETE FROM patient WHERE patient_id = %s;""")
+
+# Patients with their diagnoses
+statements.register("patient.getAllWithDiagnoses", """SELECT p.patient_id, p.name, p.age, p.gender, p.height, p.weight, d.diagnosis_id, d.diagnosis
+    FROM patient p LEFT JOIN diagnosis d ON d.patient_id = p.patient_id
+    ORDER BY p.patient_id, d.diagnosis_id;""")
+statements.register("patient.getPageWithDiagnoses", """WITH page AS (SELECT * FROM patient WHERE patient_id > %s ORDER BY patient_id LIMIT %s)
+    SELECT p.patient_id, p.name, p.age, p.gender, p.height, p.weight, d.diagnosis_id, d.diagnosis
+    FROM page p LEFT JOIN diagnosis d ON d.patient_id = p.patient_id
+    ORDER BY p.patient_id, d.diagnosis_id;""")
+
+# Diagnoses
+statements.register("diagnosis.getAll", """SELECT diagnosis_id, patient_id, diagnosis FROM diagnosis;""")
+statements.register("diagnosis.getAllOrdered", """SELECT diagnosis_id, patient_id, diagnosis FROM diagnosis ORDER BY diagnosis_id;""")
+statements.register("diagnosis.getPage", """SELECT diagnosis_id, patient_id, diagnosis FROM diagnosis WHERE diagnosis_id > %s ORDER BY diagnosis_id LIMIT %s;""")
+statements.register("diagnosis.getByPatientID", """SELECT diagnosis_id, patient_id, diagnosis FROM diagnosis WHERE patient_id = %s;""")
+statements.register("diagnosis.getByID", """SELECT diagnosis_id, patient_id, diagnosis FROM diagnosis WHERE diagnosis_id = %s;""")
+statements.register("diagnosis.add", """INSERT INTO diagnosis(patient_id, diagnosis) VALUES (%s, %s) RETURNING diagnosis_id, patient_id, diagnosis;""")
+statements.register("diagnosis.addWithPatient", """WITH new_patient AS (
+        INSERT INTO patient(name, age, gender, height, weight) VALUES (%s, %s, %s, %s, %s) RETURNING patient_id
+    )
+    INSERT INTO diagnosis(patient_id, diagnosis) SELECT patient_id, %s FROM new_patient RETURNING patient_id, diagnosis_id;""")
+statements.register("diagnosis.update", """UPDATE diagnosis SET patient_id = %s, diagnosis = %s WHERE diagnosis_id = %s RETURNING diagnosis_id, patient_id, diagnosis;""")
+statements.register("diagnosis.updateIfPatientExists", """UPDATE diagnosis SET patient_id = %s, diagnosis = %s
+    WHERE diagnosis_id = %s AND EXISTS (SELECT 1 FROM patient WHERE patient_id = %s) RETURNING diagnosis_id, patient_id, diagnosis;""")
+statements.register("diagnosis.delete", """DELETE FROM diagnosis WHERE diagnosis_id = %s;""")
+
+# Bulk import and export
+statements.register("bulk.reserveIDs", """SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s);""")
+statements.register("bulk.copyPatients", """COPY patient (patient_id, name, age, gender, height, weight) FROM STDIN;""", prepare=False)
+statements.register("bulk.copyDiagnoses", """COPY diagnosis (diagnosis_id, patient_id, diagnosis) FROM STDIN;""", prepare=False)
+statements.register("bulk.exportAll", """SELECT p.patient_id, p.name, p.age, p.gender, p.height, p.weight, d.diagnosis_id, d.diagnosis
+    FROM patient p LEFT JOIN diagnosis d ON d.patient_id = p.patient_id
+    ORDER BY p.patient_id, d.diagnosis_id;""", prepare=False)
+statements.register("bulk.exportSince", """SELECT p.patient_id, p.name, p.age, p.gender, p.height, p.weight, d.diagnosis_id, d.diagnosis
+    FROM diagnosis d JOIN patient p ON p.patient_id = d.patient_id
+    WHERE d.diagnosis_id > %s
+    ORDER BY d.diagnosis_id;""", prepare=False)
+statements.register("bulk.exportSinceSnapshot", """SELECT p.patient_id, p.name, p.age, p.gender, p.height, p.weight, d.diagnosis_id, d.diagnosis
+    FROM diagnosis d JOIN patient p ON p.patient_id = d.patient_id
+    WHERE d.xact_id >= pg_snapshot_xmin(%s::pg_snapshot) AND NOT pg_visible_in_snapshot(d.xact_id, %s::pg_snapshot)
+    ORDER BY d.diagnosis_id;""", prepare=False)
+statements.register("bulk.repeatableRead", """SET TRANSACTION ISOLATION LEVEL REPEATABLE READ;""", prepare=False)
+statements.register("bulk.currentSnapshot", """SELECT pg_current_snapshot()::text;""")
+
+# Schema migrations
+statements.register("migration.createVersionTable", """CREATE TABLE IF NOT EXISTS schema_version (
+        version INT PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+    );""", prepare=False)
+statements.register("migration.getAppliedVersions", """SELECT version FROM schema_version ORDER BY version;""")
+statements.register("migration.lock", """SELECT pg_advisory_xact_lock(%s);""")
+statements.register("migration.isApplied", """SELECT 1 FROM schema_version WHERE version = %s;""")
+statements.register("migration.record", """INSERT INTO schema_version(version, name) VALUES (%s, %s);""")
+
+# SQLite backend (dao/sqliteStorage.py), with ? parameters. Never run on PostgreSQL, so never prepared; SQLiteDatabase runs them by name and records them under that name.
+statements.register("sqlite.patient.getAll", """SELECT * FROM patient ORDER BY patient_id;""", prepare=False)
+statements.register("sqlite.patient.getPage", """SELECT * FROM patient WHERE patient_id > ? ORDER BY patient_id LIMIT ?;""", prepare=False)
+statements.register("sqlite.patient.getByID", """SELECT * FROM patient WHERE patient_id = ?;""", prepare=False)
+statements.register("sqlite.patient.getExistingIDs", """SELECT patient_id FROM patient WHERE patient_id IN (SELECT value FROM json_each(?));""", prepare=False)
+# A name prefix is the range [prefix, prefix with its last character incremented) of lower(name), which the lower(name) index can scan. An empty prefix has no upper bound.
+statements.register("sqlite.patient.searchByName", """SELECT lower(name), * FROM patient WHERE lower(name) >= ? AND lower(name) < ?
+    ORDER BY lower(name), patient_id LIMIT ?;""", prepare=False)
+statements.register("sqlite.patient.searchByNameAfter", """SELECT lower(name), * FROM patient WHERE lower(name) >= ? AND lower(name) < ? AND (lower(name), patient_id) > (?, ?)
+    ORDER BY lower(name), patient_id LIMIT ?;""", prepare=False)
+statements.register("sqlite.patient.searchAllNames", """SELECT lower(name), * FROM patient
+    ORDER BY lower(name), patient_id LIMIT ?;""", prepare=False)
+statements.register("sqlite.patient.searchAllNamesAfter", """SELECT lower(name), * FROM patient WHERE (lower(name), patient_id) > (?, ?)
+    ORDER BY lower(name), patient_id LIMIT ?;""", prepare=False)
+statements.register("sqlite.patient.add", """INSERT INTO patient(name, age, gender, height, weight) VALUES (?, ?, ?, ?, ?);""", prepare=False)
+statements.register("sqlite.patient.update", """UPDATE patient SET name = ?, age = ?, gender = ?, height = ?, weight = ? WHERE patient_id = ?;""", prepare=False)
+statements.register("sqlite.patient.delete", """DELETE FROM patient WHERE patient_id = ?;""", prepare=False)
+statements.register("sqlite.patient.getAllWithDiagnoses", """SELECT p.patient_id, p.name, p.age, p.gender, p.height, p.weight, d.diagnosis_id, d.diagnosis
+    FROM patient p LEFT JOIN diagnosis d ON d.patient_id = p.patient_id
+    ORDER BY p.patient_id, d.diagnosis_id;""", prepare=False)
+statements.register("sqlite.patient.getPageWithDiagnoses", """WITH page AS (SELECT * FROM patient WHERE patient_id > ? ORDER BY patient_id LIMIT ?)
+    SELECT p.patient_id, p.name, p.age, p.gender, p.height, p.weight, d.diagnosis_id, d.diagnosis
+    FROM page p LEFT JOIN diagnosis d ON d.patient_id = p.patient_id
+    ORDER BY p.patient_id, d.diagnosis_id;""", prepare=False)
+statements.register("sqlite.diagnosis.getAll", """SELECT * FROM diagnosis ORDER BY diagnosis_id;""", prepare=False)
+statements.register("sqlite.diagnosis.getPage", """SELECT * FROM diagnosis WHERE diagnosis_id > ? ORDER BY diagnosis_id LIMIT ?;""", prepare=False)
+statements.register("sqlite.diagnosis.getByPatientID", """SELECT * FROM diagnosis WHERE patient_id = ? ORDER BY diagnosis_id;""", prepare=False)
+statements.register("sqlite.diagnosis.getByID", """SELECT * FROM diagnosis WHERE diagnosis_id = ?;""", prepare=False)
+statements.register("sqlite.diagnosis.add", """INSERT INTO diagnosis(patient_id, diagnosis) VALUES (?, ?);""", prepare=False)
+statements.register("sqlite.diagnosis.update", """UPDATE diagnosis SET patient_id = ?, diagnosis = ? WHERE diagnosis_id = ?;""", prepare=False)
+statements.register("sqlite.diagnosis.updateIfPatientExists", """UPDATE diagnosis SET patient_id = ?, diagnosis = ?
+    WHERE diagnosis_id = ? AND EXISTS (SELECT 1 FROM patient WHERE patient_id = ?);""", prepare=False)
+statements.register("sqlite.diagnosis.delete", """DELETE FROM diagnosis WHERE diagnosis_id = ?;""", prepare=False)
@@ -0,0 +1,370 @@
+from abc import ABC, abstractmethod
+from typing import ClassVar, Iterator, List
+from models.diagnosis import Diagnosis
+from models.diagnosisFrame import DiagnosisFrame
+from models.patient import Patient
+from models.patientFrame import PatientFrame
+
+
+class PatientStorage(ABC):
+    """
+    Storage interface the patient service is written against. PatientDAO stores patients in PostgreSQL, SQLitePatientDAO in an embedded SQLite file and MemoryPatientDAO in process memory.
+    Implementations must be safe to share between threads. Read methods return new patient objects; write methods set generated IDs on the objects passed in.
+
+    Attributes:
+        (```class```) itersize (```int```): Default number of rows fetched per round-trip by the streaming iter* methods.
+    """
+
+    itersize: ClassVar[int] = 1000
+
+    @abstractmethod
+    def getAllPatients(self) -> List[Patient]:
+        """
+        Get all patients.
+
+        Returns:
+            (```List```[```Patient```]): All patients. Empty list if there are none.
+        """
+
+    def iterAllPatients(self, itersize: int | None = None) -> Iterator[Patient]:
+        """
+        Iterate over all patients ordered by patient ID. Storage that can stream rows overrides this to keep memory bounded by itersize.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is itersize.
+
+        Returns:
+            (```Iterator```[```Patient```]): Iterator over all patients.
+        """
+        return iter(sorted(self.getAllPatients(), key=lambda patient: patient.patientID))
+
+    def getAllPatientsFrame(self, itersize: int | None = None) -> PatientFrame:
+        """
+        Get all patients as a columnar PatientFrame, ordered by patient ID.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is itersize.
+
+        Returns:
+            (```PatientFrame```): All patients.
+        """
+        frame: PatientFrame = PatientFrame()
+        for patient in self.iterAllPatients(itersize):
+            frame.append(patient)
+        return frame
+
+    @abstractmethod
+    def getAllPatientsWithDiagnoses(self) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get all patients and their diagnoses.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): All patients paired with their diagnoses, ordered by patient ID.
+        """
+
+    def iterAllPatientsWithDiagnoses(self, itersize: int | None = None) -> Iterator[tuple[Patient, List[Diagnosis]]]:
+        """
+        Iterate over all patients and their diagnoses ordered by patient ID. Storage that can stream rows overrides this to keep memory bounded by itersize.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is itersize.
+
+        Returns:
+            (```Iterator```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): Iterator over all patients paired with their diagnoses.
+        """
+        return iter(self.getAllPatientsWithDiagnoses())
+
+    @abstractmethod
+    def getPatientsPage(self, afterPatientID: int | None, limit: int) -> List[Patient]:
+        """
+        Get one page of patients ordered by patient ID.
+
+        Parameters:
+            afterPatientID (```int | None```): Patient ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of patients to return.
+
+        Returns:
+            (```List```[```Patient```]): Patients with a patient ID greater than afterPatientID.
+        """
+
+    @abstractmethod
+    def getPatientsWithDiagnosesPage(self, afterPatientID: int | None, limit: int) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get one page of patients and their diagnoses ordered by patient ID.
+
+        Parameters:
+            afterPatientID (```int | None```): Patient ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of patients to return.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): Patients with a patient ID greater than afterPatientID paired with their diagnoses.
+        """
+
+    @abstractmethod
+    def getPatientByID(self, patientID: int) -> Patient | None:
+        """
+        Get patient by patientID.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```Patient | None```): patient object or None
+        """
+
+    def getExistingPatientIDs(self, patientIDs: List[int]) -> set[int]:
+        """
+        Find which of many patient IDs are for real, existing patients. Storage with a batch query overrides this.
+
+        Parameters:
+            patientIDs (```List```[```int```]): Patient IDs to check.
+
+        Returns:
+            (```set```[```int```]): The patient IDs that exist.
+        """
+        return {patientID for patientID in patientIDs if self.getPatientByID(patientID) is not None}
+
+    @abstractmethod
+    def searchPatientsByName(self, namePrefix: str, limit: int, after: tuple[str, int] | None = None) -> List[tuple[Patient, str]]:
+        """
+        Get patients whose name starts with namePrefix (case-insensitive), ordered by lowercase name then patient ID.
+        The prefix and the names are lowercased the way the backend does it, and each patient is returned with its lowercase name to continue after.
+
+        Parameters:
+            namePrefix (```str```): Start of the patient name.
+            limit (```int```): Maximum number of patients to return.
+            after (```tuple```[```str```, ```int```] | None): Lowercase name and patient ID to continue after, or None for the first page.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```str```]]): Matching patients, each with its lowercase name.
+        """
+
+    @abstractmethod
+    def addPatient(self, patient: Patient) -> Patient | None:
+        """
+        Add patient.
+
+        Parameters:
+            patient (```Patient```): Patient object (No patientID!) to add.
+
+        Returns:
+            (```Patient | None```): Patient object with patientID, or None if it was not saved.
+        """
+
+    @abstractmethod
+    def addPatients(self, patients: List[Patient]) -> List[Patient] | None:
+        """
+        Add many patients, all or nothing.
+
+        Parameters:
+            patients (```List```[```Patient```]): Patient objects (No patientID!) to add.
+
+        Returns:
+            (```List```[```Patient```] | None): The same patient objects with their patientID, in input order, or None if nothing was saved.
+        """
+
+    @abstractmethod
+    def updatePatient(self, patient: Patient) -> Patient | None:
+        """
+        Update patient.
+
+        Parameters:
+            patient (```Patient```): Patient and their information to update.
+
+        Returns:
+            (```Patient | None```): Updated patient if update was successful or None otherwise.
+        """
+
+    @abstractmethod
+    def updatePatients(self, patients: List[Patient]) -> List[Patient] | None:
+        """
+        Update many patients, all or nothing. If any patient does not exist, nothing is updated.
+
+        Parameters:
+            patients (```List```[```Patient```]): Patients and their information to update.
+
+        Returns:
+            (```List```[```Patient```] | None): The same patient objects as updated, in input order, or None if nothing was updated.
+        """
+
+    @abstractmethod
+    def deletePatient(self, patientID: int) -> bool:
+        """
+        Delete patient at patientID. A patient that still has diagnoses is not deleted.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```bool```): True if patient at patient ID was deleted, False otherwise.
+        """
+
+
+class DiagnosisStorage(ABC):
+    """
+    Storage interface the diagnosis service is written against. DiagnosisDAO stores diagnoses in PostgreSQL, SQLiteDiagnosisDAO in an embedded SQLite file and MemoryDiagnosisDAO in process memory.
+    Implementations must be safe to share between threads, and must reject diagnoses for patients that do not exist.
+
+    Attributes:
+        (```class```) itersize (```int```): Default number of rows fetched per round-trip by the streaming iter* methods.
+    """
+
+    itersize: ClassVar[int] = 1000
+
+    @abstractmethod
+    def getAllDiagnosis(self) -> List[Diagnosis]:
+        """
+        Get all diagnoses.
+
+        Returns:
+            (```List```[```Diagnosis```]): All diagnoses. Empty list if there are none.
+        """
+
+    def iterAllDiagnosis(self, itersize: int | None = None) -> Iterator[Diagnosis]:
+        """
+        Iterate over all diagnoses ordered by diagnosis ID. Storage that can stream rows overrides this to keep memory bounded by itersize.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is itersize.
+
+        Returns:
+            (```Iterator```[```Diagnosis```]): Iterator over all diagnoses.
+        """
+        return iter(sorted(self.getAllDiagnosis(), key=lambda diagnosis: diagnosis.diagnosisID))
+
+    def getAllDiagnosisFrame(self, itersize: int | None = None) -> DiagnosisFrame:
+        """
+        Get all diagnoses as a columnar DiagnosisFrame, ordered by diagnosis ID.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is itersize.
+
+        Returns:
+            (```DiagnosisFrame```): All diagnoses.
+        """
+        frame: DiagnosisFrame = DiagnosisFrame()
+        for diagnosis in self.iterAllDiagnosis(itersize):
+            frame.append(diagnosis)
+        return frame
+
+    @abstractmethod
+    def getDiagnosesPage(self, afterDiagnosisID: int | None, limit: int) -> List[Diagnosis]:
+        """
+        Get one page of diagnoses ordered by diagnosis ID.
+
+        Parameters:
+            afterDiagnosisID (```int | None```): Diagnosis ID to continue after, or None for the first page.
+            limit (```int```): Maximum number of diagnoses to return.
+
+        Returns:
+            (```List```[```Diagnosis```]): Diagnoses with a diagnosis ID greater than afterDiagnosisID.
+        """
+
+    @abstractmethod
+    def getDiagnosesByPatientID(self, patientID: int) -> List[Diagnosis]:
+        """
+        Get all diagnoses for patient ID.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```List```[```Diagnosis```]): All diagnoses of the patient.
+        """
+
+    @abstractmethod
+    def getDiagnosisByID(self, diagnosisID: int) -> Diagnosis | None:
+        """
+        Get diagnosis for diagnosis ID.
+
+        Parameters:
+            diagnosisID (```int```): Diagnosis ID.
+
+        Returns:
+            (```Diangosis | None ```): Diagnosis object or None.
+        """
+
+    @abstractmethod
+    def addDignosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Add diagnosis.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis object (No diagnosisID!) to add.
+
+        Returns:
+            (```Diagnosis | None```): Diagnosis object with diagnosisID, or None if it was not saved.
+        """
+
+    @abstractmethod
+    def addDiagnoses(self, diagnoses: List[Diagnosis]) -> List[Diagnosis] | None:
+        """
+        Add many diagnoses, all or nothing.
+
+        Parameters:
+            diagnoses (```List```[```Diagnosis```]): Diagnosis objects (No diagnosisID!) to add.
+
+        Returns:
+            (```List```[```Diagnosis```] | None): The same diagnosis objects with their diagnosisID, in input order, or None if nothing was saved.
+        """
+
+    @abstractmethod
+    def addPatientAndDiagnosis(self, patient: Patient, diagnosis: Diagnosis) -> tuple[Patient, Diagnosis] | None:
+        """
+        Add a new patient and their diagnosis atomically. Either both are saved or neither is.
+
+        Parameters:
+            patient (```Patient```): Patient object (No patientID!) to add.
+            diagnosis (```Diagnosis```): Diagnosis object (No diagnosisID or patientID!) to add for patient.
+
+        Returns:
+            (```tuple```[```Patient```, ```Diagnosis```] | None): Patient with patientID and diagnosis with diagnosisID and patientID, or None if nothing was saved.
+        """
+
+    @abstractmethod
+    def updateDiagnosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Update diagnosis.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diangosis to update.
+
+        Returns:
+            (```Diagnosis | None```): Updated diagnosis if update was successful or None otherwise.
+        """
+
+    @abstractmethod
+    def updateDiagnosisIfPatientExists(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Update diagnosis only if both the diagnosis and its patient exist, checked in the same operation as the update.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diangosis to update.
+
+        Returns:
+            (```Diagnosis | None```): Updated diagnosis if update was successful, or None otherwise.
+        """
+
+    @abstractmethod
+    def deleteDiagnosis(self, diagnosisID: int) -> bool:
+        """
+        Delete diagnosis at diagnosisID.
+
+        Parameters:
+            diagnosisID (```int```): Diagnosis ID.
+
+        Returns:
+            (```bool```): True if diagnosis at diagnosis ID was deleted, False otherwise.
+        """
+
+    @abstractmethod
+    def deleteDiagnoses(self, diagnosisIDs: List[int]) -> int:
+        """
+        Delete many diagnoses.
+
+        Parameters:
+            diagnosisIDs (```List```[```int```]): Diagnosis IDs.
+
+        Returns:
+            (```int```): Number of diagnoses deleted. IDs without a diagnosis are skipped.
+        """
@@ -0,0 +1,149 @@
+import configparser
+import os
+import threading
+from typing import Any, ClassVar
+from dao.storage import DiagnosisStorage, PatientStorage
+from utils import config
+
+
+class StorageFactory:
+    """
+    Create the patient and diagnosis DAOs of the configured storage backend. The backend is chosen by the MEDBOT_STORAGE environment variable or the storage key in resources/config.ini:
+    postgres (default) for the PostgreSQL DAOs, sqlite for an embedded SQLite file at sqlite_path, or memory for a database that lives only as long as the process.
+    Backend modules are imported on first use, so psycopg is only needed when the postgres backend is used. Both DAOs of a factory share one backend database.
+
+    Attributes:
+        (```class```) backends (```tuple```[```str```, ...]): Supported storage backends.
+        backend (```str```): Storage backend the DAOs are created for.
+        sqlitePath (```str```): Database file of the sqlite backend.
+    """
+
+    backends: ClassVar[tuple[str, ...]] = ("postgres", "sqlite", "memory")
+
+    def __init__(self, backend: str | None = None, sqlitePath: str | None = None) -> None:
+        """
+        Constructor for StorageFactory class. Settings not given are read from the config file.
+
+        Parameters:
+            backend (```str | None```): Storage backend, one of StorageFactory.backends. Default is the MEDBOT_STORAGE environment variable, the storage key in config file, or postgres.
+            sqlitePath (```str | None```): Database file of the sqlite backend. Default is the sqlite_path key in config file (relative to the project), or resources/medbot.sqlite3 of the project.
+        """
+        settings: configparser.SectionProxy = config.getConfig()
+        self.backend: str = (backend or os.environ.get("MEDBOT_STORAGE") or settings.get('storage', fallback='postgres')).lower()
+        # A relative sqlite_path is relative to the project, like the config file, whatever the working directory.
+        self.sqlitePath: str = sqlitePath or os.path.join(os.path.dirname(os.path.dirname(config.defaultPath)), settings.get('sqlite_path', fallback=os.path.join('resources', 'medbot.sqlite3')))
+        if self.backend not in StorageFactory.backends:
+            raise ValueError(f"Unknown storage backend {self.backend}, expected one of {', '.join(StorageFactory.backends)}")
+
+        self.__database: Any = None
+        self.__patientDAO: PatientStorage | None = None
+        self.__diagnosisDAO: DiagnosisStorage | None = None
+        self.__lock: threading.Lock = threading.Lock()
+
+    def getPatientDAO(self) -> PatientStorage:
+        """
+        Get the patient DAO of the backend, creating it on first use.
+
+        Returns:
+            (```PatientStorage```): The patient DAO.
+        """
+        with self.__lock:
+            if self.__patientDAO is None:
+                if self.backend == "postgres":
+                    from dao.patientDAO import PatientDAO
+                    self.__patientDAO = PatientDAO()
+                elif self.backend == "sqlite":
+                    from dao.sqliteStorage import SQLitePatientDAO
+                    self.__patientDAO = SQLitePatientDAO(self.__getDatabase())
+                else:
+                    from dao.memoryStorage import MemoryPatientDAO
+                    self.__patientDAO = MemoryPatientDAO(self.__getDatabase())
+            return self.__patientDAO
+
+    def getDiagnosisDAO(self) -> DiagnosisStorage:
+        """
+        Get the diagnosis DAO of the backend, creating it on first use.
+
+        Returns:
+            (```DiagnosisStorage```): The diagnosis DAO.
+        """
+        with self.__lock:
+            if self.__diagnosisDAO is None:
+                if self.backend == "postgres":
+                    from dao.diagnosisDAO import DiagnosisDAO
+                    self.__diagnosisDAO = DiagnosisDAO()
+                elif self.backend == "sqlite":
+                    from dao.sqliteStorage import SQLiteDiagnosisDAO
+                    self.__diagnosisDAO = SQLiteDiagnosisDAO(self.__getDatabase())
+                else:
+                    from dao.memoryStorage import MemoryDiagnosisDAO
+                    self.__diagnosisDAO = MemoryDiagnosisDAO(self.__getDatabase())
+            return self.__diagnosisDAO
+
+    def close(self) -> None:
+        """
+        Release the backend: close the PostgreSQL connection pool or the SQLite connection, if they were opened. The memory backend's data is dropped.
+        """
+        with self.__lock:
+            if self.backend == "postgres":
+                if self.__patientDAO is not None or self.__diagnosisDAO is not None:
+                    from utils import connectionUtil
+                    connectionUtil.closePool()
+            elif self.backend == "sqlite" and self.__database is not None:
+                self.__database.close()
+            self.__database = None
+            self.__patientDAO = None
+            self.__diagnosisDAO = None
+
+    def __getDatabase(self) -> Any:
+        """
+        Get the embedded database shared by the sqlite or memory DAOs, creating it on first use. Called with the lock held.
+
+        Returns:
+            (```SQLiteDatabase | MemoryDatabase```): The shared database.
+        """
+        if self.__database is None:
+            if self.backend == "sqlite":
+                from dao.sqliteStorage import SQLiteDatabase
+                self.__database = SQLiteDatabase(self.sqlitePath)
+            else:
+                from dao.memoryStorage import MemoryDatabase
+                self.__database = MemoryDatabase()
+        return self.__database
+
+
+factory: StorageFactory | None = None
+factoryLock: threading.Lock = threading.Lock()
+
+def getFactory() -> StorageFactory:
+    """
+    Get the shared storage factory for the configured backend, creating it on first use.
+
+    Returns:
+        (```StorageFactory```): The shared storage factory.
+    """
+    global factory
+    if factory is not None:
+        return factory
+    with factoryLock:
+        if factory is None:
+            factory = StorageFactory()
+    return factory
+
+def setFactory(storageFactory: StorageFactory) -> None:
+    """
+    Replace the shared storage factory, e.g. to run on the memory backend in tests. Services created afterwards use its DAOs.
+
+    Parameters:
+        storageFactory (```StorageFactory```): Factory to share.
+    """
+    global factory
+    with factoryLock:
+        factory = storageFactory
+
+def closeStorage() -> None:
+    """
+    Close the shared storage factory's backend, if it was created.
+    """
+    if factory is not None:
+        factory.close()
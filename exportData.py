@@ -0,0 +1,36 @@
+import argparse
+import os
+
+from services.exportService import ExportReport, ExportService
+from utils import connectionUtil
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Export every patient with their diagnosis history to CSV, JSONL or Parquet.")
+    parser.add_argument("path", help="File to write.")
+    parser.add_argument("--format", choices=["csv", "jsonl", "parquet"], default="csv", help="Output format. Default is csv.")
+    parser.add_argument("--compression", default=None, help="gzip, bz2 or xz for csv/jsonl; a pyarrow codec such as snappy or zstd for parquet. Default is none.")
+    parser.add_argument("--since", type=int, default=None, help="Only export diagnoses with a diagnosis ID greater than this.")
+    parser.add_argument("--state-file", default=None, help="File holding the database snapshot of the previous export. When present, only diagnoses committed since that export are exported. Updated after every export, for nightly incremental exports.")
+    args: argparse.Namespace = parser.parse_args()
+
+    sinceDiagnosisID: int | None = args.since
+    sinceSnapshot: str | None = None
+    if sinceDiagnosisID is None and args.state_file is not None and os.path.exists(args.state_file):
+        with open(args.state_file) as stateFile:
+            state: str = stateFile.read().strip()
+        # State files written before snapshots were used hold the last exported diagnosis ID.
+        if state.isdecimal():
+            sinceDiagnosisID = int(state)
+        else:
+            sinceSnapshot = state
+
+    report: ExportReport = ExportService().exportFile(args.path, args.format, args.compression, sinceDiagnosisID, sinceSnapshot)
+    connectionUtil.closePool()
+
+    if args.state_file is not None and report.snapshot is not None:
+        with open(args.state_file, "w") as stateFile:
+            stateFile.write(report.snapshot)
+    print(report)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import argparse
+import sys
+
+from services.importService import ImportReport, ImportService
+from utils import connectionUtil
+from utils.arguments import positiveInt
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Bulk import patients and diagnoses from a CSV or JSONL file.")
+    parser.add_argument("path", help="CSV or JSONL file to import, or - to read from stdin.")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="Input format. Default is taken from the file extension (required for stdin).")
+    parser.add_argument("--batch-size", type=positiveInt, default=5000, help="Records copied per transaction. Default is 5000.")
+    args: argparse.Namespace = parser.parse_args()
+
+    importService: ImportService = ImportService(batchSize=args.batch_size)
+    report: ImportReport
+    if args.path == "-":
+        if args.format is None:
+            parser.error("--format is required when reading from stdin")
+        report = importService.importStream(sys.stdin, args.format)
+    else:
+        report = importService.importFile(args.path, args.format)
+    connectionUtil.closePool()
+
+    print(report)
+    for lineNumber, reason in report.rejected:
+        print(f"Rejected line {lineNumber}: {reason}")
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,53 @@
+import argparse
+import sys
 
 from bots.medicalBot import MedicalBot
+from dao import storageFactory
+from utils.arguments import positiveInt
 
-welcomePrompt: str = "Welcome doctor, what would you like to do?\n - To list all patients, press 1\n - To run a new diagnosis, press 2\n - To quit, press q\n"
+welcomePrompt: str = "Welcome doctor, what would you like to do?\n - To list all patients, press 1\n - To run a new diagnosis, press 2\n - To search patients by name, press 3\n - To quit, press q\n"
 patientTypePrompt: str = "Is this a new patient or returning patient?\n - New patient, press 1\n - Returning patient, press 2\n"
 patientIDPrompt: str = "Please enter patient ID:\n"
 
+def runBatch(path: str, format: str | None, batchSize: int) -> None:
+    """
+    Diagnose every record of an intake answer file without prompting, save the results in batches and print a throughput report.
+
+    Parameters:
+        path (```str```): CSV or JSONL file of patient details and questionnaire answers, or - to read from stdin.
+        format (```str | None```): "csv" or "jsonl". Default is taken from the file extension.
+        batchSize (```int```): Records diagnosed and saved per batch.
+    """
+    # Imported here so the interactive bot does not pay for it.
+    from dao.bulkDAO import BulkDAO
+    from services.intakeService import IntakeReport, IntakeService
+
+    # On PostgreSQL, batches are saved with COPY; the other backends save through the services.
+    bulkDAO: BulkDAO | None = BulkDAO() if storageFactory.getFactory().backend == "postgres" else None
+    intakeService: IntakeService = IntakeService(bulkDAO=bulkDAO, batchSize=batchSize)
+    report: IntakeReport
+    if path == "-":
+        report = intakeService.processStream(sys.stdin, format)
+    else:
+        report = intakeService.processFile(path, format)
+    storageFactory.closeStorage()
+
+    print(report)
+    for lineNumber, reason in report.rejected:
+        print(f"Rejected line {lineNumber}: {reason}")
+
 def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Dehydration assessment bot. Runs interactively, or with --batch diagnoses intake records from a file without prompting.")
+    parser.add_argument("--batch", metavar="PATH", default=None, help="CSV or JSONL file of patient details and questionnaire answers (appearance, eyes, skin), or - to read from stdin.")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="Batch input format. Default is taken from the file extension (required for stdin).")
+    parser.add_argument("--batch-size", type=positiveInt, default=1000, help="Records diagnosed and saved per batch. Default is 1000.")
+    args: argparse.Namespace = parser.parse_args()
+    if args.batch is not None:
+        if args.batch == "-" and args.format is None:
+            parser.error("--format is required when reading from stdin")
+        runBatch(args.batch, args.format, args.batch_size)
+        return
+
     medicalbot: MedicalBot = MedicalBot()
     while True:
         selection: str = input(welcomePrompt)
@@ -20,7 +62,12 @@ def main() -> None:
             elif patientType == "2":
                 patientID: int = int(input(patientIDPrompt))
                 medicalbot.newDiagnosis(patientID)
+        elif selection == "3":
+            # Search patients by name
+            medicalbot.searchPatients()
         elif selection == "q":
+            storageFactory.closeStorage()
             return
 
-main()
+if __name__ == "__main__":
+    main()
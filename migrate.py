@@ -0,0 +1,31 @@
+import argparse
+import sys
+from typing import List
+
+from services.migrationService import Migration, MigrationService
+from utils import connectionUtil
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Apply pending schema migrations from resources/sql/migrations.")
+    parser.add_argument("--status", action="store_true", help="List pending migrations without applying them.")
+    args: argparse.Namespace = parser.parse_args()
+
+    migrationService: MigrationService = MigrationService()
+    pending: List[Migration] = migrationService.getPendingMigrations()
+    if args.status or len(pending) == 0:
+        print(f"{len(pending)} pending migration(s)")
+        for migration in pending:
+            print(f" - {migration}")
+        connectionUtil.closePool()
+        return
+
+    applied: List[Migration] = migrationService.migrate()
+    connectionUtil.closePool()
+    for migration in applied:
+        print(f"Applied {migration}")
+    if len(applied) < len(pending):
+        print(f"Migration {pending[len(applied)]} failed, {len(pending) - len(applied)} migration(s) still pending")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,26 +1,99 @@
 
+from enum import IntEnum
+from typing import Dict
+
+
+class DiagnosisLevel(IntEnum):
+    """
+    Dehydration level of a diagnosis. Stored in the database as its smallint code; labels come from diagnosisLabels.
+    """
+
+    NO_DEHYDRATION = 1
+    SOME_DEHYDRATION = 2
+    SEVERE_DEHYDRATION = 3
+
+    @property
+    def label(self) -> str:
+        """
+        Diagnosis label of this level.
+
+        Returns:
+            (```str```): Label, such as "Some dehydration".
+        """
+        return diagnosisLabels[self]
+
+    @classmethod
+    def of(cls, value: "str | int | DiagnosisLevel | None") -> "DiagnosisLevel | None":
+        """
+        Get the level of a label or code.
+
+        Parameters:
+            value (```str | int | DiagnosisLevel | None```): Diagnosis label (case-insensitive), smallint code or level.
+
+        Returns:
+            (```DiagnosisLevel | None```): The level, or None if value is not a known label or code.
+        """
+        if isinstance(value, str):
+            return diagnosisLevels.get(value.strip().lower())
+        if isinstance(value, int) and value in cls._value2member_map_:
+            return cls(value)
+        return None
+
+
+diagnosisLabels: Dict[DiagnosisLevel, str] = {
+    DiagnosisLevel.NO_DEHYDRATION: "No dehydration",
+    DiagnosisLevel.SOME_DEHYDRATION: "Some dehydration",
+    DiagnosisLevel.SEVERE_DEHYDRATION: "Severe dehydration",
+}
+
+diagnosisLevels: Dict[str, DiagnosisLevel] = {label.lower(): level for level, label in diagnosisLabels.items()}
+
+
 class Diagnosis:
     """
     Class to hold diagnosis information: patientID, diagnosis, diagnosisID
     
     Attributes:
         patientID (```int | None```): Patient ID referencing patient in patient database.
-        diagnosis (```str```): Diagnosis of the patient.
+        level (```DiagnosisLevel | None```): Diagnosis of the patient, or None if there is no valid diagnosis.
+        diagnosis (```str```): Label of level, or "" if there is no valid diagnosis. Setting it to a label or code sets level.
         diagnosisID (```int | None```): ID given to diagnosis by database.
     """
 
-    def __init__(self, diagnosis: str, patientID: int | None = None, diagnosisID: int | None = None) -> None:
+    __slots__ = ("diagnosisID", "patientID", "level")
+
+    def __init__(self, diagnosis: str | int | DiagnosisLevel | None, patientID: int | None = None, diagnosisID: int | None = None) -> None:
         """
         Constructor for Diagnosis class.
 
         Attributes:
             patientID (```int | None```): Patient ID referencing patient in patient database.
-            diagnosis (```str```): Diagnosis of the patient.
+            diagnosis (```str | int | DiagnosisLevel | None```): Diagnosis of the patient, as a label, smallint code or level.
             diagnosisID (```int | None```): ID given to diagnosis by database.
         """
         self.diagnosisID: int | None = diagnosisID
         self.patientID: int | None = patientID
-        self.diagnosis: str = diagnosis
+        self.level: DiagnosisLevel | None = DiagnosisLevel.of(diagnosis)
+
+    @property
+    def diagnosis(self) -> str:
+        """
+        Label of the diagnosis.
+
+        Returns:
+            (```str```): Label of level, or "" if there is no valid diagnosis.
+        """
+        return "" if self.level is None else self.level.label
+
+    @diagnosis.setter
+    def diagnosis(self, diagnosis: str | int | DiagnosisLevel | None) -> None:
+        """
+        Set the diagnosis from a label, smallint code or level.
+
+        Parameters:
+            diagnosis (```str | int | DiagnosisLevel | None```): Diagnosis of the patient.
+        """
+        self.level = DiagnosisLevel.of(diagnosis)
 
     def __str__(self) -> str:
         """
@@ -51,7 +124,7 @@ class Diagnosis:
             return False
         if not isinstance(other, Diagnosis):
             return False
-        return (self.diagnosisID == other.diagnosisID and self.patientID == other.patientID and self.diagnosis == other.diagnosis)
+        return (self.diagnosisID == other.diagnosisID and self.patientID == other.patientID and self.level == other.level)
     
     def __hash__(self) -> int:
         """
@@ -60,4 +133,4 @@ class Diagnosis:
         Returns:
             (```int```): Hash of diagnosisID, patientID and diagnosis.
         """
-        return hash((self.diagnosisID, self.patientID, self.diagnosis))
\ No newline at end of file
+        return hash((self.diagnosisID, self.patientID, self.level))
\ No newline at end of file
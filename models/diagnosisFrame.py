@@ -0,0 +1,101 @@
+import sys
+from array import array
+from typing import Any, Iterator, List
+from models.diagnosis import Diagnosis, DiagnosisLevel
+
+
+class DiagnosisFrame:
+    """
+    Columnar collection of diagnoses: one compact array per field instead of one Diagnosis object per row.
+    Diagnoses are stored as their DiagnosisLevel code, so each row costs a single byte for its diagnosis instead of a repeated string.
+    Columns can be handed to NumPy without copying, for example numpy.asarray(frame.codes).
+
+    Attributes:
+        diagnosisIDs (```array```): Diagnosis ID of each row.
+        patientIDs (```array```): Patient ID of each row.
+        codes (```array```): DiagnosisLevel code of each row, 0 if the row has no valid diagnosis.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for DiagnosisFrame class. Creates an empty frame.
+        """
+        self.diagnosisIDs: array = array("q")
+        self.patientIDs: array = array("q")
+        self.codes: array = array("B")
+
+    def appendRow(self, row: tuple[Any, ...]) -> None:
+        """
+        Append a diagnosis row as read from the diagnosis table.
+
+        Parameters:
+            row (```tuple```[```Any```, ...]): diagnosis_id, patient_id, diagnosis.
+        """
+        diagnosisID, patientID, diagnosis = row
+        self.diagnosisIDs.append(diagnosisID)
+        self.patientIDs.append(patientID)
+        self.codes.append(self.codeOf(diagnosis))
+
+    def append(self, diagnosis: Diagnosis) -> None:
+        """
+        Append a diagnosis.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis to append.
+        """
+        self.appendRow((diagnosis.diagnosisID, diagnosis.patientID, diagnosis.level))
+
+    @staticmethod
+    def codeOf(diagnosis: str | int | DiagnosisLevel | None) -> int:
+        """
+        Get the stored code of a diagnosis.
+
+        Parameters:
+            diagnosis (```str | int | DiagnosisLevel | None```): Diagnosis label, smallint code or level.
+
+        Returns:
+            (```int```): DiagnosisLevel code, or 0 if diagnosis is not a known level.
+        """
+        level: DiagnosisLevel | None = DiagnosisLevel.of(diagnosis)
+        return 0 if level is None else int(level)
+
+    def nbytes(self) -> int:
+        """
+        Approximate memory used by the frame's columns.
+
+        Returns:
+            (```int```): Size in bytes.
+        """
+        columns: List[array] = [self.diagnosisIDs, self.patientIDs, self.codes]
+        return sum(sys.getsizeof(column) for column in columns)
+
+    def __getitem__(self, index: int) -> Diagnosis:
+        """
+        Build the Diagnosis object of one row.
+
+        Parameters:
+            index (```int```): Row index.
+
+        Returns:
+            (```Diagnosis```): Diagnosis of the row.
+        """
+        return Diagnosis(self.codes[index], self.patientIDs[index], self.diagnosisIDs[index])
+
+    def __iter__(self) -> Iterator[Diagnosis]:
+        """
+        Iterate over the rows as Diagnosis objects, built one at a time.
+
+        Returns:
+            (```Iterator```[```Diagnosis```]): Iterator over the diagnoses.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        """
+        Number of rows.
+
+        Returns:
+            (```int```): Number of diagnoses in the frame.
+        """
+        return len(self.diagnosisIDs)
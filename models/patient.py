@@ -12,6 +12,8 @@ class Patient:
         patientID (```int | None```): ID given to patient by database.
     """
 
+    __slots__ = ("patientID", "name", "age", "gender", "height", "weight")
+
     def __init__(self, name: str, age: int, gender: str, height: int, weight: int, patientID: int | None = None) -> None:
         """
         Constructor for Patient class.
@@ -71,3 +73,11 @@ class Patient:
         """
         return hash((self.name, self.age, self.gender, self.height, self.weight))
     
+    def copy(self) -> "Patient":
+        """
+        Copy of this patient, so changes to one do not change the other.
+
+        Returns:
+            (```Patient```): New patient object with the same information.
+        """
+        return Patient(self.name, self.age, self.gender, self.height, self.weight, self.patientID)
@@ -0,0 +1,123 @@
+import sys
+from array import array
+from typing import Any, ClassVar, Dict, Iterator, List
+from models.patient import Patient
+
+
+class PatientFrame:
+    """
+    Columnar collection of patients: one compact array per field instead of one Patient object per row.
+    Integer columns are array.array buffers (missing values stored as nullValue) and genders are interned as small integer codes, so a large patient table costs a few bytes per field instead of a full object per row.
+    Columns can be handed to NumPy without copying, for example numpy.asarray(frame.ages).
+
+    Attributes:
+        (```class```) nullValue (```int```): Value stored in integer columns for a missing age, height or weight.
+        patientIDs (```array```): Patient ID of each row.
+        names (```List```[```str```]): Name of each row.
+        ages (```array```): Age of each row.
+        genderCodes (```array```): Gender code of each row, an index into genders.
+        heights (```array```): Height of each row.
+        weights (```array```): Weight of each row.
+        genders (```List```[```str | None```]): Distinct genders, by code.
+    """
+
+    nullValue: ClassVar[int] = -2 ** 31
+
+    def __init__(self) -> None:
+        """
+        Constructor for PatientFrame class. Creates an empty frame.
+        """
+        self.patientIDs: array = array("q")
+        self.names: List[str] = []
+        self.ages: array = array("i")
+        self.genderCodes: array = array("H")
+        self.heights: array = array("i")
+        self.weights: array = array("i")
+        self.genders: List[str | None] = []
+        self.__genderCodeOf: Dict[str | None, int] = {}
+
+    def appendRow(self, row: tuple[Any, ...]) -> None:
+        """
+        Append a patient row as read from the patient table.
+
+        Parameters:
+            row (```tuple```[```Any```, ...]): patient_id, name, age, gender, height, weight.
+        """
+        patientID, name, age, gender, height, weight = row
+        self.patientIDs.append(patientID)
+        self.names.append(name)
+        self.ages.append(self.nullValue if age is None else age)
+        self.genderCodes.append(self.__genderCode(gender))
+        self.heights.append(self.nullValue if height is None else height)
+        self.weights.append(self.nullValue if weight is None else weight)
+
+    def append(self, patient: Patient) -> None:
+        """
+        Append a patient.
+
+        Parameters:
+            patient (```Patient```): Patient to append.
+        """
+        self.appendRow((patient.patientID, patient.name, patient.age, patient.gender, patient.height, patient.weight))
+
+    def nbytes(self) -> int:
+        """
+        Approximate memory used by the frame's columns, including the name strings.
+
+        Returns:
+            (```int```): Size in bytes.
+        """
+        columns: List[array] = [self.patientIDs, self.ages, self.genderCodes, self.heights, self.weights]
+        return sum(sys.getsizeof(column) for column in columns) + sys.getsizeof(self.names) + sum(sys.getsizeof(name) for name in self.names)
+
+    def __getitem__(self, index: int) -> Patient:
+        """
+        Build the Patient object of one row.
+
+        Parameters:
+            index (```int```): Row index.
+
+        Returns:
+            (```Patient```): Patient of the row.
+        """
+        def value(column: array) -> int | None:
+            stored: int = column[index]
+            return None if stored == self.nullValue else stored
+
+        return Patient(self.names[index], value(self.ages), self.genders[self.genderCodes[index]], value(self.heights), value(self.weights), self.patientIDs[index])
+
+    def __iter__(self) -> Iterator[Patient]:
+        """
+        Iterate over the rows as Patient objects, built one at a time.
+
+        Returns:
+            (```Iterator```[```Patient```]): Iterator over the patients.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        """
+        Number of rows.
+
+        Returns:
+            (```int```): Number of patients in the frame.
+        """
+        return len(self.patientIDs)
+
+    def __genderCode(self, gender: str | None) -> int:
+        """
+        Get the code of a gender, adding it to genders if it is new.
+
+        Parameters:
+            gender (```str | None```): Gender.
+
+        Returns:
+            (```int```): Gender code.
+        """
+        code: int | None = self.__genderCodeOf.get(gender)
+        if code is None:
+            code = len(self.genders)
+            self.genders.append(gender)
+            self.__genderCodeOf[gender] = code
+        return code
@@ -1,5 +1,5 @@
 INSERT INTO patient (name, age, gender, height, weight) VALUES ('John', 55, 'M', 66, 200);
-INSERT INTO diagnosis (patient_id, diagnosis) VALUES (1, 'No dehydration');
+INSERT INTO diagnosis (patient_id, diagnosis) VALUES (1, 1);
 
 INSERT INTO patient (name, age, gender, height, weight) VALUES ('Jane', 50, 'F', 60, 115);
-INSERT INTO diagnosis (patient_id, diagnosis) VALUES (2, 'Some dehydration');
\ No newline at end of file
+INSERT INTO diagnosis (patient_id, diagnosis) VALUES (2, 2);
\ No newline at end of file
@@ -12,6 +12,6 @@ CREATE TABLE Patient(
 CREATE TABLE Diagnosis(
 	diagnosis_id SERIAL PRIMARY KEY,
 	patient_id INT,
-	diagnosis VARCHAR(255) NOT NULL,
+	diagnosis SMALLINT NOT NULL CONSTRAINT diagnosis_level_check CHECK (diagnosis BETWEEN 1 AND 3), -- DiagnosisLevel code
 	FOREIGN KEY (patient_id) REFERENCES Patient(patient_id)
 );
\ No newline at end of file
@@ -0,0 +1,17 @@
+-- Convert diagnosis labels stored as text into DiagnosisLevel smallint codes.
+-- Safe to run more than once: does nothing if the column is already a smallint.
+DO $$
+BEGIN
+	IF (SELECT data_type FROM information_schema.columns
+		WHERE table_schema = current_schema() AND table_name = 'diagnosis' AND column_name = 'diagnosis') <> 'smallint' THEN
+		ALTER TABLE Diagnosis ALTER COLUMN diagnosis TYPE SMALLINT USING (
+			CASE lower(trim(diagnosis))
+				WHEN 'no dehydration' THEN 1
+				WHEN 'some dehydration' THEN 2
+				WHEN 'severe dehydration' THEN 3
+			END
+		);
+		ALTER TABLE Diagnosis ADD CONSTRAINT diagnosis_level_check CHECK (diagnosis BETWEEN 1 AND 3);
+	END IF;
+END
+$$;
@@ -0,0 +1,2 @@
+-- Index the diagnosis foreign key so diagnoses by patient and the foreign key check on patient delete use an index scan.
+CREATE INDEX IF NOT EXISTS diagnosis_patient_id_idx ON Diagnosis (patient_id);
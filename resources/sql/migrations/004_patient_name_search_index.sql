@@ -0,0 +1,3 @@
+-- Patient search by name prefix, paged by (lower(name), patient_id). The "C" collation lets the index serve both
+-- lower(name) LIKE 'abc%' and the keyset ORDER BY, so each page is a short index range scan.
+CREATE INDEX IF NOT EXISTS patient_name_search_idx ON Patient ((lower(name) COLLATE "C"), patient_id);
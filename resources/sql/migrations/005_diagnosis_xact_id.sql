@@ -0,0 +1,6 @@
+-- Record the transaction that inserted each diagnosis, so incremental exports can select the rows committed since the
+-- previous export's snapshot. Diagnosis IDs cannot be used for that: they are handed out at insert time, but rows become
+-- visible at commit time, so a lower ID can commit after a higher one has already been exported.
+-- Existing rows get the migration's transaction ID, which every later export snapshot sees as committed.
+ALTER TABLE Diagnosis ADD COLUMN IF NOT EXISTS xact_id XID8 NOT NULL DEFAULT pg_current_xact_id();
+CREATE INDEX IF NOT EXISTS diagnosis_xact_id_idx ON Diagnosis (xact_id);
@@ -0,0 +1,107 @@
+import argparse
+import asyncio
+
+from bots.botSession import BotSession
+from services.asyncDiagnosisService import AsyncDiagnosisService
+from services.asyncPatientService import AsyncPatientService
+from utils import connectionUtil
+from utils.metrics import metrics
+
+promptMarker: bytes = b"> "
+sessionErrorMessage: bytes = b"Session ended because of an error.\n"
+
+patientService: AsyncPatientService = AsyncPatientService()
+diagnosisService: AsyncDiagnosisService = AsyncDiagnosisService(patientService=patientService)
+
+async def handleSession(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    Run one questionnaire session over a TCP connection. Each message from the server ends with a "> " prompt marker and each answer is one line.
+    Any error in the session (such as an answer line longer than the stream limit) ends that session with a message to the client, and does not affect other sessions.
+
+    Parameters:
+        reader (```asyncio.StreamReader```): Stream to read the clinician's answers from.
+        writer (```asyncio.StreamWriter```): Stream to write prompts to.
+    """
+    session: BotSession = BotSession(patientService, diagnosisService)
+    try:
+        writer.write(session.start().encode() + promptMarker)
+        await writer.drain()
+        while not session.finished:
+            line: bytes = await reader.readline()
+            if line == b"":
+                break
+            response: str = await session.answer(line.decode(errors="replace"))
+            if session.finished:
+                break
+            writer.write(response.encode() + promptMarker)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    except Exception as e:
+        print(f"Session {writer.get_extra_info('peername')} failed: {e!r}")
+        try:
+            writer.write(sessionErrorMessage)
+            await writer.drain()
+        except ConnectionError:
+            pass
+    finally:
+        writer.close()
+
+async def handleMetrics(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    """
+    Answer an HTTP request with the database metrics in Prometheus text format, whatever the path.
+
+    Parameters:
+        reader (```asyncio.StreamReader```): Stream to read the request from.
+        writer (```asyncio.StreamWriter```): Stream to write the response to.
+    """
+    try:
+        while (await reader.readline()).strip() != b"":
+            pass
+        body: bytes = metrics.toPrometheus().encode()
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/plain; version=0.0.4\r\nContent-Length: " + str(len(body)).encode() + b"\r\nConnection: close\r\n\r\n" + body)
+        await writer.drain()
+    except ConnectionError:
+        pass
+    except Exception as e:
+        print(f"Metrics request from {writer.get_extra_info('peername')} failed: {e!r}")
+    finally:
+        writer.close()
+
+async def serve(host: str, port: int, metricsPort: int | None = None) -> None:
+    """
+    Serve questionnaire sessions until cancelled. All sessions share one asyncio connection pool and patient cache.
+
+    Parameters:
+        host (```str```): Address to listen on.
+        port (```int```): Port to listen on.
+        metricsPort (```int | None```): Port to serve Prometheus metrics on over HTTP, or None for no metrics endpoint. Default is None.
+    """
+    await connectionUtil.getAsyncPool()
+    server: asyncio.Server = await asyncio.start_server(handleSession, host, port)
+    print(f"Serving MedicalBot sessions on {host}:{port}")
+    metricsServer: asyncio.Server | None = None
+    if metricsPort is not None:
+        metricsServer = await asyncio.start_server(handleMetrics, host, metricsPort)
+        print(f"Serving metrics on http://{host}:{metricsPort}/metrics")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if metricsServer is not None:
+            metricsServer.close()
+        await connectionUtil.closeAsyncPool()
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description="Serve concurrent MedicalBot questionnaire sessions over TCP.")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on. Default is 127.0.0.1.")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on. Default is 8765.")
+    parser.add_argument("--metrics-port", type=int, default=None, help="Port to serve database metrics on in Prometheus text format. Default is no metrics endpoint.")
+    args: argparse.Namespace = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.metrics_port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
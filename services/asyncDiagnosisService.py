@@ -0,0 +1,145 @@
+import asyncio
+from typing import List
+from dao.asyncDiagnosisDAO import AsyncDiagnosisDAO
+from models.diagnosis import Diagnosis
+from models.patient import Patient
+from services.asyncPatientService import AsyncPatientService, getDefaultAsyncPatientService
+from services.diagnosisService import DiagnosisService
+from services.patientService import PatientService
+
+
+class AsyncDiagnosisService:
+    """
+    Asyncio counterpart of DiagnosisService. Validate input and access DAO.
+
+    Attributes:
+        diagnosisDAO (```AsyncDiagnosisDAO```): Async diagnosis DAO object to access diagnosis information.
+        patientService (```AsyncPatientService```): Async patient service object used to check patients exist, sharing its patient cache.
+    """
+
+    def __init__(self, diagnosisDAO: AsyncDiagnosisDAO | None = None, patientService: AsyncPatientService | None = None) -> None:
+        """
+        Consturctor for AsyncDiagnosisService class.
+
+        Attributes:
+            diagnosisDAO (```AsyncDiagnosisDAO```): Async diagnosis DAO object to access diagnosis information.
+            patientService (```AsyncPatientService```): Async patient service object used to check patients exist. Default is the shared getDefaultAsyncPatientService(), so services share one patient cache.
+        """
+        if diagnosisDAO is None:
+            self.diagnosisDAO = AsyncDiagnosisDAO()
+        else:
+            self.diagnosisDAO = diagnosisDAO
+
+        if patientService is None:
+            self.patientService = getDefaultAsyncPatientService()
+        else:
+            self.patientService = patientService
+
+    async def getAllDiagnoses(self) -> List[Diagnosis]:
+        """
+        Get a list of all diagnosies in the database.
+
+        Returns:
+            (```List```[```Diagnosis```]): A list of all diagnoses in database.
+        """
+        return await self.diagnosisDAO.getAllDiagnosis()
+
+    async def getDiagnosesByPatientID(self, patientID: int) -> List[Diagnosis] | None:
+        """
+        Get a list of all diagnoses for patientID if patientID is for a real, existing patient, in the database.
+        The patient check and the diagnosis query run concurrently.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```List```[```Diagnosis```]): List of diagnoses for patientID.
+        """
+        patient: Patient | None
+        diagnoses: List[Diagnosis]
+        patient, diagnoses = await asyncio.gather(self.patientService.getPatientByID(patientID), self.diagnosisDAO.getDiagnosesByPatientID(patientID))
+        if patient is None:
+            return None
+        return diagnoses
+
+    async def getDiagnosisByID(self, diagnosisID: int) -> Diagnosis | None:
+        """
+        Get a diagnosis by diagnosisID from the database.
+
+        Parameters:
+            diagnosisID (```int```): Diagnosis ID
+
+        Returns:
+            (```Diagnosis | None```): The diagnosis at diagnosis ID or None if no diagnosis is found.
+        """
+        return await self.diagnosisDAO.getDiagnosisByID(diagnosisID)
+
+    async def createDiagnosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Create diagnosis in database if patient ID is for a real existing patient and diagnosis.diagnosis is not None and not "".
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis to add to database.
+
+        Returns:
+            (```Diagnosis | None```): The newly created diagnosis with diagnosisID.
+        """
+        if not DiagnosisService.validateDiagnosis(diagnosis):
+            return None
+        if await self.patientService.getPatientByID(diagnosis.patientID) is None:
+            return None
+        return await self.diagnosisDAO.addDignosis(diagnosis)
+
+    async def createPatientAndDiagnosis(self, patient: Patient, diagnosis: Diagnosis) -> tuple[Patient, Diagnosis] | None:
+        """
+        Create a new patient and their diagnosis in database in one transaction if patient.name and diagnosis.diagnosis are not None and not "".
+
+        Parameters:
+            patient (```Patient```): New patient to add to database.
+            diagnosis (```Diagnosis```): Diagnosis of the new patient to add to database.
+
+        Returns:
+            (```tuple```[```Patient```, ```Diagnosis```] | None): The newly created patient with patientID and diagnosis with diagnosisID, or None if nothing was created.
+        """
+        if not PatientService.validatePatient(patient):
+            return None
+        if not DiagnosisService.validateDiagnosis(diagnosis):
+            return None
+        created: tuple[Patient, Diagnosis] | None = await self.diagnosisDAO.addPatientAndDiagnosis(patient, diagnosis)
+        if created is not None:
+            self.patientService.cachePatient(patient)
+        return created
+
+    async def updateDiagnosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
+        """
+        Update diagnosis in database if patient ID is for a real, existing patient, diangosis ID is for a real, existing diagnosis, and diagnosis.diagnosis is not None and not "".
+        The patient and diagnosis checks run concurrently.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis to update in database.
+
+        Returns:
+            (```Diagnosis```): Updated diagnosis if update is successful, or None otherwise.
+        """
+        if not DiagnosisService.validateDiagnosis(diagnosis):
+            return None
+        patient: Patient | None
+        checkDiagnosis: Diagnosis | None
+        patient, checkDiagnosis = await asyncio.gather(self.patientService.getPatientByID(diagnosis.patientID), self.diagnosisDAO.getDiagnosisByID(diagnosis.diagnosisID))
+        if patient is None or checkDiagnosis is None:
+            return None
+        return await self.diagnosisDAO.updateDiagnosis(diagnosis)
+
+    async def deleteDiagnosis(self, diagnosisID: int) -> bool:
+        """
+        Delete diagnosis at diagnosis ID if diagnosis ID is for a real, existing diagnosis.
+
+        Parameters:
+            diangosisID (```int```): Diagnosis ID.
+
+        Returns:
+            (```bool```): True if delete is successful, False otherwise.
+        """
+        if await self.diagnosisDAO.getDiagnosisByID(diagnosisID) is None:
+            return False
+        return await self.diagnosisDAO.deleteDiagnosis(diagnosisID)
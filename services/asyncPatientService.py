@@ -0,0 +1,176 @@
+import asyncio
+import threading
+from typing import Dict, List
+from dao.asyncPatientDAO import AsyncPatientDAO
+from models.diagnosis import Diagnosis
+from models.patient import Patient
+from services.patientService import PatientService
+from utils.cache import LRUCache
+
+
+class AsyncPatientService:
+    """
+    Asyncio counterpart of PatientService. Validate input and access DAO. Patient lookups by ID are read through a cache that is kept up to date by the create, update and delete methods. The cache holds its own copies of the patients and hands out new copies, so callers can change the patients they get without changing the cache.
+
+    Attributes:
+        patientDAO (```AsyncPatientDAO```): Async patient DAO object to access patient information.
+        patientCache (```LRUCache```[```int```, ```Patient```]): Cache of patients by patient ID. May be shared with a PatientService.
+    """
+
+    def __init__(self, patientDAO: AsyncPatientDAO | None = None, patientCache: LRUCache[int, Patient] | None = None):
+        """
+        Constructor for AsyncPatientService class.
+
+        Attributes:
+            patientDAO (```AsyncPatientDAO```): Async patient DAO object to access patient information.
+            patientCache (```LRUCache```[```int```, ```Patient```]): Cache of patients by patient ID. Default is a new LRUCache.
+        """
+        if patientDAO is None:
+            self.patientDAO = AsyncPatientDAO()
+        else:
+            self.patientDAO = patientDAO
+
+        if patientCache is None:
+            self.patientCache: LRUCache[int, Patient] = LRUCache()
+        else:
+            self.patientCache = patientCache
+
+    async def getAllPatients(self) -> List[Patient]:
+        """
+        Get a list of all patients in the database.
+
+        Returns:
+            (```List```[```Patient```]): A list of all patients in database
+        """
+        return await self.patientDAO.getAllPatients()
+
+    async def getAllPatientsWithDiagnoses(self) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get a list of all patients in the database paired with their diagnoses.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): A list of all patients in database and their diagnoses.
+        """
+        return await self.patientDAO.getAllPatientsWithDiagnoses()
+
+    async def getPatientByID(self, patientID: int) -> Patient | None:
+        """
+        Get a patient by patientID from the database.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```Patient | None```): The patient at patient ID or None if no patient is found.
+        """
+        if patientID is None:
+            return None
+        patient: Patient | None = self.patientCache.get(patientID)
+        if patient is not None:
+            return patient.copy()
+        patient = await self.patientDAO.getPatientByID(patientID)
+        if patient is not None:
+            self.cachePatient(patient)
+        return patient
+
+    async def getPatientsByIDs(self, patientIDs: List[int]) -> List[Patient | None]:
+        """
+        Get several patients by patientID concurrently.
+
+        Parameters:
+            patientIDs (```List```[```int```]): Patient IDs.
+
+        Returns:
+            (```List```[```Patient | None```]): The patient at each patient ID, or None where no patient is found, in the same order as patientIDs.
+        """
+        return list(await asyncio.gather(*(self.getPatientByID(patientID) for patientID in patientIDs)))
+
+    def cachePatient(self, patient: Patient) -> None:
+        """
+        Store a copy of a saved patient in the patient cache. The cache never holds or hands out objects callers have, so changing a patient object does not change the cache.
+
+        Parameters:
+            patient (```Patient```): Patient with patientID, as saved in the database.
+        """
+        self.patientCache.put(patient.patientID, patient.copy())
+
+    def getCacheStats(self) -> Dict[str, float]:
+        """
+        Get hit/miss statistics of the patient cache.
+
+        Returns:
+            (```Dict```[```str```, ```float```]): Statistics from LRUCache.stats().
+        """
+        return self.patientCache.stats()
+
+    async def createPatient(self, patient: Patient) -> Patient | None:
+        """
+        Create patient in database if patient.name is not None and patient.name is not "".
+
+        Parameters:
+            patient (```Patient``): Patient to add to database.
+
+        Returns:
+            (```Patient | None```): The newly created patient with patientID.
+        """
+        if not PatientService.validatePatient(patient):
+            return None
+        checkPatient: Patient | None = await self.patientDAO.addPatient(patient)
+        if checkPatient is not None:
+            self.cachePatient(checkPatient)
+        return checkPatient
+
+    async def updatePatient(self, patient: Patient) -> Patient | None:
+        """
+        Update patient in database if patientID is not None and is for a real, existing patient and patient.name is not None and patient.name is not "".
+
+        Parameters:
+            patient (```Patient```): Patient to update in database.
+
+        Returns:
+            (```Patient | None```): Updated patient if update is succusful, or None otherwise.
+        """
+        if await self.getPatientByID(patient.patientID) is None:
+            return None
+        if not PatientService.validatePatient(patient):
+            return None
+        self.patientCache.invalidate(patient.patientID)
+        checkPatient: Patient | None = await self.patientDAO.updatePatient(patient)
+        if checkPatient is not None:
+            self.cachePatient(checkPatient)
+        return checkPatient
+
+    async def deletePatient(self, patientID: int) -> bool:
+        """
+        Delete patient at patient ID if patient ID is for a real, existing patient.
+
+        Parameters:
+            patientID (```int```): Patient ID.
+
+        Returns:
+            (```bool```): True if delete is successful, False otherwise.
+        """
+        if await self.getPatientByID(patientID) is None:
+            return False
+        self.patientCache.invalidate(patientID)
+        return await self.patientDAO.deletePatient(patientID)
+
+
+defaultAsyncPatientService: AsyncPatientService | None = None
+defaultAsyncPatientServiceLock: threading.Lock = threading.Lock()
+
+def getDefaultAsyncPatientService() -> AsyncPatientService:
+    """
+    Get the shared async patient service, creating it on first use.
+    Async services that are not given a patient service use this one, so they all go through one patient cache.
+
+    Returns:
+        (```AsyncPatientService```): The shared async patient service.
+    """
+    global defaultAsyncPatientService
+    if defaultAsyncPatientService is not None:
+        return defaultAsyncPatientService
+    with defaultAsyncPatientServiceLock:
+        if defaultAsyncPatientService is None:
+            defaultAsyncPatientService = AsyncPatientService()
+    return defaultAsyncPatientService
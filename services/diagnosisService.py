@@ -1,36 +1,60 @@
 
-from typing import List
-from dao.diagnosisDAO import DiagnosisDAO
-from dao.patientDAO import PatientDAO
+from typing import Iterator, List
+from dao import storageFactory
+from dao.storage import DiagnosisStorage, PatientStorage
 from models.diagnosis import Diagnosis
+from models.diagnosisFrame import DiagnosisFrame
+from models.patient import Patient
+from services.patientService import PatientService, getDefaultPatientService
 
 
 class DiagnosisService:
     """
     Validate input and access DAO.
+    By default, patients and diagnoses are checked to exist with lookups before each write. With databaseValidation, the checks are left to the write statements instead: foreign keys reject diagnoses for missing patients, updates only match when the patient exists, and deletes report whether a row was deleted. Each write is then a single statement.
 
     Attributes:
-        diagnosisDAO (```DiagnosisDAO```): Diagnosis DAO object to access diagnosis information.
-        patientDAO (```PatientDAO```): Patient DAO object to access patient information.
+        diagnosisDAO (```DiagnosisStorage```): Diagnosis DAO object to access diagnosis information.
+        patientService (```PatientService```): Patient service object used to check patients exist, sharing its patient cache.
+        databaseValidation (```bool```): Check that patients and diagnoses exist in the write statements instead of with lookups before them.
     """
 
-    def __init__(self, diagnosisDAO: DiagnosisDAO | None = None, patientDAO: PatientDAO | None = None) -> None:
+    def __init__(self, diagnosisDAO: DiagnosisStorage | None = None, patientDAO: PatientStorage | None = None, patientService: PatientService | None = None, databaseValidation: bool = False) -> None:
         """
         Consturctor for DiagnosisService class.
 
         Attributes:
-            diagnosisDAO (```DiagnosisDAO```): Diagnosis DAO object to access diagnosis information.
-            patientDAO (```PatientDAO```): Patient DAO object to access patient information.
+            diagnosisDAO (```DiagnosisStorage```): Diagnosis DAO object to access diagnosis information. Default is the diagnosis DAO of the configured storage backend.
+            patientDAO (```PatientStorage```): Patient DAO to check patients exist with, through a new PatientService, when no patientService is given. Default is None.
+            patientService (```PatientService```): Patient service object used to check patients exist. Default is the shared getDefaultPatientService(), so services share one patient cache.
+            databaseValidation (```bool```): Check that patients and diagnoses exist in the write statements instead of with lookups before them. Default is False.
         """
         if diagnosisDAO is None:
-            self.diagnosisDAO = DiagnosisDAO()
+            self.diagnosisDAO = storageFactory.getFactory().getDiagnosisDAO()
         else:
             self.diagnosisDAO = diagnosisDAO
 
-        if patientDAO is None:
-            self.patientDAO = PatientDAO()
+        if patientService is not None:
+            self.patientService = patientService
+        elif patientDAO is not None:
+            self.patientService = PatientService(patientDAO)
         else:
-            self.patientDAO = patientDAO
+            self.patientService = getDefaultPatientService()
+
+        self.databaseValidation: bool = databaseValidation
+
+    @staticmethod
+    def validateDiagnosis(diagnosis: Diagnosis) -> bool:
+        """
+        Check diagnosis information is valid to save: diagnosis.level is a known DiagnosisLevel (diagnosis.diagnosis is not None and not ""). Does not check the patient exists.
+
+        Parameters:
+            diagnosis (```Diagnosis```): Diagnosis to validate.
+
+        Returns:
+            (```bool```): True if diagnosis is valid, False otherwise.
+        """
+        return diagnosis.level is not None
 
     def getAllDiagnoses(self) -> List[Diagnosis]:
         """
@@ -41,6 +65,49 @@ class DiagnosisService:
         """
         return self.diagnosisDAO.getAllDiagnosis()
     
+    def getDiagnosesPage(self, limit: int = 20, cursor: int | None = None) -> tuple[List[Diagnosis], int | None]:
+        """
+        Get one page of diagnoses in the database, ordered by diagnosis ID.
+
+        Parameters:
+            limit (```int```): Maximum number of diagnoses per page. Default is 20.
+            cursor (```int | None```): Cursor returned with the previous page, or None for the first page.
+
+        Returns:
+            (```tuple```[```List```[```Diagnosis```], ```int | None```]): The page of diagnoses and the cursor of the next page, or None if this is the last page.
+        """
+        if limit < 1:
+            return ([], None)
+        diagnoses: List[Diagnosis] = self.diagnosisDAO.getDiagnosesPage(cursor, limit + 1)
+        if len(diagnoses) <= limit:
+            return (diagnoses, None)
+        diagnoses = diagnoses[:limit]
+        return (diagnoses, diagnoses[-1].diagnosisID)
+    
+    def iterAllDiagnoses(self, itersize: int | None = None) -> Iterator[Diagnosis]:
+        """
+        Stream all diagnoses in the database without loading the whole table into memory.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is the DAO's itersize.
+
+        Returns:
+            (```Iterator```[```Diagnosis```]): Iterator over all diagnoses in database.
+        """
+        return self.diagnosisDAO.iterAllDiagnosis(itersize)
+    
+    def getAllDiagnosesFrame(self, itersize: int | None = None) -> DiagnosisFrame:
+        """
+        Get all diagnoses in the database as a compact columnar frame.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is the DAO's itersize.
+
+        Returns:
+            (```DiagnosisFrame```): All diagnoses in database.
+        """
+        return self.diagnosisDAO.getAllDiagnosisFrame(itersize)
+    
     def getDiagnosesByPatientID(self, patientID: int) -> List[Diagnosis] | None:
         """
         Get a list of all diagnoses for patientID if patientID is for a real, existing patient, in the database.
@@ -51,7 +118,7 @@ class DiagnosisService:
         Returns:
             (```List```[```Diagnosis```]): List of diagnoses for patientID.
         """
-        if self.patientDAO.getPatientByID(patientID) is None:
+        if self.patientService.getPatientByID(patientID) is None:
             return None
         return self.diagnosisDAO.getDiagnosesByPatientID(patientID)
     
@@ -77,12 +144,50 @@ class DiagnosisService:
         Returns:
             (```Diagnosis | None```): The newly created diagnosis with diagnosisID.
         """
-        if self.patientDAO.getPatientByID(diagnosis.patientID) is None:
+        if not self.validateDiagnosis(diagnosis) or diagnosis.patientID is None:
             return None
-        if diagnosis.diagnosis == "" or diagnosis.diagnosis is None:
+        if not self.databaseValidation and self.patientService.getPatientByID(diagnosis.patientID) is None:
             return None
         return self.diagnosisDAO.addDignosis(diagnosis)
     
+    def createDiagnoses(self, diagnoses: List[Diagnosis]) -> List[Diagnosis] | None:
+        """
+        Create many diagnoses in database in one transaction. The whole batch is validated first: if any diagnosis is not a valid DiagnosisLevel or any patient ID is not for a real existing patient, nothing is created.
+
+        Parameters:
+            diagnoses (```List```[```Diagnosis```]): Diagnoses to add to database.
+
+        Returns:
+            (```List```[```Diagnosis```] | None): The same diagnoses with their diagnosisID, in input order, or None if nothing was created.
+        """
+        if not all(self.validateDiagnosis(diagnosis) and diagnosis.patientID is not None for diagnosis in diagnoses):
+            return None
+        if not self.databaseValidation:
+            patientIDs: set[int] = {diagnosis.patientID for diagnosis in diagnoses}
+            if self.patientService.getExistingPatientIDs(list(patientIDs)) != patientIDs:
+                return None
+        return self.diagnosisDAO.addDiagnoses(diagnoses)
+    
+    def createPatientAndDiagnosis(self, patient: Patient, diagnosis: Diagnosis) -> tuple[Patient, Diagnosis] | None:
+        """
+        Create a new patient and their diagnosis in database in one transaction if patient.name and diagnosis.diagnosis are not None and not "".
+
+        Parameters:
+            patient (```Patient```): New patient to add to database.
+            diagnosis (```Diagnosis```): Diagnosis of the new patient to add to database.
+
+        Returns:
+            (```tuple```[```Patient```, ```Diagnosis```] | None): The newly created patient with patientID and diagnosis with diagnosisID, or None if nothing was created.
+        """
+        if not PatientService.validatePatient(patient):
+            return None
+        if not self.validateDiagnosis(diagnosis):
+            return None
+        created: tuple[Patient, Diagnosis] | None = self.diagnosisDAO.addPatientAndDiagnosis(patient, diagnosis)
+        if created is not None:
+            self.patientService.cachePatient(patient)
+        return created
+    
     def updateDiagnosis(self, diagnosis: Diagnosis) -> Diagnosis | None:
         """
         Update diagnosis in database if patient ID is for a real, existing patient, diangosis ID is for a real, existing diagnosis, and diagnosis.diagnosis
@@ -93,9 +198,11 @@ class DiagnosisService:
         Returns:
             (```Diagnosis```): Updated diagnosis if update is successful, or None otherwise.
         """
-        if self.patientDAO.getPatientByID(diagnosis.patientID) is None:
+        if not self.validateDiagnosis(diagnosis):
             return None
-        if diagnosis.diagnosis == "" or diagnosis.diagnosis is None:
+        if self.databaseValidation:
+            return self.diagnosisDAO.updateDiagnosisIfPatientExists(diagnosis)
+        if self.patientService.getPatientByID(diagnosis.patientID) is None:
             return None
         if self.diagnosisDAO.getDiagnosisByID(diagnosis.diagnosisID) is None:
             return None
@@ -111,6 +218,18 @@ class DiagnosisService:
         Returns:
             (```bool```): True if delete is successful, False otherwise.
         """
-        if self.diagnosisDAO.getDiagnosisByID(diagnosisID) is None:
+        if not self.databaseValidation and self.diagnosisDAO.getDiagnosisByID(diagnosisID) is None:
             return False
-        return self.diagnosisDAO.deleteDiagnosis(diagnosisID)
\ No newline at end of file
+        return self.diagnosisDAO.deleteDiagnosis(diagnosisID)
+    
+    def deleteDiagnoses(self, diagnosisIDs: List[int]) -> int:
+        """
+        Delete many diagnoses in database in one transaction. IDs that are not for a real, existing diagnosis are skipped.
+
+        Parameters:
+            diagnosisIDs (```List```[```int```]): Diagnosis IDs.
+
+        Returns:
+            (```int```): Number of diagnoses deleted.
+        """
+        return self.diagnosisDAO.deleteDiagnoses(diagnosisIDs)
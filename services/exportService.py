@@ -0,0 +1,185 @@
+import bz2
+import csv
+import gzip
+import json
+import lzma
+import time
+from typing import Any, Callable, ClassVar, Dict, IO, Iterator, List
+from dao.bulkDAO import BulkDAO
+
+
+class ExportReport:
+    """
+    Result of an export.
+
+    Attributes:
+        rowsExported (```int```): Number of rows written.
+        lastDiagnosisID (```int | None```): Highest diagnosis ID written. None if no diagnosis was written.
+        snapshot (```str | None```): Database snapshot the rows were read from, to pass as sinceSnapshot to the next incremental export.
+        elapsed (```float```): Seconds the export took.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for ExportReport class.
+        """
+        self.rowsExported: int = 0
+        self.lastDiagnosisID: int | None = None
+        self.snapshot: str | None = None
+        self.elapsed: float = 0.0
+
+    def rowsPerSecond(self) -> float:
+        """
+        Export throughput.
+
+        Returns:
+            (```float```): Rows written per second.
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return self.rowsExported / self.elapsed
+
+    def __str__(self) -> str:
+        """
+        String representation of ExportReport class.
+
+        Returns:
+            (```str```): String representation of this class.
+        """
+        return f'ExportReport [rows = {self.rowsExported}, lastDiagnosisID = {self.lastDiagnosisID}, snapshot = {self.snapshot}, elapsed = {self.elapsed:.2f}s, rows/sec = {self.rowsPerSecond():.0f}]'
+
+
+class ExportService:
+    """
+    Stream every patient with their diagnosis history out of the database into CSV, JSONL or Parquet files. Rows are written as they arrive from a server-side cursor, so memory stays constant whatever the table size.
+
+    Attributes:
+        (```class```) compressions (```Dict```[```str```, ```Callable```]): Supported compressions for CSV and JSONL, by name, mapped to the function opening a compressed text file.
+        bulkDAO (```BulkDAO```): Bulk DAO object to stream rows from the database.
+        itersize (```int```): Number of rows fetched per round-trip, and rows per row group for Parquet.
+    """
+
+    compressions: ClassVar[Dict[str, Callable[..., IO[Any]]]] = {"gzip": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+    def __init__(self, bulkDAO: BulkDAO | None = None, itersize: int = 5000) -> None:
+        """
+        Constructor for ExportService class.
+
+        Parameters:
+            bulkDAO (```BulkDAO```): Bulk DAO object to stream rows from the database.
+            itersize (```int```): Number of rows fetched per round-trip, and rows per row group for Parquet. Default is 5000.
+        """
+        if bulkDAO is None:
+            self.bulkDAO = BulkDAO()
+        else:
+            self.bulkDAO = bulkDAO
+        self.itersize: int = itersize
+
+    def exportFile(self, path: str, format: str, compression: str | None = None, sinceDiagnosisID: int | None = None, sinceSnapshot: str | None = None) -> ExportReport:
+        """
+        Export patients and diagnoses to a file.
+
+        Parameters:
+            path (```str```): Path of the file to write.
+            format (```str```): "csv", "jsonl" or "parquet". Parquet needs pyarrow installed.
+            compression (```str | None```): "gzip", "bz2" or "xz" for CSV and JSONL; any codec pyarrow supports (such as "snappy" or "zstd") for Parquet. Default is no compression.
+            sinceDiagnosisID (```int | None```): If given, only export diagnoses with a greater diagnosis ID. Default exports everything.
+                IDs are handed out at insert time but rows become visible at commit time, so a diagnosis committed after an export with a lower ID than one it wrote is missed: use sinceSnapshot for incremental exports.
+            sinceSnapshot (```str | None```): If given, only export diagnoses committed after the export that read this snapshot (the snapshot in its report). Takes precedence over sinceDiagnosisID.
+
+        Returns:
+            (```ExportReport```): Rows written, last diagnosis ID written, snapshot read and throughput of the export.
+        """
+        report: ExportReport = ExportReport()
+        start: float = time.perf_counter()
+        rows: Iterator[tuple[Any, ...]] = self.__trackRows(self.bulkDAO.iterExportRows(sinceDiagnosisID, self.itersize, sinceSnapshot, lambda snapshot: setattr(report, "snapshot", snapshot)), report)
+
+        if format == "parquet":
+            self.__writeParquet(path, rows, compression)
+        elif format in ("csv", "jsonl"):
+            if compression is None:
+                stream: IO[Any] = open(path, "w", newline="", encoding="utf-8")
+            elif compression in self.compressions:
+                stream = self.compressions[compression](path, "wt", newline="", encoding="utf-8")
+            else:
+                raise ValueError(f"Unknown compression: {compression}")
+            with stream:
+                if format == "csv":
+                    self.__writeCSV(stream, rows)
+                else:
+                    self.__writeJSONL(stream, rows)
+        else:
+            raise ValueError(f"Unknown export format: {format}")
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def __trackRows(self, rows: Iterator[tuple[Any, ...]], report: ExportReport) -> Iterator[tuple[Any, ...]]:
+        """
+        Pass rows through while counting them and recording the highest diagnosis ID in report.
+
+        Parameters:
+            rows (```Iterator```[```tuple```[```Any```, ...]]): Export rows.
+            report (```ExportReport```): Report to update.
+
+        Returns:
+            (```Iterator```[```tuple```[```Any```, ...]]): The same rows.
+        """
+        diagnosisIDIndex: int = BulkDAO.exportColumns.index("diagnosis_id")
+        for row in rows:
+            report.rowsExported += 1
+            diagnosisID: int | None = row[diagnosisIDIndex]
+            if diagnosisID is not None and (report.lastDiagnosisID is None or diagnosisID > report.lastDiagnosisID):
+                report.lastDiagnosisID = diagnosisID
+            yield row
+
+    def __writeCSV(self, stream: IO[Any], rows: Iterator[tuple[Any, ...]]) -> None:
+        """
+        Write rows as CSV with a header row.
+
+        Parameters:
+            stream (```IO```): Text stream to write to.
+            rows (```Iterator```[```tuple```[```Any```, ...]]): Export rows.
+        """
+        writer = csv.writer(stream)
+        writer.writerow(BulkDAO.exportColumns)
+        writer.writerows(rows)
+
+    def __writeJSONL(self, stream: IO[Any], rows: Iterator[tuple[Any, ...]]) -> None:
+        """
+        Write rows as one JSON object per line.
+
+        Parameters:
+            stream (```IO```): Text stream to write to.
+            rows (```Iterator```[```tuple```[```Any```, ...]]): Export rows.
+        """
+        for row in rows:
+            stream.write(json.dumps(dict(zip(BulkDAO.exportColumns, row))))
+            stream.write("\n")
+
+    def __writeParquet(self, path: str, rows: Iterator[tuple[Any, ...]], compression: str | None) -> None:
+        """
+        Write rows as a Parquet file, one row group per itersize rows.
+
+        Parameters:
+            path (```str```): Path of the file to write.
+            rows (```Iterator```[```tuple```[```Any```, ...]]): Export rows.
+            compression (```str | None```): Parquet compression codec, or None for no compression.
+        """
+        import pyarrow
+        import pyarrow.parquet
+
+        schema = pyarrow.schema([
+            ("patient_id", pyarrow.int32()), ("name", pyarrow.string()), ("age", pyarrow.int32()), ("gender", pyarrow.string()),
+            ("height", pyarrow.int32()), ("weight", pyarrow.int32()), ("diagnosis_id", pyarrow.int32()), ("diagnosis", pyarrow.string()),
+        ])
+        with pyarrow.parquet.ParquetWriter(path, schema, compression=compression or "none") as writer:
+            columns: List[List[Any]] = [[] for _ in BulkDAO.exportColumns]
+            for row in rows:
+                for column, value in zip(columns, row):
+                    column.append(value)
+                if len(columns[0]) >= self.itersize:
+                    writer.write_table(pyarrow.Table.from_pydict(dict(zip(BulkDAO.exportColumns, columns)), schema=schema))
+                    columns = [[] for _ in BulkDAO.exportColumns]
+            if len(columns[0]) > 0:
+                writer.write_table(pyarrow.Table.from_pydict(dict(zip(BulkDAO.exportColumns, columns)), schema=schema))
@@ -0,0 +1,269 @@
+import csv
+import json
+import time
+from typing import Any, Dict, Iterator, List, TextIO
+from dao.bulkDAO import BulkDAO
+from models.diagnosis import Diagnosis
+from models.patient import Patient
+from services.diagnosisService import DiagnosisService
+from services.patientService import PatientService
+
+
+class ImportReport:
+    """
+    Result of a bulk import.
+
+    Attributes:
+        patientsImported (```int```): Number of new patients saved.
+        diagnosesImported (```int```): Number of diagnoses saved.
+        rejected (```List```[```tuple```[```int```, ```str```]]): Line number and reason for every record that was not imported.
+        idMap (```Dict```[```str```, ```int```]): Source ID of every imported record that had one, mapped to the patient ID it was given in the database.
+        elapsed (```float```): Seconds the import took.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for ImportReport class.
+        """
+        self.patientsImported: int = 0
+        self.diagnosesImported: int = 0
+        self.rejected: List[tuple[int, str]] = []
+        self.idMap: Dict[str, int] = {}
+        self.elapsed: float = 0.0
+
+    def recordsPerSecond(self) -> float:
+        """
+        Import throughput.
+
+        Returns:
+            (```float```): Patients plus diagnoses saved per second.
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return (self.patientsImported + self.diagnosesImported) / self.elapsed
+
+    def __str__(self) -> str:
+        """
+        String representation of ImportReport class.
+
+        Returns:
+            (```str```): String representation of this class.
+        """
+        return f'ImportReport [patients = {self.patientsImported}, diagnoses = {self.diagnosesImported}, rejected = {len(self.rejected)}, elapsed = {self.elapsed:.2f}s, records/sec = {self.recordsPerSecond():.0f}]'
+
+
+class ImportService:
+    """
+    Validate patient and diagnosis records read from CSV or JSONL and bulk load them into the database in batches.
+
+    Records have the patient fields name, age, gender, height and weight, a diagnosis (or, in JSONL, a list of diagnoses), and an optional source_id.
+    Records sharing a source_id are the same patient: the patient is created once and every record adds its diagnoses to it.
+
+    Attributes:
+        bulkDAO (```BulkDAO```): Bulk DAO object to copy records into the database.
+        batchSize (```int```): Number of records validated and copied per transaction.
+    """
+
+    def __init__(self, bulkDAO: BulkDAO | None = None, batchSize: int = 5000) -> None:
+        """
+        Constructor for ImportService class.
+
+        Parameters:
+            bulkDAO (```BulkDAO```): Bulk DAO object to copy records into the database.
+            batchSize (```int```): Number of records validated and copied per transaction. Default is 5000.
+        """
+        if bulkDAO is None:
+            self.bulkDAO = BulkDAO()
+        else:
+            self.bulkDAO = bulkDAO
+        self.batchSize: int = batchSize
+
+    def importStream(self, stream: TextIO, format: str) -> ImportReport:
+        """
+        Import every record in stream. Records are read, validated and copied one batch at a time, so memory is bounded by batchSize.
+
+        Parameters:
+            stream (```TextIO```): Text stream of CSV (with a header row) or JSONL records.
+            format (```str```): "csv" or "jsonl".
+
+        Returns:
+            (```ImportReport```): Counts, rejected records, source ID mapping and throughput of the import.
+        """
+        report: ImportReport = ImportReport()
+        start: float = time.perf_counter()
+
+        batch: List[tuple[int, Dict[str, Any] | str]] = []
+        for lineNumber, record in self.readRecords(stream, format):
+            batch.append((lineNumber, record))
+            if len(batch) >= self.batchSize:
+                self.__importBatch(batch, report)
+                batch = []
+        if len(batch) > 0:
+            self.__importBatch(batch, report)
+
+        report.rejected.sort()
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def importFile(self, path: str, format: str | None = None) -> ImportReport:
+        """
+        Import every record in a CSV or JSONL file.
+
+        Parameters:
+            path (```str```): Path to the file.
+            format (```str | None```): "csv" or "jsonl". Default is taken from the file extension.
+
+        Returns:
+            (```ImportReport```): Counts, rejected records, source ID mapping and throughput of the import.
+        """
+        if format is None:
+            format = "csv" if path.lower().endswith(".csv") else "jsonl"
+        with open(path, newline="", encoding="utf-8") as stream:
+            return self.importStream(stream, format)
+
+    @staticmethod
+    def readRecords(stream: TextIO, format: str) -> Iterator[tuple[int, Dict[str, Any] | str]]:
+        """
+        Read records one at a time from a CSV or JSONL stream. JSONL lines are not parsed here, so one malformed line can be rejected on its own with toRecord().
+
+        Parameters:
+            stream (```TextIO```): Text stream of CSV (with a header row) or JSONL records.
+            format (```str```): "csv" or "jsonl".
+
+        Returns:
+            (```Iterator```[```tuple```[```int```, ```Dict```[```str```, ```Any```] | ```str```]]): Iterator over the line number of each record and the record: a dict for CSV, the unparsed line for JSONL.
+        """
+        if format == "csv":
+            reader: csv.DictReader = csv.DictReader(stream)
+            for record in reader:
+                yield (reader.line_num, record)
+        elif format == "jsonl":
+            for lineNumber, line in enumerate(stream, start=1):
+                if line.strip() != "":
+                    yield (lineNumber, line)
+        else:
+            raise ValueError(f"Unknown import format: {format}")
+
+    @staticmethod
+    def toRecord(record: Dict[str, Any] | str) -> Dict[str, Any]:
+        """
+        Parse a record read by readRecords(). Raises ValueError if a JSONL line is not valid JSON or not a JSON object.
+
+        Parameters:
+            record (```Dict```[```str```, ```Any```] | ```str```): CSV record, or JSONL line.
+
+        Returns:
+            (```Dict```[```str```, ```Any```]): The record's fields.
+        """
+        if isinstance(record, dict):
+            return record
+        try:
+            parsed: Any = json.loads(record)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"invalid JSON: {e}") from e
+        if not isinstance(parsed, dict):
+            raise ValueError("record is not a JSON object")
+        return parsed
+
+    @staticmethod
+    def toPatientAndDiagnoses(record: Dict[str, Any]) -> tuple[Patient, List[Diagnosis]]:
+        """
+        Convert a raw record to a patient and its diagnoses.
+
+        Parameters:
+            record (```Dict```[```str```, ```Any```]): Raw record.
+
+        Returns:
+            (```tuple```[```Patient```, ```List```[```Diagnosis```]]): Patient (No patientID) and diagnoses (No diagnosisID) of the record.
+        """
+        def optionalInt(key: str) -> int | None:
+            value: Any = record.get(key)
+            if value is None or value == "":
+                return None
+            return int(value)
+
+        patient: Patient = Patient(record.get("name"), optionalInt("age"), record.get("gender"), optionalInt("height"), optionalInt("weight"))
+
+        labels: List[str] = []
+        if isinstance(record.get("diagnoses"), list):
+            labels.extend(record["diagnoses"])
+        if record.get("diagnosis") not in (None, ""):
+            labels.append(record["diagnosis"])
+        return (patient, [Diagnosis(label) for label in labels])
+
+    def __importBatch(self, batch: List[tuple[int, Dict[str, Any] | str]], report: ImportReport) -> None:
+        """
+        Validate a batch of records with the PatientService and DiagnosisService rules and copy the valid ones into the database.
+
+        Parameters:
+            batch (```List```[```tuple```[```int```, ```Dict```[```str```, ```Any```] | ```str```]]): Line numbers and records as read by readRecords().
+            report (```ImportReport```): Report to add the results to.
+        """
+        records: List[tuple[Patient, List[Diagnosis]]] = []
+        recordNumbers: List[List[int]] = []
+        bySourceID: Dict[str, int] = {}
+        sourceIDs: Dict[int, str] = {}
+
+        for recordNumber, raw in batch:
+            try:
+                record: Dict[str, Any] = self.toRecord(raw)
+                patient, diagnoses = self.toPatientAndDiagnoses(record)
+            except (ValueError, TypeError) as e:
+                report.rejected.append((recordNumber, str(e)))
+                continue
+
+            sourceID: str | None = None if record.get("source_id") in (None, "") else str(record["source_id"])
+            if sourceID is not None and sourceID in report.idMap:
+                patient.patientID = report.idMap[sourceID]
+
+            if not PatientService.validatePatient(patient):
+                report.rejected.append((recordNumber, "invalid patient"))
+                continue
+            if not all(DiagnosisService.validateDiagnosis(diagnosis) for diagnosis in diagnoses):
+                report.rejected.append((recordNumber, "invalid diagnosis"))
+                continue
+
+            if sourceID is not None and sourceID in bySourceID:
+                records[bySourceID[sourceID]][1].extend(diagnoses)
+                recordNumbers[bySourceID[sourceID]].append(recordNumber)
+                continue
+
+            records.append((patient, diagnoses))
+            recordNumbers.append([recordNumber])
+            if sourceID is not None:
+                bySourceID[sourceID] = len(records) - 1
+                sourceIDs[id(patient)] = sourceID
+
+        if len(records) == 0:
+            return
+        isNew: List[bool] = [patient.patientID is None for patient, _ in records]
+        rejected: set[int] = set(self.copyRecords(self.bulkDAO, records))
+        for index, (patient, diagnoses) in enumerate(records):
+            if index in rejected:
+                for recordNumber in recordNumbers[index]:
+                    report.rejected.append((recordNumber, "rejected by the database"))
+                continue
+            report.patientsImported += int(isNew[index])
+            report.diagnosesImported += len(diagnoses)
+            if id(patient) in sourceIDs:
+                report.idMap[sourceIDs[id(patient)]] = patient.patientID
+
+    @staticmethod
+    def copyRecords(bulkDAO: BulkDAO, records: List[tuple[Patient, List[Diagnosis]]]) -> List[int]:
+        """
+        Copy validated records into the database in one transaction. If the database rejects a row (such as a name too long for its column), the records are split in halves and each half copied again,
+        so only the records the database rejects are left out, at the cost of a few more transactions per bad record.
+
+        Parameters:
+            bulkDAO (```BulkDAO```): Bulk DAO object to copy the records with.
+            records (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): Patients and their diagnoses to copy.
+
+        Returns:
+            (```List```[```int```]): Indexes in records of the records the database rejected, in order. Every other record was saved and has its IDs set.
+        """
+        if bulkDAO.copyPatientsAndDiagnoses(records):
+            return []
+        if len(records) == 1:
+            return [0]
+        middle: int = len(records) // 2
+        return ImportService.copyRecords(bulkDAO, records[:middle]) + [middle + index for index in ImportService.copyRecords(bulkDAO, records[middle:])]
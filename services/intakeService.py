@@ -0,0 +1,283 @@
+import time
+from typing import Any, Dict, List, Mapping, TextIO
+from bots.decisionTree import DecisionTree, getQuestionnaire
+from dao.bulkDAO import BulkDAO
+from models.diagnosis import Diagnosis, DiagnosisLevel
+from models.patient import Patient
+from services.diagnosisService import DiagnosisService
+from services.importService import ImportService
+from services.patientService import PatientService, getDefaultPatientService
+
+
+class IntakeReport:
+    """
+    Result of diagnosing a stream of intake records.
+
+    Attributes:
+        recordsRead (```int```): Number of records read.
+        patientsCreated (```int```): Number of new patients saved.
+        diagnosesSaved (```int```): Number of diagnoses saved.
+        diagnosisCounts (```Dict```[```str```, ```int```]): Number of saved diagnoses per diagnosis.
+        rejected (```List```[```tuple```[```int```, ```str```]]): Line number and reason for every record that was not saved.
+        elapsed (```float```): Seconds the run took.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for IntakeReport class.
+        """
+        self.recordsRead: int = 0
+        self.patientsCreated: int = 0
+        self.diagnosesSaved: int = 0
+        self.diagnosisCounts: Dict[str, int] = {level.label: 0 for level in DiagnosisLevel}
+        self.rejected: List[tuple[int, str]] = []
+        self.elapsed: float = 0.0
+
+    def recordsPerSecond(self) -> float:
+        """
+        Throughput of the run.
+
+        Returns:
+            (```float```): Records read, diagnosed and saved or rejected per second.
+        """
+        if self.elapsed <= 0:
+            return 0.0
+        return self.recordsRead / self.elapsed
+
+    def __str__(self) -> str:
+        """
+        String representation of IntakeReport class.
+
+        Returns:
+            (```str```): String representation of this class.
+        """
+        counts: str = ", ".join(f"{label} = {count}" for label, count in self.diagnosisCounts.items())
+        return f'IntakeReport [records = {self.recordsRead}, new patients = {self.patientsCreated}, diagnoses = {self.diagnosesSaved} ({counts}), rejected = {len(self.rejected)}, elapsed = {self.elapsed:.2f}s, records/sec = {self.recordsPerSecond():.0f}]'
+
+
+class IntakeService:
+    """
+    Diagnose patients from questionnaire answers recorded by intake kiosks, without prompting, and save the results in batches.
+
+    A record has the patient fields name, age, gender, height and weight (or patient_id for a returning patient) and one field per questionnaire question
+    (appearance, eyes, skin) holding its answer, or in JSONL an answers object with those fields. Only the answers to the questions asked on the record's path are needed.
+    Each batch is diagnosed at once (with BatchDiagnoser when NumPy is installed), then saved in one go: with COPY through BulkDAO when one is given (PostgreSQL only, leaving out only the records the database rejects),
+    otherwise with one createPatients() and one createDiagnoses() call, which work on every storage backend.
+
+    Attributes:
+        patientService (```PatientService```): Patient service object to check and create patients.
+        diagnosisService (```DiagnosisService```): Diagnosis service object to save diagnoses.
+        questionnaire (```DecisionTree```): Compiled dehydration questionnaire.
+        bulkDAO (```BulkDAO | None```): Bulk DAO object to save batches with COPY, or None to save through the services.
+        batchSize (```int```): Number of records diagnosed and saved per batch.
+    """
+
+    def __init__(self, patientService: PatientService | None = None, diagnosisService: DiagnosisService | None = None, questionnaire: DecisionTree | None = None, bulkDAO: BulkDAO | None = None, batchSize: int = 1000) -> None:
+        """
+        Constructor for IntakeService class.
+
+        Parameters:
+            patientService (```PatientService```): Patient service object to check and create patients. Default is the shared getDefaultPatientService().
+            diagnosisService (```DiagnosisService```): Diagnosis service object to save diagnoses. Default leaves patient checks to the database, since every batch's patients are checked or created just before.
+            questionnaire (```DecisionTree```): Compiled dehydration questionnaire. Default is resources/questionnaire.json.
+            bulkDAO (```BulkDAO | None```): Bulk DAO object to save batches with COPY. Default is None, saving through the services.
+            batchSize (```int```): Number of records diagnosed and saved per batch. Default is 1000.
+        """
+        if patientService is None:
+            self.patientService = getDefaultPatientService()
+        else:
+            self.patientService = patientService
+
+        if diagnosisService is None:
+            self.diagnosisService = DiagnosisService(patientService=self.patientService, databaseValidation=True)
+        else:
+            self.diagnosisService = diagnosisService
+
+        if questionnaire is None:
+            self.questionnaire: DecisionTree = getQuestionnaire()
+        else:
+            self.questionnaire = questionnaire
+        self.bulkDAO: BulkDAO | None = bulkDAO
+        self.batchSize: int = batchSize
+
+        try:
+            from bots.batchDiagnosis import BatchDiagnoser
+            self.__diagnoser: Any = BatchDiagnoser(self.questionnaire)
+        except (ImportError, ValueError):
+            # NumPy is not installed, or the questionnaire's answers are not integer codes.
+            self.__diagnoser = None
+
+    def processStream(self, stream: TextIO, format: str) -> IntakeReport:
+        """
+        Diagnose and save every record in stream, one batch at a time, so memory is bounded by batchSize.
+
+        Parameters:
+            stream (```TextIO```): Text stream of CSV (with a header row) or JSONL records.
+            format (```str```): "csv" or "jsonl".
+
+        Returns:
+            (```IntakeReport```): Counts, rejected records and throughput of the run.
+        """
+        report: IntakeReport = IntakeReport()
+        start: float = time.perf_counter()
+
+        batch: List[tuple[int, Dict[str, Any] | str]] = []
+        for lineNumber, record in ImportService.readRecords(stream, format):
+            batch.append((lineNumber, record))
+            if len(batch) >= self.batchSize:
+                self.__processBatch(batch, report)
+                batch = []
+        if len(batch) > 0:
+            self.__processBatch(batch, report)
+
+        report.rejected.sort()
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def processFile(self, path: str, format: str | None = None) -> IntakeReport:
+        """
+        Diagnose and save every record in a CSV or JSONL file.
+
+        Parameters:
+            path (```str```): Path to the file.
+            format (```str | None```): "csv" or "jsonl". Default is taken from the file extension.
+
+        Returns:
+            (```IntakeReport```): Counts, rejected records and throughput of the run.
+        """
+        if format is None:
+            format = "csv" if path.lower().endswith(".csv") else "jsonl"
+        with open(path, newline="", encoding="utf-8") as stream:
+            return self.processStream(stream, format)
+
+    def diagnose(self, answerSets: List[Mapping[str, Any]]) -> List[DiagnosisLevel | None]:
+        """
+        Diagnose many answer sets with the questionnaire.
+
+        Parameters:
+            answerSets (```List```[```Mapping```[```str```, ```Any```]]): Question name mapped to answer, for every answer set.
+
+        Returns:
+            (```List```[```DiagnosisLevel | None```]): Diagnosis of each answer set, None if its answers do not lead to one.
+        """
+        if len(answerSets) == 0:
+            return []
+        if self.__diagnoser is not None:
+            columns: Dict[str, List[int]] = {}
+            for name in self.questionnaire.names:
+                columns[name] = [self.__answerCode(answers.get(name)) for answers in answerSets]
+            return [DiagnosisLevel.of(level) for level in self.__diagnoser.diagnose(columns).tolist()]
+
+        levels: List[DiagnosisLevel | None] = []
+        for answers in answerSets:
+            code: int = self.questionnaire.evaluateCodeByName(answers)
+            levels.append(None if code < 0 else DiagnosisLevel.of(self.questionnaire.outcomes[code]))
+        return levels
+
+    def __processBatch(self, batch: List[tuple[int, Dict[str, Any] | str]], report: IntakeReport) -> None:
+        """
+        Diagnose a batch of records and save the patients and diagnoses of the valid ones.
+
+        Parameters:
+            batch (```List```[```tuple```[```int```, ```Dict```[```str```, ```Any```] | ```str```]]): Line numbers and records as read by ImportService.readRecords().
+            report (```IntakeReport```): Report to add the results to.
+        """
+        report.recordsRead += len(batch)
+        records: List[tuple[int, Patient]] = []
+        answerSets: List[Mapping[str, Any]] = []
+        for recordNumber, raw in batch:
+            try:
+                record: Dict[str, Any] = ImportService.toRecord(raw)
+                patient, _ = ImportService.toPatientAndDiagnoses(record)
+                patient.patientID = None if record.get("patient_id") in (None, "") else int(record["patient_id"])
+            except (ValueError, TypeError) as e:
+                report.rejected.append((recordNumber, str(e)))
+                continue
+            records.append((recordNumber, patient))
+            answerSets.append(record["answers"] if isinstance(record.get("answers"), dict) else record)
+
+        existing: set[int] = self.patientService.getExistingPatientIDs([patient.patientID for _, patient in records if patient.patientID is not None])
+        accepted: List[tuple[int, Patient, DiagnosisLevel]] = []
+        for (recordNumber, patient), level in zip(records, self.diagnose(answerSets)):
+            if level is None:
+                report.rejected.append((recordNumber, "answers do not lead to a diagnosis"))
+            elif patient.patientID is not None and patient.patientID not in existing:
+                report.rejected.append((recordNumber, f"unknown patient {patient.patientID}"))
+            elif patient.patientID is None and not PatientService.validatePatient(patient):
+                report.rejected.append((recordNumber, "invalid patient"))
+            else:
+                accepted.append((recordNumber, patient, level))
+        if len(accepted) == 0:
+            return
+
+        if self.bulkDAO is not None:
+            self.__copyBatch(self.bulkDAO, accepted, report)
+            return
+
+        newPatients: List[Patient] = [patient for _, patient, _ in accepted if patient.patientID is None]
+        diagnoses: List[Diagnosis] = [Diagnosis(level, patient.patientID) for _, patient, level in accepted]
+        if len(newPatients) > 0 and self.patientService.createPatients(newPatients) is None:
+            self.__rejectAll(accepted, report)
+            return
+        for diagnosis, (_, patient, _) in zip(diagnoses, accepted):
+            diagnosis.patientID = patient.patientID
+        if self.diagnosisService.createDiagnoses(diagnoses) is None:
+            # Do not leave the batch's new patients behind without their diagnoses.
+            for patient in newPatients:
+                self.patientService.deletePatient(patient.patientID)
+            self.__rejectAll(accepted, report)
+            return
+
+        report.patientsCreated += len(newPatients)
+        report.diagnosesSaved += len(diagnoses)
+        for _, _, level in accepted:
+            report.diagnosisCounts[level.label] += 1
+
+    @staticmethod
+    def __copyBatch(bulkDAO: BulkDAO, accepted: List[tuple[int, Patient, DiagnosisLevel]], report: IntakeReport) -> None:
+        """
+        Save the accepted records of a batch with COPY. Records the database rejects are split off and rejected on their own, as in ImportService.copyRecords(), so the rest of the batch is still saved.
+
+        Parameters:
+            bulkDAO (```BulkDAO```): Bulk DAO object to copy the records with.
+            accepted (```List```[```tuple```[```int```, ```Patient```, ```DiagnosisLevel```]]): Record numbers, patients and diagnoses of the batch.
+            report (```IntakeReport```): Report to add the results to.
+        """
+        isNew: List[bool] = [patient.patientID is None for _, patient, _ in accepted]
+        rejected: set[int] = set(ImportService.copyRecords(bulkDAO, [(patient, [Diagnosis(level)]) for _, patient, level in accepted]))
+        for index, (recordNumber, _, level) in enumerate(accepted):
+            if index in rejected:
+                report.rejected.append((recordNumber, "rejected by the database"))
+                continue
+            report.patientsCreated += int(isNew[index])
+            report.diagnosesSaved += 1
+            report.diagnosisCounts[level.label] += 1
+
+    @staticmethod
+    def __rejectAll(accepted: List[tuple[int, Patient, DiagnosisLevel]], report: IntakeReport) -> None:
+        """
+        Reject every accepted record of a batch that could not be saved.
+
+        Parameters:
+            accepted (```List```[```tuple```[```int```, ```Patient```, ```DiagnosisLevel```]]): Record numbers, patients and diagnoses of the batch.
+            report (```IntakeReport```): Report to add the rejections to.
+        """
+        for recordNumber, _, _ in accepted:
+            report.rejected.append((recordNumber, "batch could not be saved"))
+
+    @staticmethod
+    def __answerCode(answer: Any) -> int:
+        """
+        Convert an answer to the integer code BatchDiagnoser expects.
+
+        Parameters:
+            answer (```Any```): Answer from a record, such as "1", 2 or "" / None for no answer.
+
+        Returns:
+            (```int```): Answer code, or -1 if the answer is missing, negative or not an integer.
+        """
+        try:
+            code: int = int("" if answer is None else str(answer).strip())
+        except ValueError:
+            return -1
+        return code if code >= 0 else -1
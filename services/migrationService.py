@@ -0,0 +1,121 @@
+import os
+import re
+from typing import ClassVar, List
+from dao.migrationDAO import MigrationDAO
+
+
+class Migration:
+    """
+    Class to hold a schema migration: version, name and the path of its SQL file.
+
+    Attributes:
+        version (```int```): Migration version, the number at the start of the file name.
+        name (```str```): Migration name, the rest of the file name.
+        path (```str```): Path of the SQL file.
+    """
+
+    def __init__(self, version: int, name: str, path: str) -> None:
+        """
+        Constructor for Migration class.
+
+        Parameters:
+            version (```int```): Migration version.
+            name (```str```): Migration name.
+            path (```str```): Path of the SQL file.
+        """
+        self.version: int = version
+        self.name: str = name
+        self.path: str = path
+
+    def read(self) -> str:
+        """
+        Read the migration's SQL.
+
+        Returns:
+            (```str```): SQL of the migration.
+        """
+        with open(self.path, encoding="utf-8") as file:
+            return file.read()
+
+    def __str__(self) -> str:
+        """
+        String representation of Migration class.
+
+        Returns:
+            (```str```): String representation of this class.
+        """
+        return f'{self.version:03d}_{self.name}'
+
+
+class MigrationService:
+    """
+    Find the versioned SQL migrations under resources/sql/migrations and apply the pending ones in order.
+    Migration files are named NNN_name.sql. Each one is applied in its own transaction and recorded in schema_version, and is written to be safe to run again.
+
+    Attributes:
+        (```class```) defaultDirectory (```str```): Directory migrations are read from by default.
+        (```class```) filePattern (```re.Pattern```): Migration file name pattern.
+        migrationDAO (```MigrationDAO```): Migration DAO object to apply migrations.
+        directory (```str```): Directory migrations are read from.
+    """
+
+    defaultDirectory: ClassVar[str] = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources", "sql", "migrations")
+    filePattern: ClassVar[re.Pattern] = re.compile(r"^(\d+)_(\w+)\.sql$")
+
+    def __init__(self, migrationDAO: MigrationDAO | None = None, directory: str | None = None) -> None:
+        """
+        Constructor for MigrationService class.
+
+        Parameters:
+            migrationDAO (```MigrationDAO```): Migration DAO object to apply migrations.
+            directory (```str```): Directory to read migrations from. Default is resources/sql/migrations.
+        """
+        if migrationDAO is None:
+            self.migrationDAO = MigrationDAO()
+        else:
+            self.migrationDAO = migrationDAO
+        self.directory: str = self.defaultDirectory if directory is None else directory
+
+    def getMigrations(self) -> List[Migration]:
+        """
+        Get all migrations in the migration directory.
+
+        Returns:
+            (```List```[```Migration```]): Migrations ordered by version.
+        """
+        migrations: List[Migration] = []
+        for fileName in os.listdir(self.directory):
+            match: re.Match | None = self.filePattern.match(fileName)
+            if match is not None:
+                migrations.append(Migration(int(match.group(1)), match.group(2), os.path.join(self.directory, fileName)))
+        migrations.sort(key=lambda migration: migration.version)
+
+        for previous, current in zip(migrations, migrations[1:]):
+            if previous.version == current.version:
+                raise ValueError(f"Duplicate migration version {current.version}: {previous} and {current}")
+        return migrations
+
+    def getPendingMigrations(self) -> List[Migration]:
+        """
+        Get the migrations not yet applied to the database.
+
+        Returns:
+            (```List```[```Migration```]): Pending migrations ordered by version.
+        """
+        self.migrationDAO.createVersionTable()
+        applied: set[int] = set(self.migrationDAO.getAppliedVersions())
+        return [migration for migration in self.getMigrations() if migration.version not in applied]
+
+    def migrate(self) -> List[Migration]:
+        """
+        Apply all pending migrations in version order. Stops at the first migration that fails, leaving it and later migrations pending.
+
+        Returns:
+            (```List```[```Migration```]): Migrations applied by this call.
+        """
+        applied: List[Migration] = []
+        for migration in self.getPendingMigrations():
+            if not self.migrationDAO.applyMigration(migration.version, migration.name, migration.read()):
+                break
+            applied.append(migration)
+        return applied
@@ -1,29 +1,54 @@
 
-from typing import List
-from dao.patientDAO import PatientDAO
+import threading
+from typing import Dict, Iterator, List
+from dao import storageFactory
+from dao.storage import PatientStorage
+from models.diagnosis import Diagnosis
 from models.patient import Patient
+from models.patientFrame import PatientFrame
+from utils.cache import LRUCache
 
 
 class PatientService:
     """
-    Validate input and access DAO.
+    Validate input and access DAO. Patient lookups by ID are read through a cache that is kept up to date by the create, update and delete methods. The cache holds its own copies of the patients and hands out new copies, so callers can change the patients they get without changing the cache.
 
     Attributes:
-        patientDAO (```PatientDAO```): Patient DAO object to access patient information.
+        patientDAO (```PatientStorage```): Patient DAO object to access patient information.
+        patientCache (```LRUCache```[```int```, ```Patient```]): Cache of patients by patient ID.
     """
 
-    def __init__(self, patientDAO: PatientDAO | None = None):
+    def __init__(self, patientDAO: PatientStorage | None = None, patientCache: LRUCache[int, Patient] | None = None):
         """
         Constructor for PatientService class.
 
         Attributes:
-            patientDAO (```PatientDAO```): Patient DAO object to access patient information.
+            patientDAO (```PatientStorage```): Patient DAO object to access patient information. Default is the patient DAO of the configured storage backend.
+            patientCache (```LRUCache```[```int```, ```Patient```]): Cache of patients by patient ID. Default is a new LRUCache.
         """
         if patientDAO is None:
-            self.patientDAO = PatientDAO()
+            self.patientDAO = storageFactory.getFactory().getPatientDAO()
         else:
             self.patientDAO = patientDAO
 
+        if patientCache is None:
+            self.patientCache: LRUCache[int, Patient] = LRUCache()
+        else:
+            self.patientCache = patientCache
+
+    @staticmethod
+    def validatePatient(patient: Patient) -> bool:
+        """
+        Check patient information is valid to save: patient.name is not None and patient.name is not "".
+
+        Parameters:
+            patient (```Patient```): Patient to validate.
+
+        Returns:
+            (```bool```): True if patient is valid, False otherwise.
+        """
+        return not (patient.name is None or patient.name == "")
+
     def getAllPatients(self) -> List[Patient]:
         """
         Get a list of all patients in the database.
@@ -33,6 +58,89 @@ class PatientService:
         """
         return self.patientDAO.getAllPatients()
     
+    def getPatientsPage(self, limit: int = 20, cursor: int | None = None) -> tuple[List[Patient], int | None]:
+        """
+        Get one page of patients in the database, ordered by patient ID.
+
+        Parameters:
+            limit (```int```): Maximum number of patients per page. Default is 20.
+            cursor (```int | None```): Cursor returned with the previous page, or None for the first page.
+
+        Returns:
+            (```tuple```[```List```[```Patient```], ```int | None```]): The page of patients and the cursor of the next page, or None if this is the last page.
+        """
+        if limit < 1:
+            return ([], None)
+        patients: List[Patient] = self.patientDAO.getPatientsPage(cursor, limit + 1)
+        if len(patients) <= limit:
+            return (patients, None)
+        patients = patients[:limit]
+        return (patients, patients[-1].patientID)
+    
+    def iterAllPatients(self, itersize: int | None = None) -> Iterator[Patient]:
+        """
+        Stream all patients in the database without loading the whole table into memory.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is the DAO's itersize.
+
+        Returns:
+            (```Iterator```[```Patient```]): Iterator over all patients in database.
+        """
+        return self.patientDAO.iterAllPatients(itersize)
+    
+    def getAllPatientsFrame(self, itersize: int | None = None) -> PatientFrame:
+        """
+        Get all patients in the database as a compact columnar frame.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is the DAO's itersize.
+
+        Returns:
+            (```PatientFrame```): All patients in database.
+        """
+        return self.patientDAO.getAllPatientsFrame(itersize)
+    
+    def getAllPatientsWithDiagnoses(self) -> List[tuple[Patient, List[Diagnosis]]]:
+        """
+        Get a list of all patients in the database paired with their diagnoses.
+
+        Returns:
+            (```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): A list of all patients in database and their diagnoses.
+        """
+        return self.patientDAO.getAllPatientsWithDiagnoses()
+    
+    def getPatientsWithDiagnosesPage(self, limit: int = 20, cursor: int | None = None) -> tuple[List[tuple[Patient, List[Diagnosis]]], int | None]:
+        """
+        Get one page of patients in the database paired with their diagnoses, ordered by patient ID.
+
+        Parameters:
+            limit (```int```): Maximum number of patients per page. Default is 20.
+            cursor (```int | None```): Cursor returned with the previous page, or None for the first page.
+
+        Returns:
+            (```tuple```[```List```[```tuple```[```Patient```, ```List```[```Diagnosis```]]], ```int | None```]): The page of patients and their diagnoses and the cursor of the next page, or None if this is the last page.
+        """
+        if limit < 1:
+            return ([], None)
+        patients: List[tuple[Patient, List[Diagnosis]]] = self.patientDAO.getPatientsWithDiagnosesPage(cursor, limit + 1)
+        if len(patients) <= limit:
+            return (patients, None)
+        patients = patients[:limit]
+        return (patients, patients[-1][0].patientID)
+    
+    def iterAllPatientsWithDiagnoses(self, itersize: int | None = None) -> Iterator[tuple[Patient, List[Diagnosis]]]:
+        """
+        Stream all patients in the database paired with their diagnoses without loading the whole table into memory.
+
+        Parameters:
+            itersize (```int | None```): Number of rows fetched per round-trip. Default is the DAO's itersize.
+
+        Returns:
+            (```Iterator```[```tuple```[```Patient```, ```List```[```Diagnosis```]]]): Iterator over all patients in database and their diagnoses.
+        """
+        return self.patientDAO.iterAllPatientsWithDiagnoses(itersize)
+    
     def getPatientByID(self, patientID: int) -> Patient | None:
         """
         Get a patient by patientID from the database.
@@ -43,7 +151,76 @@ class PatientService:
         Returns:
             (```Patient | int```): The patient at patient ID or None if no patient is found.
         """
-        return self.patientDAO.getPatientByID(patientID)
+        if patientID is None:
+            return None
+        patient: Patient | None = self.patientCache.get(patientID)
+        if patient is not None:
+            return patient.copy()
+        patient = self.patientDAO.getPatientByID(patientID)
+        if patient is not None:
+            self.cachePatient(patient)
+        return patient
+    
+    def searchPatients(self, namePrefix: str, limit: int = 20, cursor: tuple[str, int] | None = None) -> tuple[List[Patient], tuple[str, int] | None]:
+        """
+        Find patients whose name starts with namePrefix (case-insensitive), one page at a time, ordered by name then patient ID.
+
+        Parameters:
+            namePrefix (```str```): Start of the patient name. Leading and trailing whitespace is ignored.
+            limit (```int```): Maximum number of patients per page. Default is 20.
+            cursor (```tuple```[```str```, ```int```] | None): Cursor returned with the previous page, or None for the first page.
+
+        Returns:
+            (```tuple```[```List```[```Patient```], ```tuple```[```str```, ```int```] | None]): The page of patients and the cursor of the next page, or None if this is the last page.
+        """
+        if limit < 1:
+            return ([], None)
+        matches: List[tuple[Patient, str]] = self.patientDAO.searchPatientsByName(namePrefix.strip(), limit + 1, cursor)
+        patients: List[Patient] = [patient for patient, _ in matches[:limit]]
+        if len(matches) <= limit:
+            return (patients, None)
+        # The cursor is the lowercase name as the DAO computed it, so it matches the DAO's ordering.
+        return (patients, (matches[limit - 1][1], patients[-1].patientID))
+    
+    def getExistingPatientIDs(self, patientIDs: List[int]) -> set[int]:
+        """
+        Find which of many patient IDs are for real, existing patients. Cached patients are not looked up again; the rest are checked with one query.
+        The cache checks are counted in checkHits/checkMisses of getCacheStats(), not in the hit rate of getPatientByID() lookups.
+
+        Parameters:
+            patientIDs (```List```[```int```]): Patient IDs to check.
+
+        Returns:
+            (```set```[```int```]): The patient IDs that exist.
+        """
+        existing: set[int] = set()
+        missing: List[int] = []
+        for patientID in set(patientIDs):
+            if patientID is None:
+                continue
+            if self.patientCache.contains(patientID):
+                existing.add(patientID)
+            else:
+                missing.append(patientID)
+        return existing | self.patientDAO.getExistingPatientIDs(missing)
+    
+    def cachePatient(self, patient: Patient) -> None:
+        """
+        Store a copy of a saved patient in the patient cache. The cache never holds or hands out objects callers have, so changing a patient object does not change the cache.
+
+        Parameters:
+            patient (```Patient```): Patient with patientID, as saved in the database.
+        """
+        self.patientCache.put(patient.patientID, patient.copy())
+
+    def getCacheStats(self) -> Dict[str, float]:
+        """
+        Get hit/miss statistics of the patient cache.
+
+        Returns:
+            (```Dict```[```str```, ```float```]): Statistics from LRUCache.stats().
+        """
+        return self.patientCache.stats()
     
     def createPatient(self, patient: Patient) -> Patient | None:
         """
@@ -55,9 +232,30 @@ class PatientService:
         Returns:
             (```Patient | None```): The newly created patient with patientID.
         """
-        if patient.name is None or patient.name == "":
+        if not self.validatePatient(patient):
+            return None
+        checkPatient: Patient | None = self.patientDAO.addPatient(patient)
+        if checkPatient is not None:
+            self.cachePatient(checkPatient)
+        return checkPatient
+    
+    def createPatients(self, patients: List[Patient]) -> List[Patient] | None:
+        """
+        Create many patients in database in one transaction. The whole batch is validated first: if any patient.name is None or "", nothing is created.
+
+        Parameters:
+            patients (```List```[```Patient```]): Patients to add to database.
+
+        Returns:
+            (```List```[```Patient```] | None): The same patients with their patientID, in input order, or None if nothing was created.
+        """
+        if not all(self.validatePatient(patient) for patient in patients):
             return None
-        return self.patientDAO.addPatient(patient)
+        checkPatients: List[Patient] | None = self.patientDAO.addPatients(patients)
+        if checkPatients is not None:
+            for patient in checkPatients:
+                self.cachePatient(patient)
+        return checkPatients
     
     def updatePatient(self, patient: Patient) -> Patient | None:
         """
@@ -69,11 +267,35 @@ class PatientService:
         Returns:
             (```Patient | None```): Updated patient if update is succusful, or None otherwise.
         """
-        if self.patientDAO.getPatientByID(patient.patientID) is None:
+        if self.getPatientByID(patient.patientID) is None:
+            return None
+        if not self.validatePatient(patient):
             return None
-        if patient.name is None or patient.name == "":
+        self.patientCache.invalidate(patient.patientID)
+        checkPatient: Patient | None = self.patientDAO.updatePatient(patient)
+        if checkPatient is not None:
+            self.cachePatient(checkPatient)
+        return checkPatient
+    
+    def updatePatients(self, patients: List[Patient]) -> List[Patient] | None:
+        """
+        Update many patients in database in one transaction. The whole batch is validated first: if any patient.name is None or "", or any patientID is not for a real, existing patient, nothing is updated.
+
+        Parameters:
+            patients (```List```[```Patient```]): Patients to update in database.
+
+        Returns:
+            (```List```[```Patient```] | None): Updated patients, in input order, or None if nothing was updated.
+        """
+        if not all(patient.patientID is not None and self.validatePatient(patient) for patient in patients):
             return None
-        return self.patientDAO.updatePatient(patient)
+        for patient in patients:
+            self.patientCache.invalidate(patient.patientID)
+        checkPatients: List[Patient] | None = self.patientDAO.updatePatients(patients)
+        if checkPatients is not None:
+            for patient in checkPatients:
+                self.cachePatient(patient)
+        return checkPatients
     
     def deletePatient(self, patientID: int) -> bool:
         """
@@ -86,6 +308,27 @@ class PatientService:
             (```bool```): True if delete is successful, False otherwise.
         """
 
-        if self.patientDAO.getPatientByID(patientID) is None:
+        if self.getPatientByID(patientID) is None:
             return False
-        return self.patientDAO.deletePatient(patientID)
\ No newline at end of file
+        self.patientCache.invalidate(patientID)
+        return self.patientDAO.deletePatient(patientID)
+
+
+defaultPatientService: PatientService | None = None
+defaultPatientServiceLock: threading.Lock = threading.Lock()
+
+def getDefaultPatientService() -> PatientService:
+    """
+    Get the shared patient service of the configured storage backend, creating it on first use.
+    Services that are not given a patient service use this one, so they all go through one patient cache.
+
+    Returns:
+        (```PatientService```): The shared patient service.
+    """
+    global defaultPatientService
+    if defaultPatientService is not None:
+        return defaultPatientService
+    with defaultPatientServiceLock:
+        if defaultPatientService is None:
+            defaultPatientService = PatientService()
+    return defaultPatientService
@@ -0,0 +1,49 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+from dao.diagnosisDAO import DiagnosisDAO
+from dao.patientDAO import PatientDAO
+from models.diagnosis import Diagnosis
+from models.patient import Patient
+from utils import connectionUtil
+
+
+patientDAO: PatientDAO = PatientDAO()
+diagnosisDAO: DiagnosisDAO = DiagnosisDAO()
+
+def roundTrip(worker: int) -> bool:
+    """
+    Create, read, update and delete a patient and diagnosis with the shared DAOs.
+
+    Parameters:
+        worker (```int```): Worker number, used to make the patient unique.
+
+    Returns:
+        (```bool```): True if every step saw the data written by this worker.
+    """
+    patient: Patient | None = patientDAO.addPatient(Patient(f"Stress {worker}", worker % 100, "F", 60, 120))
+    if patient is None:
+        return False
+    diagnosis: Diagnosis | None = diagnosisDAO.addDignosis(Diagnosis("No dehydration", patient.patientID))
+    if diagnosis is None:
+        return False
+
+    ok: bool = patientDAO.getPatientByID(patient.patientID) == patient
+    ok = ok and diagnosisDAO.getDiagnosesByPatientID(patient.patientID) == [diagnosis]
+
+    patient.weight += 1
+    ok = ok and patientDAO.updatePatient(patient) is not None
+    ok = ok and patientDAO.getPatientByID(patient.patientID).weight == patient.weight
+
+    ok = ok and diagnosisDAO.deleteDiagnosis(diagnosis.diagnosisID)
+    ok = ok and patientDAO.deletePatient(patient.patientID)
+    ok = ok and patientDAO.getPatientByID(patient.patientID) is None
+    return ok
+
+def test_dao_thread_safety(workers: int = 32, iterations: int = 500) -> None:
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results: List[bool] = list(executor.map(roundTrip, range(iterations)))
+    assert all(results), f"{results.count(False)} of {iterations} round trips saw another thread's data or lost a connection"
+    print(True)
+
+test_dao_thread_safety()
+connectionUtil.closePool()
@@ -0,0 +1,67 @@
+import json
+import os
+import tempfile
+from typing import List
+from dao.patientDAO import PatientDAO
+from dao.statementRegistry import statements
+from models.patient import Patient
+from services.exportService import ExportReport, ExportService
+from utils import connectionUtil
+
+
+patientDAO: PatientDAO = PatientDAO()
+exportService: ExportService = ExportService()
+
+def exportDiagnosisIDs(sinceSnapshot: str) -> tuple[List[int], ExportReport]:
+    """
+    Run an incremental export to a temporary JSONL file and read the exported diagnosis IDs back.
+
+    Parameters:
+        sinceSnapshot (```str```): Snapshot of the previous export.
+
+    Returns:
+        (```tuple```[```List```[```int```], ```ExportReport```]): Exported diagnosis IDs and the export report.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "export.jsonl")
+        report: ExportReport = exportService.exportFile(path, "jsonl", sinceSnapshot=sinceSnapshot)
+        with open(path, encoding="utf-8") as file:
+            return [json.loads(line)["diagnosis_id"] for line in file], report
+
+def test_incremental_export_out_of_order_commit() -> None:
+    patient: Patient | None = patientDAO.addPatient(Patient("Export Test", 30, "F", 60, 120))
+    assert patient is not None
+
+    with tempfile.TemporaryDirectory() as directory:
+        baseline: ExportReport = exportService.exportFile(os.path.join(directory, "full.csv"), "csv")
+    assert baseline.snapshot is not None
+
+    # The first transaction takes the lower diagnosis ID but commits after the second one and after the next export.
+    slow = connectionUtil.getConnection()
+    slow.autocommit = False
+    lowerID: int = statements.execute(slow.cursor(), "diagnosis.add", (patient.patientID, 1)).fetchone()[0]
+    with connectionUtil.transaction() as conn, conn.cursor() as cursor:
+        higherID: int = statements.execute(cursor, "diagnosis.add", (patient.patientID, 2)).fetchone()[0]
+    assert lowerID < higherID
+
+    exported, first = exportDiagnosisIDs(baseline.snapshot)
+    assert exported == [higherID], exported
+
+    slow.commit()
+    slow.autocommit = True
+    connectionUtil.releaseConnection(slow)
+
+    exported, second = exportDiagnosisIDs(first.snapshot)
+    assert exported == [lowerID], exported
+
+    exported, _ = exportDiagnosisIDs(second.snapshot)
+    assert exported == [], exported
+    print(True)
+
+    with connectionUtil.transaction() as conn, conn.cursor() as cursor:
+        for diagnosisID in (lowerID, higherID):
+            statements.execute(cursor, "diagnosis.delete", (diagnosisID,))
+    patientDAO.deletePatient(patient.patientID)
+
+test_incremental_export_out_of_order_commit()
+connectionUtil.closePool()
@@ -1,4 +1,4 @@
-
+from typing import Callable, Iterator
 from bots.medicalBot import MedicalBot
 from models.patient import Patient
 from models.diagnosis import Diagnosis
@@ -6,23 +6,46 @@ from models.diagnosis import Diagnosis
 
 mb: MedicalBot = MedicalBot()
 
+def answers(*given: str) -> Callable[[str], str]:
+    """
+    Answer the questionnaire's prompts with given answers, in order, instead of input().
+    """
+    replies: Iterator[str] = iter(given)
+    return lambda prompt: next(replies)
+
 def test_assess_skin() -> None:
-    print(mb.__assessSkin("1") == mb.someDehydration)
-    print(mb.__assessSkin("2") == mb.severeDehydration)
-    print(mb.__assessSkin("3") == "")
+    skin: int = mb.questionnaire.nodeOf("skin")
+    assert mb.questionnaire.evaluate(["1"], skin) == mb.someDehydration
+    assert mb.questionnaire.evaluate(["2"], skin) == mb.severeDehydration
+    assert mb.questionnaire.evaluate(["3"], skin) == ""
+    print(True)
 
 def test_assess_eyes() -> None:
-    print(mb.__assessEyes("1") == mb.noDehydration)
-    print(mb.__assessEyes("2") == mb.severeDehydration)
-    print(mb.__assessEyes("3") == "")
+    eyes: int = mb.questionnaire.nodeOf("eyes")
+    assert mb.questionnaire.evaluate(["1"], eyes) == mb.noDehydration
+    assert mb.questionnaire.evaluate(["2"], eyes) == mb.severeDehydration
+    assert mb.questionnaire.evaluate(["3"], eyes) == ""
+    print(True)
 
 def test_assess_appearance() -> None:
-    print(mb.__assessAppearance())
+    assert mb.questionnaire.run(answers("1", "1")) == mb.noDehydration
+    assert mb.questionnaire.run(answers("2", "2")) == mb.severeDehydration
+    print(True)
+
+def test_questionnaire_evaluate() -> None:
+    assert mb.questionnaire.evaluate(["1", "1"]) == mb.noDehydration
+    assert mb.questionnaire.evaluate(["1", "2"]) == mb.severeDehydration
+    assert mb.questionnaire.evaluate(["2", "1"]) == mb.someDehydration
+    assert mb.questionnaire.evaluate(["2", "2"]) == mb.severeDehydration
+    assert mb.questionnaire.evaluate(["3"]) == ""
+    assert mb.questionnaire.evaluate(["1"]) == ""
+    print(True)
 
 def test_save_new_diagnosis() -> None:
     pass
 
 test_assess_skin()
 test_assess_eyes()
-#test_assess_appearance()
+test_assess_appearance()
+test_questionnaire_evaluate()
 test_save_new_diagnosis()
\ No newline at end of file
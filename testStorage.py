@@ -0,0 +1,117 @@
+from typing import Dict, List
+from dao.memoryStorage import MemoryDatabase, MemoryDiagnosisDAO, MemoryPatientDAO
+from dao.sqliteStorage import SQLiteDatabase, SQLiteDiagnosisDAO, SQLitePatientDAO
+from dao.storage import DiagnosisStorage, PatientStorage
+from models.diagnosis import Diagnosis, DiagnosisLevel
+from models.patient import Patient
+from services.diagnosisService import DiagnosisService
+from services.patientService import PatientService
+
+
+def checkStorage(patientDAO: PatientStorage, diagnosisDAO: DiagnosisStorage) -> None:
+    """
+    Run the service layer on a storage backend and check it behaves like the PostgreSQL DAOs.
+
+    Parameters:
+        patientDAO (```PatientStorage```): Patient DAO of the backend.
+        diagnosisDAO (```DiagnosisStorage```): Diagnosis DAO of the backend, sharing a database with patientDAO.
+    """
+    patientService: PatientService = PatientService(patientDAO)
+    diagnosisService: DiagnosisService = DiagnosisService(diagnosisDAO, patientService=patientService)
+
+    patients: List[Patient] | None = patientService.createPatients([Patient(name, 30, "F", 60, 120) for name in ("Ann", "anna", "Bob", "An_na")])
+    assert patients is not None and all(patient.patientID is not None for patient in patients)
+    assert patientDAO.getPatientByID(patients[0].patientID) == patients[0]
+
+    saved: tuple[Patient, Diagnosis] | None = diagnosisService.createPatientAndDiagnosis(Patient("Cy", 40, "M", 70, 180), Diagnosis(DiagnosisLevel.SEVERE_DEHYDRATION))
+    assert saved is not None and saved[1].patientID == saved[0].patientID
+    assert diagnosisService.createDiagnosis(Diagnosis("Some dehydration", patients[0].patientID)) is not None
+    assert diagnosisService.createDiagnosis(Diagnosis("Some dehydration", 10 ** 6)) is None
+    assert diagnosisDAO.addDignosis(Diagnosis("Unknown", patients[0].patientID)) is None
+
+    names: List[str] = [patient.name for patient in patientService.searchPatients("an", 2)[0]]
+    assert names == ["An_na", "Ann"], names
+    searchCursor: tuple[str, int] | None = patientService.searchPatients("an", 2)[1]
+    assert [patient.name for patient in patientService.searchPatients("an", 2, searchCursor)[0]] == ["anna"]
+
+    page: List[tuple[Patient, List[Diagnosis]]]
+    pageCursor: int | None
+    page, pageCursor = patientService.getPatientsWithDiagnosesPage(3)
+    assert len(page) == 3 and len(page[0][1]) == 1 and pageCursor == page[-1][0].patientID
+    page, pageCursor = patientService.getPatientsWithDiagnosesPage(3, pageCursor)
+    assert len(page) == 2 and pageCursor is None and page[-1][1] == [saved[1]]
+
+    patients[1].weight = 130
+    assert patientService.updatePatients(patients[1:3]) is not None
+    assert patientDAO.getPatientByID(patients[1].patientID).weight == 130
+    assert patientDAO.updatePatients([patients[2], Patient("Gone", 1, "F", 1, 1, 10 ** 6)]) is None
+    lookups: Dict[str, float] = patientService.getCacheStats()
+    assert patientService.getExistingPatientIDs([patients[0].patientID, 10 ** 6]) == {patients[0].patientID}
+    stats: Dict[str, float] = patientService.getCacheStats()
+    assert (stats["hits"], stats["misses"]) == (lookups["hits"], lookups["misses"]) and stats["checkHits"] + stats["checkMisses"] == lookups["checkHits"] + lookups["checkMisses"] + 2
+
+    cached: Patient | None = patientService.getPatientByID(patients[1].patientID)
+    cached.name = "Changed"
+    patients[2].name = "Changed"
+    assert patientService.getPatientByID(patients[1].patientID).name == "anna", "changing a returned patient must not change the cache"
+    assert patientService.getPatientByID(patients[2].patientID).name == "Bob", "changing a saved patient must not change the cache"
+
+    assert not patientDAO.deletePatient(patients[0].patientID), "patient with diagnoses must not be deleted"
+    diagnosisIDs: List[int] = [diagnosis.diagnosisID for diagnosis in diagnosisDAO.getDiagnosesByPatientID(patients[0].patientID)]
+    assert diagnosisService.deleteDiagnoses(diagnosisIDs) == 1
+    assert patientService.deletePatient(patients[0].patientID)
+    assert len(diagnosisDAO.getAllDiagnosisFrame()) == 1 and len(patientDAO.getAllPatientsFrame()) == 4
+    print(True)
+
+def checkSearch(patientDAO: PatientStorage) -> None:
+    """
+    Page through name searches on a storage backend for names whose lowercase form differs between Python and the database.
+
+    Parameters:
+        patientDAO (```PatientStorage```): Patient DAO of an empty backend.
+    """
+    patientService: PatientService = PatientService(patientDAO)
+    assert patientService.createPatients([Patient(name, 30, "M", 70, 180) for name in ("ΟΔΥΣΣΕΑΣ", "ΟΔΥΣΣΕΑΣ", "ΟΔΥΣΣΕΑΣ", "İpek")]) is not None
+
+    found: List[int] = []
+    cursor: tuple[str, int] | None = None
+    for _ in range(3):
+        page: List[Patient]
+        page, cursor = patientService.searchPatients("ΟΔΥΣ", 2, cursor)
+        found.extend(patient.patientID for patient in page)
+        if cursor is None:
+            break
+    assert cursor is None and len(set(found)) == 3, found
+    assert [patient.name for patient in patientService.searchPatients("İp")[0]] == ["İpek"]
+    print(True)
+
+def test_memory_storage() -> None:
+    database: MemoryDatabase = MemoryDatabase()
+    checkStorage(MemoryPatientDAO(database), MemoryDiagnosisDAO(database))
+
+def test_sqlite_storage() -> None:
+    database: SQLiteDatabase = SQLiteDatabase(":memory:")
+    checkStorage(SQLitePatientDAO(database), SQLiteDiagnosisDAO(database))
+    database.close()
+
+def test_sqlite_errors() -> None:
+    # Like the PostgreSQL DAOs, reads and writes that fail print the error and return an empty result instead of raising.
+    database: SQLiteDatabase = SQLiteDatabase(":memory:")
+    patientDAO: SQLitePatientDAO = SQLitePatientDAO(database)
+    diagnosisDAO: SQLiteDiagnosisDAO = SQLiteDiagnosisDAO(database)
+    database.close()
+    assert patientDAO.getAllPatients() == [] and patientDAO.getPatientByID(1) is None and patientDAO.getExistingPatientIDs([1]) == set()
+    assert diagnosisDAO.getDiagnosisByID(1) is None and diagnosisDAO.getDiagnosesByPatientID(1) == []
+    assert patientDAO.addPatient(Patient("Ann", 30, "F", 60, 120)) is None
+    print(True)
+
+def test_search_non_ascii() -> None:
+    checkSearch(MemoryPatientDAO(MemoryDatabase()))
+    database: SQLiteDatabase = SQLiteDatabase(":memory:")
+    checkSearch(SQLitePatientDAO(database))
+    database.close()
+
+test_memory_storage()
+test_sqlite_storage()
+test_search_non_ascii()
+test_sqlite_errors()
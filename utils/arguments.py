@@ -0,0 +1,20 @@
+import argparse
+
+
+def positiveInt(value: str) -> int:
+    """
+    Argument type for counts that must be at least 1.
+
+    Parameters:
+        value (```str```): Command line value.
+
+    Returns:
+        (```int```): The value as an int.
+    """
+    try:
+        number: int = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value} is not an integer")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
@@ -0,0 +1,144 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Thread-safe, bounded least-recently-used cache with an optional time-to-live for each entry. Keeps hit/miss statistics so the cache can be sized.
+
+    Attributes:
+        maxSize (```int```): Maximum number of entries kept before the least recently used entry is evicted.
+        ttl (```float | None```): Seconds an entry stays valid after it is stored, or None if entries never expire.
+        hits (```int```): Number of lookups that found a valid entry.
+        misses (```int```): Number of lookups that found no entry or an expired entry.
+        evictions (```int```): Number of entries dropped because the cache was full.
+        checkHits (```int```): Number of contains() checks that found a valid entry, counted apart from hits so bulk existence checks do not skew the hit rate.
+        checkMisses (```int```): Number of contains() checks that found no valid entry.
+    """
+
+    def __init__(self, maxSize: int = 1024, ttl: float | None = 300.0) -> None:
+        """
+        Constructor for LRUCache class.
+
+        Parameters:
+            maxSize (```int```): Maximum number of entries kept before the least recently used entry is evicted. Default is 1024.
+            ttl (```float | None```): Seconds an entry stays valid after it is stored, or None if entries never expire. Default is 300.
+        """
+        self.maxSize: int = maxSize
+        self.ttl: float | None = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.checkHits: int = 0
+        self.checkMisses: int = 0
+        self.__entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+
+    def get(self, key: K) -> V | None:
+        """
+        Get the value stored for key and mark it as most recently used.
+
+        Parameters:
+            key (```K```): Key to look up.
+
+        Returns:
+            (```V | None```): The stored value, or None if there is no valid entry for key.
+        """
+        with self.__lock:
+            entry: tuple[float, V] | None = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self.__entries[key]
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def contains(self, key: K) -> bool:
+        """
+        Check whether there is a valid entry for key, without counting a lookup in hits and misses or marking the entry as recently used.
+
+        Parameters:
+            key (```K```): Key to check.
+
+        Returns:
+            (```bool```): True if there is a valid entry for key, False otherwise.
+        """
+        with self.__lock:
+            entry: tuple[float, V] | None = self.__entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                self.checkMisses += 1
+                return False
+            self.checkHits += 1
+            return True
+
+    def put(self, key: K, value: V) -> None:
+        """
+        Store value for key, evicting the least recently used entry if the cache is full.
+
+        Parameters:
+            key (```K```): Key to store value under.
+            value (```V```): Value to store.
+        """
+        expires: float = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        with self.__lock:
+            self.__entries[key] = (expires, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.maxSize:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: K) -> None:
+        """
+        Remove the entry for key, if there is one.
+
+        Parameters:
+            key (```K```): Key to remove.
+        """
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries. Statistics are kept.
+        """
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Get cache statistics.
+
+        Returns:
+            (```Dict```[```str```, ```float```]): size, maxSize, hits, misses, evictions, hitRate (hits / lookups, 0 if there were no lookups), checkHits and checkMisses.
+        """
+        with self.__lock:
+            lookups: int = self.hits + self.misses
+            return {
+                "size": len(self.__entries),
+                "maxSize": self.maxSize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": self.hits / lookups if lookups > 0 else 0.0,
+                "checkHits": self.checkHits,
+                "checkMisses": self.checkMisses,
+            }
+
+    def __len__(self) -> int:
+        """
+        Number of entries currently stored, including entries that have expired but not been looked up yet.
+
+        Returns:
+            (```int```): Number of entries.
+        """
+        return len(self.__entries)
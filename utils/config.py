@@ -0,0 +1,59 @@
+import configparser
+import os
+import threading
+from typing import Any, Dict
+
+# resources/config.ini of the project, whatever the working directory.
+defaultPath: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "resources", "config.ini")
+
+config: configparser.SectionProxy | None = None
+configLock: threading.Lock = threading.Lock()
+
+def getConfigPath() -> str:
+    """
+    Get the path of the config file: the MEDBOT_CONFIG environment variable if set, otherwise resources/config.ini of the project.
+
+    Returns:
+        (```str```): Path of the config file.
+    """
+    return os.environ.get("MEDBOT_CONFIG", defaultPath)
+
+def getConfig() -> configparser.SectionProxy:
+    """
+    Get the DEFAULT section of the config file, reading it on first use. A missing file gives an empty section, so every key falls back to its default.
+
+    Returns:
+        (```configparser.SectionProxy```): The DEFAULT section of the config file.
+    """
+    global config
+    if config is not None:
+        return config
+    with configLock:
+        if config is None:
+            parser: configparser.ConfigParser = configparser.ConfigParser()
+            parser.read(getConfigPath())
+            config = parser['DEFAULT']
+    return config
+
+def getConnectionSettings() -> tuple[str, Dict[str, Any]]:
+    """
+    Get the PostgreSQL connection settings.
+    The MEDBOT_DSN environment variable, or a dsn key in config file, gives a libpq connection string or URI (such as postgresql://user@host/medbot).
+    Without a DSN, the dbname, user, password, host and port keys in config file are used. Settings given by neither come from the usual PG* environment variables.
+
+    Returns:
+        (```tuple```[```str```, ```Dict```[```str```, ```Any```]]): Connection string (possibly empty) and connection keyword arguments.
+    """
+    section: configparser.SectionProxy = getConfig()
+    dsn: str = os.environ.get("MEDBOT_DSN", section.get('dsn', fallback=''))
+    kwargs: Dict[str, Any] = {} if dsn else {key: section[key] for key in ('dbname', 'user', 'password', 'host', 'port') if key in section}
+    kwargs["autocommit"] = True
+    return dsn, kwargs
+
+def reset() -> None:
+    """
+    Forget the config read so far, so the next getConfig() reads the file and environment again.
+    """
+    global config
+    with configLock:
+        config = None
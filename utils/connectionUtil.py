@@ -1,22 +1,183 @@
-import psycopg
+import asyncio
 import configparser
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Iterator
 
-config: configparser.ConfigParser = configparser.ConfigParser()
-config.read('resources/config.ini')
+from utils import config
+from utils.metrics import metrics
 
-dbname: str = config['DEFAULT']['dbname']
-user: str = config['DEFAULT']['user']
-password: str = config['DEFAULT']['password']
-host: str = config['DEFAULT']['host']
-port: str = config['DEFAULT']['port']
+# psycopg is imported when the first pool is created, so importing this module does not load the driver.
+if TYPE_CHECKING:
+    import psycopg
+    import psycopg_pool
 
-def getConnection() -> psycopg.Connection:
+pool: "psycopg_pool.ConnectionPool | None" = None
+poolLock: threading.Lock = threading.Lock()
+asyncPool: "psycopg_pool.AsyncConnectionPool | None" = None
+# Created on first use and dropped with the pool, so it belongs to the event loop that uses the pool.
+asyncPoolLock: asyncio.Lock | None = None
+
+def getPool() -> "psycopg_pool.ConnectionPool":
     """
-    Get a connection to the database using config file.
+    Get the shared connection pool, creating and opening it on first use.
+
+    The config file is read and psycopg is loaded here, on first use, rather than at import. Connection settings come from utils.config.getConnectionSettings(): MEDBOT_DSN, a dsn key, or the dbname, user, password, host and port keys.
+    Pool size and timeouts are read from the optional pool_min_size, pool_max_size, pool_max_idle (seconds) and pool_timeout (seconds) keys in config file.
+    Connections are health checked when they are borrowed and idle connections above pool_min_size are closed after pool_max_idle seconds.
+    Connections opened and closed by the pool are counted in utils.metrics.
+
+    Returns:
+        (```psycopg_pool.ConnectionPool```): The shared connection pool.
+    """
+    global pool
+    if pool is not None:
+        return pool
+    with poolLock:
+        if pool is None:
+            import psycopg_pool
+            from utils.instrumentedConnection import InstrumentedConnection, countOpened
+            dsn, kwargs = config.getConnectionSettings()
+            settings: configparser.SectionProxy = config.getConfig()
+            pool = psycopg_pool.ConnectionPool(
+                dsn,
+                kwargs=kwargs,
+                connection_class=InstrumentedConnection,
+                configure=countOpened,
+                min_size=settings.getint('pool_min_size', fallback=1),
+                max_size=settings.getint('pool_max_size', fallback=10),
+                max_idle=settings.getfloat('pool_max_idle', fallback=600.0),
+                timeout=settings.getfloat('pool_timeout', fallback=30.0),
+                check=psycopg_pool.ConnectionPool.check_connection,
+                open=True,
+            )
+    return pool
+
+def getConnection() -> "psycopg.Connection":
+    """
+    Borrow a connection to the database from the connection pool. Connection must be given back with releaseConnection().
 
     Returns:
         (```psycopg.Connection```): A psycopg connection to the database.
     """
-    conn = psycopg.connect(dbname=dbname, user=user, password=password, host=host, port=port)
-    conn.autocommit = True
-    return conn
\ No newline at end of file
+    conn: psycopg.Connection = getPool().getconn()
+    metrics.increment("connectionsBorrowed")
+    return conn
+
+def releaseConnection(conn: "psycopg.Connection") -> None:
+    """
+    Return a connection borrowed with getConnection() to the connection pool.
+
+    Parameters:
+        conn (```psycopg.Connection```): Connection to return to the pool.
+    """
+    metrics.increment("connectionsReturned")
+    getPool().putconn(conn)
+
+@contextmanager
+def connection() -> "Iterator[psycopg.Connection]":
+    """
+    Borrow a pooled connection for the duration of the with block and return it to the pool afterwards, even if the block raises.
+    The connection belongs to the caller alone until it is returned, so this is safe to use from many threads at once.
+
+    Returns:
+        (```Iterator```[```psycopg.Connection```]): Context manager yielding the borrowed connection.
+    """
+    conn: psycopg.Connection = getConnection()
+    try:
+        yield conn
+    finally:
+        releaseConnection(conn)
+
+@contextmanager
+def transaction() -> "Iterator[psycopg.Connection]":
+    """
+    Unit of work: borrow a pooled connection and run everything done with it inside one transaction.
+    The transaction is committed when the with block exits normally and rolled back if it raises, then the connection is returned to the pool.
+
+    Returns:
+        (```Iterator```[```psycopg.Connection```]): Context manager yielding the connection the transaction runs on.
+    """
+    with connection() as conn, conn.transaction():
+        yield conn
+
+def closePool() -> None:
+    """
+    Close the connection pool and all of its connections, if it was opened.
+    """
+    global pool
+    if pool is not None:
+        pool.close()
+        pool = None
+
+async def getAsyncPool() -> "psycopg_pool.AsyncConnectionPool":
+    """
+    Get the shared asyncio connection pool, creating and opening it on first use. Uses the same configuration as getPool().
+    Must be called from the event loop the pool is used in. Like getPool(), the pool is created once behind a lock, so concurrent first borrows share one pool, and later calls return it without awaiting anything.
+
+    Returns:
+        (```psycopg_pool.AsyncConnectionPool```): The shared asyncio connection pool.
+    """
+    global asyncPool, asyncPoolLock
+    if asyncPool is not None:
+        return asyncPool
+    if asyncPoolLock is None:
+        asyncPoolLock = asyncio.Lock()
+    async with asyncPoolLock:
+        if asyncPool is None:
+            import psycopg_pool
+            from utils.instrumentedConnection import InstrumentedAsyncConnection, countOpenedAsync
+            dsn, kwargs = config.getConnectionSettings()
+            settings: configparser.SectionProxy = config.getConfig()
+            newPool: psycopg_pool.AsyncConnectionPool = psycopg_pool.AsyncConnectionPool(
+                dsn,
+                kwargs=kwargs,
+                connection_class=InstrumentedAsyncConnection,
+                configure=countOpenedAsync,
+                min_size=settings.getint('pool_min_size', fallback=1),
+                max_size=settings.getint('pool_max_size', fallback=10),
+                max_idle=settings.getfloat('pool_max_idle', fallback=600.0),
+                timeout=settings.getfloat('pool_timeout', fallback=30.0),
+                check=psycopg_pool.AsyncConnectionPool.check_connection,
+                open=False,
+            )
+            # Published only once open, so the unlocked check above never returns a pool that is still opening.
+            await newPool.open()
+            asyncPool = newPool
+    return asyncPool
+
+@asynccontextmanager
+async def asyncConnection() -> "AsyncIterator[psycopg.AsyncConnection]":
+    """
+    Borrow a connection from the asyncio connection pool for the duration of the async with block.
+
+    Returns:
+        (```AsyncIterator```[```psycopg.AsyncConnection```]): Async context manager yielding the borrowed connection.
+    """
+    async with (await getAsyncPool()).connection() as conn:
+        metrics.increment("connectionsBorrowed")
+        try:
+            yield conn
+        finally:
+            metrics.increment("connectionsReturned")
+
+@asynccontextmanager
+async def asyncTransaction() -> "AsyncIterator[psycopg.AsyncConnection]":
+    """
+    Asyncio unit of work: borrow a pooled connection and run everything done with it inside one transaction, like transaction().
+
+    Returns:
+        (```AsyncIterator```[```psycopg.AsyncConnection```]): Async context manager yielding the connection the transaction runs on.
+    """
+    async with asyncConnection() as conn, conn.transaction():
+        yield conn
+
+async def closeAsyncPool() -> None:
+    """
+    Close the asyncio connection pool and all of its connections, if it was opened.
+    """
+    global asyncPool, asyncPoolLock
+    if asyncPool is not None:
+        await asyncPool.close()
+        asyncPool = None
+    asyncPoolLock = None
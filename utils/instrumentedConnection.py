@@ -0,0 +1,50 @@
+import psycopg
+
+from utils.metrics import metrics
+
+
+class InstrumentedConnection(psycopg.Connection):
+    """
+    Pooled connection that counts itself in utils.metrics when it is closed.
+    """
+
+    def close(self) -> None:
+        """
+        Close the connection, counting it in the connectionsClosed metric the first time.
+        """
+        if not self.closed:
+            metrics.increment("connectionsClosed")
+        super().close()
+
+
+class InstrumentedAsyncConnection(psycopg.AsyncConnection):
+    """
+    Pooled asyncio connection that counts itself in utils.metrics when it is closed.
+    """
+
+    async def close(self) -> None:
+        """
+        Close the connection, counting it in the connectionsClosed metric the first time.
+        """
+        if not self.closed:
+            metrics.increment("connectionsClosed")
+        await super().close()
+
+
+def countOpened(conn: psycopg.Connection) -> None:
+    """
+    Pool configure callback: count a new connection in the connectionsOpened metric.
+
+    Parameters:
+        conn (```psycopg.Connection```): The new connection.
+    """
+    metrics.increment("connectionsOpened")
+
+async def countOpenedAsync(conn: psycopg.AsyncConnection) -> None:
+    """
+    Asyncio pool configure callback: count a new connection in the connectionsOpened metric.
+
+    Parameters:
+        conn (```psycopg.AsyncConnection```): The new connection.
+    """
+    metrics.increment("connectionsOpened")
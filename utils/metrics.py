@@ -0,0 +1,224 @@
+import bisect
+import os
+import threading
+from typing import Any, ClassVar, Dict, List
+
+
+class Histogram:
+    """
+    Latency histogram with fixed cumulative buckets, in the shape Prometheus expects.
+
+    Attributes:
+        (```class```) defaultBounds (```tuple```[```float```, ...]): Default bucket upper bounds in seconds, from 100 microseconds to 10 seconds.
+        bounds (```tuple```[```float```, ...]): Bucket upper bounds in seconds, ascending.
+        counts (```List```[```int```]): Number of observations in each bucket (not cumulative), with a last bucket for observations above every bound.
+        total (```float```): Sum of all observations in seconds.
+        count (```int```): Number of observations.
+    """
+
+    defaultBounds: ClassVar[tuple[float, ...]] = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, bounds: tuple[float, ...] | None = None) -> None:
+        """
+        Constructor for Histogram class.
+
+        Parameters:
+            bounds (```tuple```[```float```, ...] | None): Bucket upper bounds in seconds, ascending. Default is Histogram.defaultBounds.
+        """
+        self.bounds: tuple[float, ...] = Histogram.defaultBounds if bounds is None else bounds
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.total: float = 0.0
+        self.count: int = 0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record one observation. Not thread-safe on its own; Metrics holds its lock while observing.
+
+        Parameters:
+            seconds (```float```): Observed latency in seconds.
+        """
+        self.counts[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile as the upper bound of the bucket it falls in.
+
+        Parameters:
+            q (```float```): Quantile between 0 and 1, such as 0.99.
+
+        Returns:
+            (```float```): Upper bound in seconds of the bucket holding the quantile, inf if it is above every bound, or 0 if there are no observations.
+        """
+        if self.count == 0:
+            return 0.0
+        rank: float = q * self.count
+        seen: int = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+class Metrics:
+    """
+    In-process metrics of the database layer: latency histogram, rows and errors of every named statement, and counters of connection events.
+    StatementRegistry records every statement it runs here and utils.connectionUtil records connections opened, closed, borrowed from and returned to the pools.
+    Read the numbers with snapshot() or as Prometheus text with toPrometheus().
+
+    Attributes:
+        (```class```) prefix (```str```): Prefix of every Prometheus metric name.
+        enabled (```bool```): Whether anything is recorded. Turn off to measure the overhead of recording.
+        latencies (```Dict```[```str```, ```Histogram```]): Latency histogram by statement name.
+        rows (```Dict```[```str```, ```int```]): Rows returned or affected by statement name.
+        errors (```Dict```[```str```, ```int```]): Failed runs by statement name.
+        counters (```Dict```[```str```, ```int```]): Connection event counts: connectionsOpened, connectionsClosed, connectionsBorrowed and connectionsReturned.
+    """
+
+    prefix: ClassVar[str] = "medbot"
+
+    def __init__(self) -> None:
+        """
+        Constructor for Metrics class. Starts with nothing recorded.
+        """
+        self.enabled: bool = True
+        self.latencies: Dict[str, Histogram] = {}
+        self.rows: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {"connectionsOpened": 0, "connectionsClosed": 0, "connectionsBorrowed": 0, "connectionsReturned": 0}
+        self.__lock: threading.Lock = threading.Lock()
+
+    def observeStatement(self, name: str, seconds: float, rows: int) -> None:
+        """
+        Record a successful run of a statement.
+
+        Parameters:
+            name (```str```): Statement name.
+            seconds (```float```): Time the statement took.
+            rows (```int```): Rows returned or affected, negative if the driver does not know.
+        """
+        if not self.enabled:
+            return
+        with self.__lock:
+            histogram: Histogram | None = self.latencies.get(name)
+            if histogram is None:
+                histogram = self.latencies[name] = Histogram()
+            histogram.observe(seconds)
+            self.rows[name] = self.rows.get(name, 0) + max(rows, 0)
+
+    def recordError(self, name: str) -> None:
+        """
+        Record a failed run of a statement.
+
+        Parameters:
+            name (```str```): Statement name.
+        """
+        if not self.enabled:
+            return
+        with self.__lock:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def increment(self, counter: str) -> None:
+        """
+        Add one to a connection event counter.
+
+        Parameters:
+            counter (```str```): Counter name, one of the keys of counters.
+        """
+        if not self.enabled:
+            return
+        with self.__lock:
+            self.counters[counter] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a copy of everything recorded.
+
+        Returns:
+            (```Dict```[```str```, ```Any```]): counters, and statements mapping each statement name to its calls, errors, rows, totalSeconds, meanSeconds and p50Seconds/p99Seconds (bucket upper bounds).
+        """
+        with self.__lock:
+            statements: Dict[str, Dict[str, Any]] = {}
+            for name in sorted(set(self.latencies) | set(self.errors)):
+                histogram: Histogram = self.latencies.get(name, Histogram())
+                statements[name] = {
+                    "calls": histogram.count,
+                    "errors": self.errors.get(name, 0),
+                    "rows": self.rows.get(name, 0),
+                    "totalSeconds": histogram.total,
+                    "meanSeconds": histogram.total / histogram.count if histogram.count > 0 else 0.0,
+                    "p50Seconds": histogram.quantile(0.5),
+                    "p99Seconds": histogram.quantile(0.99),
+                }
+            return {"counters": dict(self.counters), "statements": statements}
+
+    def reset(self) -> None:
+        """
+        Forget everything recorded.
+        """
+        with self.__lock:
+            self.latencies.clear()
+            self.rows.clear()
+            self.errors.clear()
+            for counter in self.counters:
+                self.counters[counter] = 0
+
+    def toPrometheus(self) -> str:
+        """
+        Render everything recorded in the Prometheus text exposition format.
+
+        Returns:
+            (```str```): Metrics text, ready to be served on a /metrics endpoint or written to a node exporter textfile.
+        """
+        lines: List[str] = []
+        with self.__lock:
+            for counter, metric, description in (
+                ("connectionsOpened", "connections_opened", "Database connections opened by the pools."),
+                ("connectionsClosed", "connections_closed", "Database connections closed by the pools."),
+                ("connectionsBorrowed", "connections_borrowed", "Connections borrowed from the pools."),
+                ("connectionsReturned", "connections_returned", "Connections returned to the pools."),
+            ):
+                lines.append(f"# HELP {self.prefix}_{metric}_total {description}")
+                lines.append(f"# TYPE {self.prefix}_{metric}_total counter")
+                lines.append(f"{self.prefix}_{metric}_total {self.counters[counter]}")
+
+            histogramName: str = f"{self.prefix}_statement_duration_seconds"
+            lines.append(f"# HELP {histogramName} Time taken by each named DAO statement.")
+            lines.append(f"# TYPE {histogramName} histogram")
+            for name in sorted(self.latencies):
+                histogram: Histogram = self.latencies[name]
+                cumulative: int = 0
+                for bound, count in zip(histogram.bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{histogramName}_bucket{{statement="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{histogramName}_bucket{{statement="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{histogramName}_sum{{statement="{name}"}} {histogram.total}')
+                lines.append(f'{histogramName}_count{{statement="{name}"}} {histogram.count}')
+
+            lines.append(f"# HELP {self.prefix}_statement_rows_total Rows returned or affected by each named DAO statement.")
+            lines.append(f"# TYPE {self.prefix}_statement_rows_total counter")
+            for name in sorted(self.rows):
+                lines.append(f'{self.prefix}_statement_rows_total{{statement="{name}"}} {self.rows[name]}')
+
+            lines.append(f"# HELP {self.prefix}_statement_errors_total Failed runs of each named DAO statement.")
+            lines.append(f"# TYPE {self.prefix}_statement_errors_total counter")
+            for name in sorted(self.errors):
+                lines.append(f'{self.prefix}_statement_errors_total{{statement="{name}"}} {self.errors[name]}')
+        return "\n".join(lines) + "\n"
+
+    def writePrometheus(self, path: str) -> None:
+        """
+        Write toPrometheus() to a file, replacing it in one step so a reader never sees a partial file (e.g. for the node exporter textfile collector).
+
+        Parameters:
+            path (```str```): File to write.
+        """
+        temporaryPath: str = path + ".tmp"
+        with open(temporaryPath, "w", encoding="utf-8") as file:
+            file.write(self.toPrometheus())
+        os.replace(temporaryPath, path)
+
+
+metrics: Metrics = Metrics()